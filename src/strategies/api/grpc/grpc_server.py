@@ -1,12 +1,16 @@
+import json
 import grpc
 from concurrent import futures
 from loguru import logger
 from strategies.api.grpc import strategies_pb2, strategies_pb2_grpc
+from strategies.schemas.strategy_schema import StrategyValidationRequest, SymbolFilter, SymbolScope
+from strategies.core.data.symbol_universe import UnknownUniverseError
 
 
 class StrategyServiceGRPC(strategies_pb2_grpc.StrategyServiceServicer):
-    def __init__(self, strategy_service):
+    def __init__(self, strategy_service, strategy_pipeline=None):
         self.strategy_service = strategy_service
+        self.strategy_pipeline = strategy_pipeline
 
     def GetStrategies(self, request, context):
         logger.info("gRPC: GetStrategies is called")
@@ -20,10 +24,39 @@ class StrategyServiceGRPC(strategies_pb2_grpc.StrategyServiceServicer):
         message = f"Returns {len(symbols)} symbols for strategy '{request.strategy}' and '{request.interval}"
         return strategies_pb2.SymbolsResponse(message = message, symbols = symbols)
 
-def serve_grpc(strategy_service, host, port):
+    def StreamPipeline(self, request, context):
+        logger.info(f"gRPC: StreamPipeline is called with {len(request.strategies)} strategies")
+        if self.strategy_pipeline is None:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "No strategy pipeline is configured")
+        try:
+            strategies = [StrategyValidationRequest(strategy = step.strategy, interval = step.interval,
+                                                    params = json.loads(step.params_json or "{}"))
+                          for step in request.strategies]
+            filters = [SymbolFilter(**{field.name: value for field, value in flt.ListFields()})
+                       for flt in request.filters]
+            scope = None
+            if request.HasField("scope"):
+                # unset proto3 fields read as empty, the same as not given
+                scope = SymbolScope(symbols = list(request.scope.symbols) or None,
+                                    universe = request.scope.universe or None, glob = request.scope.glob or None)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        try:
+            records = self.strategy_pipeline.stream_pipeline(strategies, filters, scope)
+        except UnknownUniverseError as e:
+            context.abort(grpc.StatusCode.NOT_FOUND, e.args[0])
+        except FileNotFoundError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Universe file not found: {e.filename}")
+        for record in records:
+            if "symbol" in record:
+                yield strategies_pb2.PipelineEvent(symbol = record["symbol"])
+            else:
+                yield strategies_pb2.PipelineEvent(summary = strategies_pb2.PipelineSummary(**record["summary"]))
+
+def serve_grpc(strategy_service, host, port, strategy_pipeline=None):
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
     strategies_pb2_grpc.add_StrategyServiceServicer_to_server(
-        StrategyServiceGRPC(strategy_service), server
+        StrategyServiceGRPC(strategy_service, strategy_pipeline), server
     )
     server.add_insecure_port(f"{host}:{port}")
     logger.info(f"gRPC server listening on {host}:{port}")
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$strategies/api/grpc/strategies.proto\x12\x12strategies.api.grc\"\x07\n\x05\x45mpty\"@\n\x1aStrategyAndIntervalRequest\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x10\n\x08interval\x18\x02 \x01(\t\"9\n\x12StrategiesResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x12\n\nstrategies\x18\x02 \x03(\t\"3\n\x0fSymbolsResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t2\xde\x01\n\x0fStrategyService\x12R\n\rGetStrategies\x12\x19.strategies.api.grc.Empty\x1a&.strategies.api.grc.StrategiesResponse\x12w\n GetSymbolsForStrategyAndInterval\x12..strategies.api.grc.StrategyAndIntervalRequest\x1a#.strategies.api.grc.SymbolsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$strategies/api/grpc/strategies.proto\x12\x12strategies.api.grc\"\x07\n\x05\x45mpty\"@\n\x1aStrategyAndIntervalRequest\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x10\n\x08interval\x18\x02 \x01(\t\"9\n\x12StrategiesResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x12\n\nstrategies\x18\x02 \x03(\t\"3\n\x0fSymbolsResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t\"G\n\x0cPipelineStep\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x10\n\x08interval\x18\x02 \x01(\t\x12\x13\n\x0bparams_json\x18\x03 \x01(\t\"\x8c\x02\n\x0cSymbolFilter\x12\x10\n\x08interval\x18\x01 \x01(\t\x12\x15\n\x08min_bars\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x1b\n\x0emin_avg_volume\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x1b\n\x0emin_last_close\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x1b\n\x0emax_last_close\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x1f\n\x12min_last_timestamp\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x0b\n\t_min_barsB\x11\n\x0f_min_avg_volumeB\x11\n\x0f_min_last_closeB\x11\n\x0f_max_last_closeB\x15\n\x13_min_last_timestamp\">\n\x0bSymbolScope\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x10\n\x08universe\x18\x02 \x01(\t\x12\x0c\n\x04glob\x18\x03 \x01(\t\"\xaa\x01\n\x0fPipelineRequest\x12\x34\n\nstrategies\x18\x01 \x03(\x0b\x32 .strategies.api.grc.PipelineStep\x12\x31\n\x07\x66ilters\x18\x02 \x03(\x0b\x32 .strategies.api.grc.SymbolFilter\x12.\n\x05scope\x18\x03 \x01(\x0b\x32\x1f.strategies.api.grc.SymbolScope\"\\\n\x0fPipelineSummary\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07matches\x18\x02 \x01(\x05\x12\x17\n\x0f\x65lapsed_seconds\x18\x03 \x01(\x01\x12\x0e\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08\"b\n\rPipelineEvent\x12\x10\n\x06symbol\x18\x01 \x01(\tH\x00\x12\x36\n\x07summary\x18\x02 \x01(\x0b\x32#.strategies.api.grc.PipelineSummaryH\x00\x42\x07\n\x05\x65vent2\xba\x02\n\x0fStrategyService\x12R\n\rGetStrategies\x12\x19.strategies.api.grc.Empty\x1a&.strategies.api.grc.StrategiesResponse\x12w\n GetSymbolsForStrategyAndInterval\x12..strategies.api.grc.StrategyAndIntervalRequest\x1a#.strategies.api.grc.SymbolsResponse\x12Z\n\x0eStreamPipeline\x12#.strategies.api.grc.PipelineRequest\x1a!.strategies.api.grc.PipelineEvent0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -39,6 +39,18 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_STRATEGIESRESPONSE']._serialized_end=192
   _globals['_SYMBOLSRESPONSE']._serialized_start=194
   _globals['_SYMBOLSRESPONSE']._serialized_end=245
-  _globals['_STRATEGYSERVICE']._serialized_start=248
-  _globals['_STRATEGYSERVICE']._serialized_end=470
+  _globals['_PIPELINESTEP']._serialized_start=247
+  _globals['_PIPELINESTEP']._serialized_end=318
+  _globals['_SYMBOLFILTER']._serialized_start=321
+  _globals['_SYMBOLFILTER']._serialized_end=589
+  _globals['_SYMBOLSCOPE']._serialized_start=591
+  _globals['_SYMBOLSCOPE']._serialized_end=653
+  _globals['_PIPELINEREQUEST']._serialized_start=656
+  _globals['_PIPELINEREQUEST']._serialized_end=826
+  _globals['_PIPELINESUMMARY']._serialized_start=828
+  _globals['_PIPELINESUMMARY']._serialized_end=920
+  _globals['_PIPELINEEVENT']._serialized_start=922
+  _globals['_PIPELINEEVENT']._serialized_end=1020
+  _globals['_STRATEGYSERVICE']._serialized_start=1023
+  _globals['_STRATEGYSERVICE']._serialized_end=1337
 # @@protoc_insertion_point(module_scope)
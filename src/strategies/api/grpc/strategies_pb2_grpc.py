@@ -44,6 +44,11 @@ class StrategyServiceStub(object):
                 request_serializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.StrategyAndIntervalRequest.SerializeToString,
                 response_deserializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.SymbolsResponse.FromString,
                 _registered_method=True)
+        self.StreamPipeline = channel.unary_stream(
+                '/strategies.api.grc.StrategyService/StreamPipeline',
+                request_serializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineRequest.SerializeToString,
+                response_deserializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineEvent.FromString,
+                _registered_method=True)
 
 
 class StrategyServiceServicer(object):
@@ -61,6 +66,12 @@ class StrategyServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamPipeline(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_StrategyServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -74,6 +85,11 @@ def add_StrategyServiceServicer_to_server(servicer, server):
                     request_deserializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.StrategyAndIntervalRequest.FromString,
                     response_serializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.SymbolsResponse.SerializeToString,
             ),
+            'StreamPipeline': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamPipeline,
+                    request_deserializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineRequest.FromString,
+                    response_serializer=strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineEvent.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'strategies.api.grc.StrategyService', rpc_method_handlers)
@@ -138,3 +154,30 @@ class StrategyService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamPipeline(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/strategies.api.grc.StrategyService/StreamPipeline',
+            strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineRequest.SerializeToString,
+            strategies_dot_api_dot_grpc_dot_strategies__pb2.PipelineEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,9 +1,25 @@
-from fastapi import FastAPI
+import json
+from contextlib import contextmanager
+from typing import List, Optional
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from strategies.schemas.strategy_schema import StrategiesResponse, SymbolsResponse, PatternsResponse, StrategyPipelineRequest
+from strategies.schemas.strategy_schema import StrategiesResponse, SymbolsResponse, PatternsResponse, StrategyPipelineRequest, StoreResponse, CacheStatsResponse, InvalidateResponse, StandingPipelineRequest, StandingPipelineResponse, JobStatusResponse, SymbolScope
+from strategies.core.data.symbol_universe import UnknownUniverseError
+from strategies.core.pipeline_jobs import JobQueueFullError
 from strategies.schemas.downsampling_schema import DownsamplingResponse
 from loguru import logger
 
+@contextmanager
+def scope_errors():
+    """Answer a request whose SymbolScope cannot be resolved with 404 (unknown universe) or 422 (missing universe file)."""
+    try:
+        yield
+    except UnknownUniverseError as e:
+        raise HTTPException(status_code = 404, detail = e.args[0])
+    except FileNotFoundError as e:
+        raise HTTPException(status_code = 422, detail = f"Universe file not found: {e.filename}")
+
 def create_app(strategy_service, downsampling_service, candlestick_patterns_service, strategy_pipeline):
     app = FastAPI(title="Strategies Service", version="1.0")
 
@@ -37,9 +53,13 @@ def create_app(strategy_service, downsampling_service, candlestick_patterns_serv
         return DownsamplingResponse(message = message)
 
     @app.get("/candlestick/{group}/{subgroup}/{pattern}/{interval}/{period}", response_model = SymbolsResponse)
-    def get_symbols_for_pattern_and_interval(group: str, subgroup: str, pattern: str, interval: str, period: int):
+    def get_symbols_for_pattern_and_interval(group: str, subgroup: str, pattern: str, interval: str, period: int,
+                                             symbols: Optional[List[str]] = Query(None), universe: Optional[str] = None,
+                                             glob: Optional[str] = None):
         logger.info(f"REST: get_symbols_for_pattern_and_interval is called with group:{group}, subgroup:{subgroup}, pattern:{pattern}, interval:{interval} and period:{period}")
-        symbols = candlestick_patterns_service.get_symbols_for_pattern_and_interval(group, subgroup, pattern, interval, period)
+        scope = SymbolScope(symbols = symbols, universe = universe, glob = glob) if (symbols or universe or glob) else None
+        with scope_errors():
+            symbols = candlestick_patterns_service.get_symbols_for_pattern_and_interval(group, subgroup, pattern, interval, period, scope)
         message = f"Returns {len(symbols)} symbols for group:{group}, subgroup:{subgroup}, pattern:{pattern}, interval:{interval} and period:{period}"
         return SymbolsResponse(message = message, symbols = symbols)
 
@@ -53,7 +73,86 @@ def create_app(strategy_service, downsampling_service, candlestick_patterns_serv
     @app.post("/pipeline/run", response_model = SymbolsResponse)
     def run_pipeline(request: StrategyPipelineRequest):
         logger.info(f"REST: run_pipeline is called with strategies:{request.strategies}")
-        symbols = strategy_pipeline.run_pipeline(request.strategies)
+        with scope_errors():
+            symbols = strategy_pipeline.run_pipeline(request.strategies, request.filters, request.scope)
         message = f"Returns {len(symbols)} symbols for strategies:{request.strategies}"
         return SymbolsResponse(message = message, symbols = symbols)
+
+    @app.post("/pipeline/stream")
+    def stream_pipeline(request: StrategyPipelineRequest):
+        """Newline-delimited JSON: {"symbol": ...} per match as soon as it passes, then one {"summary": {...}}."""
+        logger.info(f"REST: stream_pipeline is called with strategies:{request.strategies}")
+        # resolved before the response starts, so a bad scope still gets its status code
+        with scope_errors():
+            records = strategy_pipeline.stream_pipeline(request.strategies, request.filters, request.scope)
+        return StreamingResponse((json.dumps(record) + "\n" for record in records), media_type = "application/x-ndjson")
+
+    @app.post("/pipeline/standing", response_model = StandingPipelineResponse)
+    def run_standing_pipeline(request: StandingPipelineRequest):
+        logger.info(f"REST: run_standing_pipeline is called with strategies:{request.strategies} and delta:{request.delta}")
+        with scope_errors():
+            result = strategy_pipeline.run_standing(request.strategies, request.filters, request.scope)
+        symbols = [] if request.delta else result.symbols
+        message = f"Returns {len(symbols)} symbols, {len(result.added)} added and {len(result.removed)} removed for strategies:{request.strategies}"
+        return StandingPipelineResponse(message = message, symbols = symbols, added = result.added,
+                                        removed = result.removed, evaluated = result.evaluated)
+
+    @app.post("/pipeline/jobs", response_model = JobStatusResponse, status_code = 202)
+    def submit_pipeline_job(request: StrategyPipelineRequest):
+        logger.info(f"REST: submit_pipeline_job is called with strategies:{request.strategies}")
+        try:
+            with scope_errors():
+                job = strategy_pipeline.submit_job(request.strategies, request.filters, request.scope)
+        except JobQueueFullError as e:
+            raise HTTPException(status_code = 429, detail = str(e))
+        return JobStatusResponse(**job.status())
+
+    @app.get("/pipeline/jobs/{job_id}", response_model = JobStatusResponse)
+    def get_pipeline_job(job_id: str):
+        logger.info(f"REST: get_pipeline_job is called with job_id:{job_id}")
+        try:
+            job = strategy_pipeline.job(job_id)
+        except KeyError:
+            raise HTTPException(status_code = 404, detail = f"Unknown job '{job_id}'")
+        return JobStatusResponse(**job.status())
+
+    @app.get("/pipeline/jobs/{job_id}/result", response_model = SymbolsResponse)
+    def get_pipeline_job_result(job_id: str):
+        logger.info(f"REST: get_pipeline_job_result is called with job_id:{job_id}")
+        try:
+            job = strategy_pipeline.job(job_id)
+        except KeyError:
+            raise HTTPException(status_code = 404, detail = f"Unknown job '{job_id}'")
+        symbols = job.result()
+        if symbols is None:
+            raise HTTPException(status_code = 409, detail = f"Job '{job_id}' is {job.state}")
+        message = f"Returns {len(symbols)} symbols for job '{job_id}'"
+        return SymbolsResponse(message = message, symbols = symbols)
+
+    @app.delete("/pipeline/jobs/{job_id}", response_model = JobStatusResponse)
+    def cancel_pipeline_job(job_id: str):
+        logger.info(f"REST: cancel_pipeline_job is called with job_id:{job_id}")
+        try:
+            job = strategy_pipeline.cancel_job(job_id)
+        except KeyError:
+            raise HTTPException(status_code = 404, detail = f"Unknown job '{job_id}'")
+        return JobStatusResponse(**job.status())
+
+    @app.post("/pipeline/store/{interval}", response_model = StoreResponse)
+    def build_store(interval: str):
+        logger.info(f"REST: build_store is called with interval:{interval}")
+        message = strategy_pipeline.build_store(interval)
+        return StoreResponse(message = message)
+
+    @app.delete("/pipeline/results", response_model = InvalidateResponse)
+    def invalidate_results(interval: Optional[str] = None):
+        logger.info(f"REST: invalidate_results is called with interval:{interval}")
+        dropped = strategy_pipeline.invalidate_results(interval)
+        message = f"Dropped {dropped} cached results for interval:{interval or 'all'}"
+        return InvalidateResponse(message = message, dropped = dropped)
+
+    @app.get("/pipeline/cache", response_model = CacheStatsResponse)
+    def get_cache_stats():
+        logger.info("REST: get_cache_stats is called")
+        return CacheStatsResponse(**strategy_pipeline.cache_stats())
     return app
@@ -1,53 +1,73 @@
 import os
-from typing import List
+from typing import List, Optional
 import numpy as np
-import pandas as pd
 import talib
 from loguru import logger
 from strategies.constants.candlestick_patterns import get_patterns
+from strategies.core.data.bulk_loader import BulkLoader
+from strategies.core.data.ohlcv_store import OhlcvStore
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.data.symbol_universe import SymbolUniverse
+from strategies.core.strategies.pattern_index import PatternIndex
+from strategies.core.strategies.pattern_matrix import PatternMatrix
 from strategies.utils.config_loader import load_config
 
+def _compute_pattern(df, pattern: str):
+    # Get the function dynamically
+    func = getattr(talib, pattern.upper())
+    return func(df["Open"], df["High"], df["Low"], df["Close"])
+
 class CandlestickPatternsService:
 
     def __init__(self):
         self.directory = load_config().get("data").get("directory")
     
-    def get_symbols_for_pattern_and_interval(self, group: str, subgroup: str, pattern: str, interval: str, period: int) -> List[str]:
+    def get_symbols_for_pattern_and_interval(self, group: str, subgroup: str, pattern: str, interval: str, period: int,
+                                             scope=None) -> List[str]:
+        """Symbols of the interval folder, or of its symbols within scope (see SymbolUniverse), with a pattern hit in their last period bars."""
         patterns = get_patterns(group, subgroup, pattern)
         if not patterns:
             raise KeyError(f"No pattern available for group:'{group}', subgroup:'{subgroup}', and pattern:'{pattern}'")
-        required_cols = ["Open", "High", "Low", "Close"]
         self.folder_path = os.path.join(self.directory, interval)
-        symbols = []
-        for file_name in os.listdir(self.folder_path):
-            # Select only files with format "<interval>-<symbol>.csv"
-            if file_name.startswith(f"{interval}-") and file_name.endswith(".csv"):
-                full_file_name = os.path.join(self.folder_path, file_name)
-                if not os.path.isfile(full_file_name):
-                    continue
-                try:
-                    df = pd.read_csv(full_file_name)
-                    if df.empty:
-                        continue                    
-                    if not all(col in df.columns for col in required_cols):
-                        continue
-                    
-                    for ptrn in patterns:        
-                        # Get the function dynamically
-                        func = getattr(talib, ptrn.upper())
-                        result = func(df["Open"], df["High"], df["Low"], df["Close"])
-                        if len(result) >= period:
-                            if ((group == "bullish" and np.any(result[-period:] > 0)) or 
-                                (group == "bearish" and np.any(result[-period:] < 0)) or 
-                                ((group == "neutral" or group == "all") and np.any(result[-period:] != 0))):
-                                # Extract symbol from filename: "<interval>-<symbol>.csv"
-                                symbol = file_name.split("-")[1].replace(".csv", "")
-                                symbols.append(symbol)
-                except Exception as e:
-                    logger.warning(f"Skipping {file_name}: {e}")
+        universe = None
+        if SymbolUniverse.is_scoped(scope):
+            universe = SymbolUniverse.resolve(SymbolCatalog.get(self.folder_path, interval).symbols(), scope)
+        index = PatternIndex.get(self.folder_path, interval)
+        if period <= index.recent_bars:
+            symbols = index.symbols(patterns, group, period, _compute_pattern, universe)
+        else:
+            symbols = self._scan_symbols(patterns, group, interval, period, universe)
         logger.info(f"Found {len(symbols)} symbols for group:'{group}', subgroup:'{subgroup}', pattern:'{pattern}', interval:'{interval}', and period:'{period}'")
         return symbols
     
+    def _scan_symbols(self, patterns: List[str], group: str, interval: str, period: int,
+                      universe: Optional[List[str]] = None) -> List[str]:
+        # periods longer than the pattern index keeps: stream the folder so only the prefetched frames are held
+        required_cols = ["Open", "High", "Low", "Close"]
+        symbols = []
+        frames = BulkLoader.stream(self.folder_path, interval, read=OhlcvStore.read_csv,
+                                   on_error=lambda file, e: logger.warning(f"Skipping {os.path.basename(file)}: {e}"),
+                                   symbols=universe)
+        for symbol, df in frames:
+            try:
+                if df.empty:
+                    continue
+                if not all(col in df.columns for col in required_cols):
+                    continue
+
+                signals = PatternMatrix.signals(df, patterns, _compute_pattern)
+                for ptrn in patterns:
+                    result = signals[ptrn]
+                    if len(result) >= period:
+                        if ((group == "bullish" and np.any(result[-period:] > 0)) or
+                            (group == "bearish" and np.any(result[-period:] < 0)) or
+                            ((group == "neutral" or group == "all") and np.any(result[-period:] != 0))):
+                            symbols.append(symbol)
+                            break
+            except Exception as e:
+                logger.warning(f"Skipping {interval}-{symbol}.csv: {e}")
+        return symbols
+
     def get_candlestick_patterns_for_symbol_interval_period(self, symbol: str, interval: str, period: int) -> List[str]:
         matched_patterns = []
         patterns = get_patterns("all", "all", "all")
@@ -61,19 +81,19 @@ class CandlestickPatternsService:
             logger.error(f"For {symbol} and {interval}, its corresponding file does not exist: {full_file_name}")
             return matched_patterns
         try:
-            df = pd.read_csv(full_file_name)
+            df = OhlcvStore.read_csv(full_file_name)
             if df.empty:
                 logger.error(f"For {symbol} and {interval}, its corresponding file is empty: {full_file_name}")
                 return matched_patterns
             if not all(col in df.columns for col in required_cols):
                 logger.error(f"For {symbol} and {interval}, its corresponding file does not have required OHLC columns: {full_file_name}")
                 return matched_patterns        
+            signals = PatternMatrix.signals(df, patterns, _compute_pattern)
             for ptrn in patterns:
-                func = getattr(talib, ptrn.upper())
-                result = func(df["Open"], df["High"], df["Low"], df["Close"])
+                result = signals[ptrn]
                 if len(result) >= period and np.any(result[-period:] != 0):
                     for i in range(-period, 0):
-                        if result.iloc[i] != 0:
+                        if result[i] != 0:
                             rec = df.iloc[i]
                             matched_pattern = f'{rec['Timestamp']} - {ptrn}'
                             matched_patterns.append(matched_pattern)
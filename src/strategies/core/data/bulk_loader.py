@@ -0,0 +1,178 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.utils.config_loader import load_config
+
+class LoadTiming(NamedTuple):
+    """How long one file took to read."""
+    file: str
+    seconds: float
+    rows: int
+
+def _timed_read(read: Callable[[str], pd.DataFrame], file: str) -> Tuple[pd.DataFrame, float]:
+    # module level so it can be sent to process pool workers
+    start = time.perf_counter()
+    df = read(file)
+    return df, time.perf_counter() - start
+
+class BulkLoader:
+    """
+    Reads many CSV files concurrently on a thread or process pool.
+
+    Files are yielded in the order they were given while at most max_in_flight of them
+    are being read or waiting to be consumed, so memory stays bounded no matter how
+    many files there are. Pool type and sizes come from the loader section of config.yaml.
+    """
+
+    EXECUTORS = ("thread", "process")
+    SLOWEST_REPORTED = 3
+    DEFAULT_PREFETCH = 2
+
+    @staticmethod
+    def load(files: Iterable[str], read: Optional[Callable[[str], pd.DataFrame]] = None,
+             workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+             executor: Optional[str] = None, timings: Optional[List[LoadTiming]] = None,
+             on_error: Optional[Callable[[str, Exception], None]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (file, frame) for every file, in order. read defaults to ColumnarCache.read_csv
+        and must be picklable for a process pool. When timings is given, a LoadTiming is
+        appended to it for every file read. A failed read raises, unless on_error is given:
+        then it is called with the file and the error and the file is skipped.
+        """
+        read = read or ColumnarCache.read_csv
+        executor, workers, max_in_flight = BulkLoader.settings(executor, workers, max_in_flight)
+        files = iter(files)
+        pending = deque()
+        with BulkLoader._executor(executor, workers) as pool:
+            def submit_next() -> bool:
+                file = next(files, None)
+                if file is None:
+                    return False
+                pending.append((file, pool.submit(_timed_read, read, file)))
+                return True
+
+            while len(pending) < max_in_flight and submit_next():
+                pass
+            try:
+                while pending:
+                    file, future = pending.popleft()
+                    try:
+                        df, seconds = future.result()
+                    except Exception as e:
+                        if on_error is None:
+                            raise
+                        on_error(file, e)
+                        submit_next()
+                        continue
+                    submit_next()
+                    if timings is not None:
+                        timings.append(LoadTiming(file, seconds, len(df)))
+                    yield file, df
+            finally:
+                # consumer stopped early or a read failed: drop what has not started yet
+                for _, future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def stream(folder_path: str, interval: str, prefetch: Optional[int] = None,
+               read: Optional[Callable[[str], pd.DataFrame]] = None,
+               on_error: Optional[Callable[[str, Exception], None]] = None,
+               symbols: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (symbol, frame) for every "<interval>-<symbol>.csv" file of a folder (as listed by
+        its SymbolCatalog), or only those of the given symbols, ordered by symbol, one at a time.
+        At most prefetch frames are read ahead on background threads (see read_ahead), so memory
+        stays roughly constant whatever the size of the folder.
+        """
+        entries = SymbolCatalog.get(folder_path, interval).entries()
+        if symbols is not None:
+            wanted = set(symbols)
+            entries = [entry for entry in entries if entry.symbol in wanted]
+        symbols = {entry.path: entry.symbol for entry in entries}
+        files = [entry.path for entry in entries]
+        for file, df in BulkLoader.read_ahead(files, prefetch, read, on_error):
+            yield symbols[file], df
+
+    @staticmethod
+    def read_ahead(files: List[str], prefetch: Optional[int] = None,
+                   read: Optional[Callable[[str], pd.DataFrame]] = None,
+                   on_error: Optional[Callable[[str, Exception], None]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (file, frame) for every file, in order, reading at most prefetch files ahead on
+        background threads (loader.prefetch from config.yaml by default, 0 reads each file only
+        when it is asked for).
+        """
+        read = read or ColumnarCache.read_csv
+        if prefetch is None:
+            prefetch = int((load_config().get("loader") or {}).get("prefetch", BulkLoader.DEFAULT_PREFETCH))
+        if prefetch <= 0:
+            return BulkLoader._read_each(files, read, on_error)
+        return BulkLoader.load(files, read=read, workers=prefetch, max_in_flight=prefetch,
+                               executor="thread", on_error=on_error)
+
+    @staticmethod
+    def symbol(file_name: str, interval: Optional[str] = None) -> str:
+        """Symbol of a "<interval>-<symbol>.csv" file name (the bare name if it has no interval prefix)."""
+        stem = file_name[:-4] if file_name.lower().endswith(".csv") else file_name
+        if interval is None:
+            interval = stem.split("-", 1)[0] if "-" in stem else ""
+        prefix = f"{interval}-"
+        return stem[len(prefix):] if interval and stem.startswith(prefix) else stem
+
+    @staticmethod
+    def summarize(timings: List[LoadTiming], elapsed: float) -> Dict[str, object]:
+        """Totals and the slowest files of a load."""
+        slowest = sorted(timings, key=lambda t: t.seconds, reverse=True)[:BulkLoader.SLOWEST_REPORTED]
+        return {
+            "files": len(timings),
+            "rows": sum(t.rows for t in timings),
+            "elapsed": elapsed,
+            "read_seconds": sum(t.seconds for t in timings),
+            "slowest": [(os.path.basename(t.file), t.seconds) for t in slowest],
+        }
+
+    @staticmethod
+    def log_summary(folder_path: str, timings: List[LoadTiming], elapsed: float) -> None:
+        summary = BulkLoader.summarize(timings, elapsed)
+        slowest = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in summary["slowest"])
+        logger.info(
+            f"BulkLoader: Read {summary['files']} files ({summary['rows']} rows) from {folder_path} "
+            f"in {elapsed:.3f}s, {summary['read_seconds']:.3f}s of reads; slowest: {slowest or '-'}"
+        )
+
+    @staticmethod
+    def settings(executor: Optional[str] = None, workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None) -> Tuple[str, int, int]:
+        """Resolve (executor, workers, max_in_flight), falling back to the loader config section."""
+        loader = load_config().get("loader") or {}
+        executor = executor or loader.get("executor") or "thread"
+        if executor not in BulkLoader.EXECUTORS:
+            raise ValueError(f"Unknown loader executor '{executor}', expected one of {BulkLoader.EXECUTORS}")
+        workers = workers or int(loader.get("workers") or 0) or os.cpu_count() or 1
+        max_in_flight = max_in_flight or int(loader.get("max_in_flight") or 0) or 2 * workers
+        return executor, workers, max(max_in_flight, 1)
+
+    @staticmethod
+    def _read_each(files: List[str], read: Callable[[str], pd.DataFrame],
+                   on_error: Optional[Callable[[str, Exception], None]]) -> Iterator[Tuple[str, pd.DataFrame]]:
+        for file in files:
+            try:
+                df = read(file)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(file, e)
+                continue
+            yield file, df
+
+    @staticmethod
+    def _executor(executor: str, workers: int) -> Executor:
+        if executor == "process":
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-loader")
@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+from strategies.utils.config_loader import load_config
+
+class ColumnarCache:
+    """
+    Transparent columnar sidecar for "<interval>-<symbol>.csv" files.
+
+    The first read of a CSV parses it with pandas and stores every column as a raw
+    numpy array in "<folder>/.cache/<file>.npz". Later reads load the arrays back
+    without any text parsing, as long as the CSV's (mtime, size) still matches the
+    version recorded in the sidecar.
+    """
+
+    CACHE_DIR = ".cache"
+    _META_KEY = "__meta__"
+
+    @staticmethod
+    def read_csv(file_path: str) -> pd.DataFrame:
+        """Read a CSV file through its columnar sidecar, rebuilding the sidecar when stale."""
+        try:
+            version = ColumnarCache.file_version(file_path)
+        except OSError:
+            # Nothing to validate a sidecar against, let pandas report the problem
+            return pd.read_csv(file_path)
+        if not ColumnarCache.is_enabled():
+            return pd.read_csv(file_path)
+
+        df = ColumnarCache.load(file_path, version)
+        if df is not None:
+            return df
+        df = pd.read_csv(file_path)
+        ColumnarCache.store(file_path, df, version)
+        return df
+
+    @staticmethod
+    def file_version(file_path: str) -> Tuple[int, int]:
+        """Return the (mtime_ns, size) pair used to validate cached data for a file."""
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def sidecar_path(file_path: str) -> str:
+        folder, file_name = os.path.split(file_path)
+        return os.path.join(folder, ColumnarCache.CACHE_DIR, f"{file_name}.npz")
+
+    @staticmethod
+    def load(file_path: str, version: Tuple[int, int]) -> Optional[pd.DataFrame]:
+        """Load the sidecar of a CSV file, or None if it is missing, unreadable or stale."""
+        try:
+            with np.load(ColumnarCache.sidecar_path(file_path), allow_pickle=False) as npz:
+                meta = json.loads(str(npz[ColumnarCache._META_KEY]))
+                if tuple(meta["version"]) != tuple(version):
+                    return None
+                data = {}
+                for i, (column, dtype) in enumerate(zip(meta["columns"], meta["dtypes"])):
+                    values = npz[f"c{i}"]
+                    if dtype in ("object", "str"):
+                        values = values.astype(object)
+                        if f"c{i}_na" in npz.files:
+                            values[npz[f"c{i}_na"]] = np.nan
+                        data[column] = pd.Series(values, dtype=dtype)
+                    else:
+                        data[column] = pd.Series(values)
+                return pd.DataFrame(data, columns=meta["columns"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"ColumnarCache: Ignoring sidecar of {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def store(file_path: str, df: pd.DataFrame, version: Tuple[int, int]) -> None:
+        """Write the sidecar of a CSV file, never failing the read that triggered it."""
+        try:
+            arrays = {}
+            dtypes = []
+            for i, column in enumerate(df.columns):
+                series = df[column]
+                dtype = str(series.dtype)
+                if dtype in ("object", "str"):
+                    na = series.isna().to_numpy()
+                    arrays[f"c{i}"] = series.to_numpy(dtype=object, na_value="").astype(str)
+                    if na.any():
+                        arrays[f"c{i}_na"] = na
+                elif series.dtype.kind in "biuf":
+                    arrays[f"c{i}"] = series.to_numpy()
+                else:
+                    logger.debug(f"ColumnarCache: Unsupported dtype '{dtype}' of column '{column}' in {file_path}")
+                    return
+                dtypes.append(dtype)
+            meta = {"version": list(version), "columns": [str(c) for c in df.columns], "dtypes": dtypes}
+            arrays[ColumnarCache._META_KEY] = np.array(json.dumps(meta))
+
+            sidecar = ColumnarCache.sidecar_path(file_path)
+            os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+            # write to a temporary file first so concurrent readers never see a partial sidecar
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **arrays)
+                os.replace(tmp_path, sidecar)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"ColumnarCache: Failed to write sidecar for {file_path}: {e}")
+
+    @staticmethod
+    def is_enabled() -> bool:
+        cache = load_config().get("cache") or {}
+        return cache.get("columnar_sidecar", True)
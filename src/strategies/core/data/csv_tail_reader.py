@@ -0,0 +1,35 @@
+import io
+import os
+import pandas as pd
+
+class CsvTailReader:
+    """Reads the last N rows of a CSV file by seeking backwards from its end."""
+
+    BLOCK_SIZE = 64 * 1024
+
+    @staticmethod
+    def read_last(file_path: str, rows: int) -> pd.DataFrame:
+        """Parse the header and only the last `rows` lines of a CSV file (or all of them if it is shorter)."""
+        rows = max(rows, 1)
+        with open(file_path, "rb") as f:
+            header = f.readline()
+            data_start = f.tell()
+            size = os.fstat(f.fileno()).st_size
+
+            # collect blocks from the end until they hold rows + 1 line breaks (or reach the header)
+            position = size
+            buffer = b""
+            while position > data_start:
+                step = min(CsvTailReader.BLOCK_SIZE, position - data_start)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+                if buffer.count(b"\n", 0, len(buffer) - 1) >= rows:
+                    break
+
+        lines = buffer.rstrip(b"\r\n").split(b"\n")
+        if position > data_start:
+            # the first line of the buffer may be cut in the middle
+            lines = lines[1:]
+        lines = [line for line in lines if line.strip()][-rows:]
+        return pd.read_csv(io.BytesIO(header + b"\n".join(lines) + b"\n"))
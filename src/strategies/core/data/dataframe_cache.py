@@ -0,0 +1,210 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.csv_tail_reader import CsvTailReader
+from strategies.core.data.incremental_csv_reader import IncrementalCsvReader, TailState
+from strategies.utils.config_loader import load_config
+
+class _Entry(NamedTuple):
+    key: Tuple[str, str, Tuple[int, int]]
+    df: pd.DataFrame
+    nbytes: int
+    tail: Optional[TailState]
+
+class DataFrameCache:
+    """
+    Process-wide, memory-bounded LRU cache of parsed CSV frames.
+
+    Entries are keyed by (interval, symbol, file version), where the version is the
+    (mtime, size) of the CSV, so a changed file is never served from the cache. The
+    least recently used frames are evicted once the total size of the cached frames
+    exceeds cache.dataframe_cache_bytes from config.yaml.
+
+    When a cached file has only grown, just the appended rows are parsed and added to
+    the cached frame (see IncrementalCsvReader) instead of reloading the whole file, and
+    the change is reported by appended() so results over the old rows can be extended too.
+    Only complete lines are ever cached: a line still being written is left for the next read.
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    # attrs entry holding the (interval, symbol, version, path) a returned frame was read from
+    SOURCE_ATTR = "source"
+
+    _entries: "OrderedDict[str, _Entry]" = OrderedDict()
+    # absolute path -> (key, previous key, previous rows, rows) of a frame extended by appended rows
+    _grown: Dict[str, Tuple[tuple, tuple, int, int]] = {}
+    _lock = threading.Lock()
+    _bytes = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _appends = 0
+
+    @staticmethod
+    def read_csv(file_path: str, last_rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Return the frame of a CSV file from the cache, loading it on a miss or a file change.
+        With last_rows, only the last rows are returned: sliced from a current cached frame,
+        otherwise read by seeking backwards from the end of the file without caching them.
+        """
+        try:
+            version = ColumnarCache.file_version(file_path)
+        except OSError:
+            df = ColumnarCache.read_csv(file_path)
+            return df if last_rows is None else DataFrameCache._last(df, last_rows)
+        key = DataFrameCache.key(file_path, version)
+
+        if last_rows is not None:
+            with DataFrameCache._lock:
+                entry = DataFrameCache._entries.get(file_path)
+                if entry is not None and entry.key == key:
+                    DataFrameCache._entries.move_to_end(file_path)
+                    DataFrameCache._hits += 1
+                    return DataFrameCache.tag(DataFrameCache._last(entry.df, last_rows), file_path, key)
+            return DataFrameCache.tag(CsvTailReader.read_last(file_path, last_rows), file_path, key)
+
+        entry = DataFrameCache.get(file_path, key)
+        if entry is not None and entry.key == key:
+            df = entry.df
+        else:
+            appended = None
+            if entry is not None and entry.tail is not None:
+                appended = IncrementalCsvReader.read_appended(file_path, entry.df, entry.tail)
+            if appended is not None:
+                df, tail = appended
+                with DataFrameCache._lock:
+                    DataFrameCache._appends += 1
+            else:
+                df = ColumnarCache.read_csv(file_path)
+                tail = IncrementalCsvReader.snapshot(file_path, df, version)
+                if tail is None:
+                    # ends with a partial line or changed while parsed: serve it, but never cache a truncated row
+                    if entry is not None:
+                        DataFrameCache.invalidate_path(file_path)
+                    return DataFrameCache.tag(df, file_path, key)
+            DataFrameCache.put(file_path, key, df, tail)
+            if appended is not None:
+                with DataFrameCache._lock:
+                    if file_path in DataFrameCache._entries:
+                        DataFrameCache._grown[os.path.abspath(file_path)] = (key, entry.key, len(entry.df), len(df))
+        # shallow copy so callers assigning columns never alter the cached frame
+        return DataFrameCache.tag(df.copy(deep=False), file_path, key)
+
+    @staticmethod
+    def tag(df: pd.DataFrame, file_path: str, key) -> pd.DataFrame:
+        """Record on a frame the file and (interval, symbol, version) it was read from (see IndicatorCache)."""
+        df.attrs[DataFrameCache.SOURCE_ATTR] = key + (os.path.abspath(file_path),)
+        return df
+
+    @staticmethod
+    def appended(source) -> Optional[Tuple[tuple, int, int]]:
+        """
+        (previous source, previous rows, rows) when the cached frame of a source tag was built
+        by appending rows to the frame of the previous version, whose rows are its first ones;
+        None when it was read in full or is no longer cached.
+        """
+        interval, symbol, version, path = source
+        with DataFrameCache._lock:
+            grown = DataFrameCache._grown.get(path)
+        if grown is None or grown[0] != (interval, symbol, version):
+            return None
+        _, previous_key, previous_rows, rows = grown
+        return previous_key + (path,), previous_rows, rows
+
+    @staticmethod
+    def key(file_path: str, version: Tuple[int, int]) -> Tuple[str, str, Tuple[int, int]]:
+        """Build the (interval, symbol, version) key of a "<interval>/<interval>-<symbol>.csv" path."""
+        folder, file_name = os.path.split(os.path.abspath(file_path))
+        interval = os.path.basename(folder)
+        symbol = file_name[:-4] if file_name.lower().endswith(".csv") else file_name
+        if symbol.startswith(f"{interval}-"):
+            symbol = symbol[len(interval) + 1:]
+        return interval, symbol, version
+
+    @staticmethod
+    def get(file_path: str, key) -> Optional[_Entry]:
+        """
+        Return the entry of a file, counting a hit if it matches key. A stale entry is
+        returned too (and counted as a miss) so its frame can be extended incrementally.
+        """
+        with DataFrameCache._lock:
+            entry = DataFrameCache._entries.get(file_path)
+            if entry is not None and entry.key == key:
+                DataFrameCache._entries.move_to_end(file_path)
+                DataFrameCache._hits += 1
+            else:
+                DataFrameCache._misses += 1
+            return entry
+
+    @staticmethod
+    def put(file_path: str, key, df: pd.DataFrame, tail: Optional[TailState] = None) -> None:
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        max_bytes = DataFrameCache.max_bytes()
+        with DataFrameCache._lock:
+            DataFrameCache._remove(file_path)
+            if nbytes > max_bytes:
+                logger.debug(f"DataFrameCache: {file_path} ({nbytes} bytes) exceeds the cache budget")
+                return
+            DataFrameCache._entries[file_path] = _Entry(key, df, nbytes, tail)
+            DataFrameCache._bytes += nbytes
+            while DataFrameCache._bytes > max_bytes:
+                evicted_path = next(iter(DataFrameCache._entries))
+                DataFrameCache._remove(evicted_path)
+                DataFrameCache._evictions += 1
+
+    @staticmethod
+    def invalidate_path(file_path: str) -> None:
+        with DataFrameCache._lock:
+            DataFrameCache._remove(file_path)
+
+    @staticmethod
+    def invalidate(interval: Optional[str] = None) -> int:
+        """Drop all cached frames, or only those of one interval. Returns the number dropped."""
+        with DataFrameCache._lock:
+            paths = [path for path, entry in DataFrameCache._entries.items()
+                     if interval is None or entry.key[0] == interval]
+            for path in paths:
+                DataFrameCache._remove(path)
+            return len(paths)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with DataFrameCache._lock:
+            return {
+                "hits": DataFrameCache._hits,
+                "misses": DataFrameCache._misses,
+                "evictions": DataFrameCache._evictions,
+                "appends": DataFrameCache._appends,
+                "entries": len(DataFrameCache._entries),
+                "bytes": DataFrameCache._bytes,
+                "max_bytes": DataFrameCache.max_bytes(),
+            }
+
+    @staticmethod
+    def clear() -> None:
+        """Drop all entries and reset the counters."""
+        with DataFrameCache._lock:
+            DataFrameCache._entries.clear()
+            DataFrameCache._grown.clear()
+            DataFrameCache._bytes = 0
+            DataFrameCache._hits = DataFrameCache._misses = DataFrameCache._evictions = DataFrameCache._appends = 0
+
+    @staticmethod
+    def max_bytes() -> int:
+        cache = load_config().get("cache") or {}
+        return int(cache.get("dataframe_cache_bytes", DataFrameCache.DEFAULT_MAX_BYTES))
+
+    @staticmethod
+    def _last(df: pd.DataFrame, rows: int) -> pd.DataFrame:
+        return df.iloc[-max(rows, 1):].reset_index(drop=True)
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        entry = DataFrameCache._entries.pop(file_path, None)
+        DataFrameCache._grown.pop(os.path.abspath(file_path), None)
+        if entry is not None:
+            DataFrameCache._bytes -= entry.nbytes
@@ -0,0 +1,85 @@
+import io
+import os
+import zlib
+from typing import NamedTuple, Optional, Tuple
+import pandas as pd
+from loguru import logger
+
+class TailState(NamedTuple):
+    """What has already been parsed from a CSV file."""
+    offset: int      # byte offset just past the last parsed line
+    rows: int        # number of rows parsed so far
+    header: bytes    # header line the rows were parsed with
+    checksum: int    # crc32 of the bytes right before offset, to detect rewritten rows
+
+class IncrementalCsvReader:
+    """
+    Parses only the rows appended to a CSV file since it was last read.
+
+    The MarketData Hub rewrites files with the existing rows plus new bars at the end,
+    so as long as the header and the last parsed bytes are unchanged only the new tail
+    needs parsing. Anything else (shrunk file, new header, rewritten rows) asks the
+    caller to reload the whole file.
+    """
+
+    VERIFY_BYTES = 64 * 1024
+
+    @staticmethod
+    def snapshot(file_path: str, df: pd.DataFrame, version: Tuple[int, int]) -> Optional[TailState]:
+        """
+        Record the state of a fully parsed file, or None if it cannot be extended later
+        (file changed while it was parsed, or it does not end with a complete line).
+        """
+        try:
+            with open(file_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_mtime_ns, stat.st_size) != tuple(version):
+                    return None
+                header = f.readline()
+                block = IncrementalCsvReader._verified_block(f, len(header), stat.st_size)
+                if block is None:
+                    return None
+        except OSError:
+            return None
+        return TailState(stat.st_size, len(df), header, zlib.crc32(block))
+
+    @staticmethod
+    def read_appended(file_path: str, df: pd.DataFrame, state: TailState) -> Optional[Tuple[pd.DataFrame, TailState]]:
+        """Append the rows written after state.offset to df, or return None if a full reload is needed."""
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < state.offset:
+                    return None
+                if f.readline() != state.header:
+                    return None
+                block = IncrementalCsvReader._verified_block(f, len(state.header), state.offset)
+                if block is None or zlib.crc32(block) != state.checksum:
+                    return None
+                f.seek(state.offset)
+                tail = f.read(size - state.offset)
+
+            # a line still being written is left for the next read
+            end = tail.rfind(b"\n") + 1
+            if end == 0:
+                return df, state
+            tail = tail[:end]
+            appended = pd.read_csv(io.BytesIO(tail), header=None, names=list(df.columns))
+            checksum = zlib.crc32((block + tail)[-IncrementalCsvReader.VERIFY_BYTES:])
+            state = TailState(state.offset + end, state.rows + len(appended), state.header, checksum)
+            if len(appended) == 0:
+                return df, state
+            return pd.concat([df, appended], ignore_index=True), state
+        except Exception as e:
+            logger.debug(f"IncrementalCsvReader: Reloading {file_path} in full: {e}")
+            return None
+
+    @staticmethod
+    def _verified_block(f, data_start: int, offset: int) -> Optional[bytes]:
+        """The (at most VERIFY_BYTES) bytes before offset, None if they do not end with a complete line."""
+        start = max(data_start, offset - IncrementalCsvReader.VERIFY_BYTES)
+        f.seek(start)
+        block = f.read(offset - start)
+        if len(block) != offset - start or (block and not block.endswith(b"\n")):
+            return None
+        return block
@@ -0,0 +1,184 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.dataframe_cache import DataFrameCache
+
+class OhlcvStore:
+    """
+    Packed, memory-mapped OHLCV store of one interval folder.
+
+    Every symbol's bars are concatenated into contiguous float64 Open/High/Low/Close/Volume
+    arrays and an int64 (epoch ns) Timestamp array, written as raw files under
+    "<interval>/.cache/ohlcv/<generation>/". "index.json" maps each symbol to its
+    [start, stop) row range and to the (mtime, size) of the CSV it was built from.
+    The files are opened with np.memmap, so all worker processes share one page-cache
+    copy and per-symbol reads are zero-copy views. Only files whose timestamps are in
+    TIMESTAMP_FORMAT are packed, so frame() can give them back as the same strings.
+    """
+
+    FIELDS = ("Open", "High", "Low", "Close", "Volume")
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+    STORE_DIR = "ohlcv"
+    INDEX_FILE = "index.json"
+
+    _opened: Dict[str, "OhlcvStore"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, folder_path: str, interval: str, generation: str, index: Dict[str, List[int]], columns: Dict[str, np.ndarray], index_version: int):
+        self.folder_path = folder_path
+        self.interval = interval
+        self.generation = generation
+        self.index = index
+        self.columns = columns
+        self.index_version = index_version
+
+    @staticmethod
+    def store_path(folder_path: str) -> str:
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, OhlcvStore.STORE_DIR)
+
+    @staticmethod
+    def build(folder_path: str, interval: str) -> "OhlcvStore":
+        """Pack every "<interval>-<symbol>.csv" file of a folder into a new store generation."""
+        store_path = OhlcvStore.store_path(folder_path)
+        generation = str(time.time_ns())
+        generation_path = os.path.join(store_path, generation)
+        os.makedirs(generation_path, exist_ok=True)
+
+        names = ("Timestamp",) + OhlcvStore.FIELDS
+        outputs = {name: open(os.path.join(generation_path, f"{name}.bin"), "wb") for name in names}
+        index = {}
+        total = 0
+        try:
+            for file_name in sorted(os.listdir(folder_path)):
+                if not (file_name.startswith(f"{interval}-") and file_name.endswith(".csv")):
+                    continue
+                full_file_name = os.path.join(folder_path, file_name)
+                if not os.path.isfile(full_file_name):
+                    continue
+                try:
+                    mtime_ns, size = ColumnarCache.file_version(full_file_name)
+                    df = ColumnarCache.read_csv(full_file_name)
+                    timestamps = pd.to_datetime(df["Timestamp"], format=OhlcvStore.TIMESTAMP_FORMAT)
+                    timestamps = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+                    fields = [df[field].to_numpy(dtype=np.float64) for field in OhlcvStore.FIELDS]
+                except Exception as e:
+                    logger.warning(f"OhlcvStore: Skipping {file_name}: {e}")
+                    continue
+                outputs["Timestamp"].write(np.ascontiguousarray(timestamps).tobytes())
+                for field, values in zip(OhlcvStore.FIELDS, fields):
+                    outputs[field].write(np.ascontiguousarray(values).tobytes())
+                symbol = file_name[len(interval) + 1 : -4]
+                index[symbol] = [total, total + len(df), mtime_ns, size]
+                total += len(df)
+        finally:
+            for output in outputs.values():
+                output.close()
+
+        meta = {"interval": interval, "generation": generation, "rows": total, "symbols": index}
+        fd, tmp_path = tempfile.mkstemp(dir=store_path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(store_path, OhlcvStore.INDEX_FILE))
+
+        # Processes that still map an older generation keep their view until they reopen
+        for name in os.listdir(store_path):
+            if name != generation and os.path.isdir(os.path.join(store_path, name)):
+                shutil.rmtree(os.path.join(store_path, name), ignore_errors=True)
+        logger.info(f"OhlcvStore: Built {interval} store with {len(index)} symbols and {total} bars")
+        return OhlcvStore.open(folder_path, interval)
+
+    @staticmethod
+    def open(folder_path: str, interval: str) -> Optional["OhlcvStore"]:
+        """Map the current store generation of a folder, or return None if there is none."""
+        index_file = os.path.join(OhlcvStore.store_path(folder_path), OhlcvStore.INDEX_FILE)
+        try:
+            index_version = os.stat(index_file).st_mtime_ns
+            with open(index_file, "r") as f:
+                meta = json.load(f)
+            if meta["interval"] != interval:
+                return None
+            generation_path = os.path.join(OhlcvStore.store_path(folder_path), meta["generation"])
+            rows = meta["rows"]
+            columns = {}
+            for name in ("Timestamp",) + OhlcvStore.FIELDS:
+                dtype = np.int64 if name == "Timestamp" else np.float64
+                path = os.path.join(generation_path, f"{name}.bin")
+                columns[name] = np.memmap(path, dtype=dtype, mode="r", shape=(rows,)) if rows else np.empty(0, dtype=dtype)
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"OhlcvStore: No usable {interval} store in {folder_path}: {e}")
+            return None
+        return OhlcvStore(folder_path, interval, meta["generation"], meta["symbols"], columns, index_version)
+
+    @staticmethod
+    def get(folder_path: str, interval: str) -> Optional["OhlcvStore"]:
+        """Return the process-wide opened store of a folder, reopening it after a rebuild."""
+        index_file = os.path.join(OhlcvStore.store_path(folder_path), OhlcvStore.INDEX_FILE)
+        try:
+            index_version = os.stat(index_file).st_mtime_ns
+        except OSError:
+            return None
+        with OhlcvStore._lock:
+            store = OhlcvStore._opened.get(folder_path)
+            if store is None or store.index_version != index_version:
+                store = OhlcvStore.open(folder_path, interval)
+                if store is None:
+                    OhlcvStore._opened.pop(folder_path, None)
+                    return None
+                OhlcvStore._opened[folder_path] = store
+            return store
+
+    @staticmethod
+    def read_csv(file_path: str, last_rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Bars of a "<interval>/<interval>-<symbol>.csv" file: views of the folder's store while it
+        is current for the file, otherwise DataFrameCache.read_csv. Either way the frame carries
+        the same source tag, so indicator and pattern caches treat both alike.
+        """
+        folder_path = os.path.dirname(file_path)
+        interval, symbol, _ = DataFrameCache.key(file_path, None)
+        store = OhlcvStore.get(folder_path, interval)
+        if store is not None and store.is_current(symbol):
+            _, _, mtime_ns, size = store.index[symbol]
+            return DataFrameCache.tag(store.frame(symbol, last_rows), file_path, (interval, symbol, (mtime_ns, size)))
+        return DataFrameCache.read_csv(file_path, last_rows=last_rows)
+
+    def symbols(self) -> List[str]:
+        return list(self.index.keys())
+
+    def is_current(self, symbol: str) -> bool:
+        """True if the symbol is in the store and its CSV has not changed since the build."""
+        entry = self.index.get(symbol)
+        if entry is None:
+            return False
+        full_file_name = os.path.join(self.folder_path, f"{self.interval}-{symbol}.csv")
+        try:
+            return list(ColumnarCache.file_version(full_file_name)) == entry[2:]
+        except OSError:
+            return False
+
+    def arrays(self, symbol: str) -> Dict[str, np.ndarray]:
+        """Zero-copy views of a symbol's Timestamp (int64 ns) and OHLCV (float64) rows."""
+        start, stop = self.index[symbol][:2]
+        return {name: values[start:stop] for name, values in self.columns.items()}
+
+    def frame(self, symbol: str, last_rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        DataFrame over the store views of a symbol, shaped like its CSV: Timestamp holds the
+        same strings as the file, the OHLCV columns are zero-copy float64 views. With
+        last_rows, only the last rows are viewed, and only their timestamps are formatted.
+        """
+        arrays = self.arrays(symbol)
+        if last_rows is not None:
+            arrays = {name: values[-max(last_rows, 1):] for name, values in arrays.items()}
+        timestamps = pd.DatetimeIndex(arrays["Timestamp"].view("datetime64[ns]")).strftime(OhlcvStore.TIMESTAMP_FORMAT)
+        data = {"Symbol": symbol, "Interval": self.interval, "Timestamp": timestamps.to_numpy(dtype=object)}
+        data.update({field: arrays[field] for field in OhlcvStore.FIELDS})
+        return pd.DataFrame(data, copy=False)
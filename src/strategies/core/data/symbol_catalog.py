@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.utils.config_loader import load_config
+
+class CatalogEntry(NamedTuple):
+    """What is known about one "<interval>-<symbol>.csv" file without parsing it."""
+    symbol: str
+    path: str
+    size: int
+    mtime_ns: int
+    rows: int
+    first_timestamp: Optional[str]
+    last_timestamp: Optional[str]
+
+class SymbolCatalog:
+    """
+    Persistent catalog of the symbols of one interval folder.
+
+    For every "<interval>-<symbol>.csv" file it records the path, size, mtime, row count
+    and first/last Timestamp in "<interval>/.cache/catalog.json". A refresh stats the
+    folder's files and only re-reads the ones whose (mtime, size) changed, of a file that
+    grew only the appended bytes, so listing a universe never parses the CSVs. get() refreshes at most once every catalog.refresh_seconds,
+    so the lookups of one request (symbols, data versions, stats, indexes) share a single
+    folder scan and are in-memory reads otherwise.
+    """
+
+    CATALOG_FILE = "catalog.json"
+    BLOCK_SIZE = 1024 * 1024
+    DEFAULT_REFRESH_SECONDS = 2.0
+
+    _catalogs: Dict[str, "SymbolCatalog"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, folder_path: str, interval: str, entries: Dict[str, CatalogEntry]):
+        self.folder_path = folder_path
+        self.interval = interval
+        self._entries = entries
+        self._fingerprint: Optional[str] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get(folder_path: str, interval: str, refresh: bool = False) -> "SymbolCatalog":
+        """
+        Return the catalog of a folder, loading the persisted one on first use. It is refreshed
+        when its last refresh is older than catalog.refresh_seconds, or when refresh is set.
+        """
+        key = os.path.abspath(folder_path)
+        with SymbolCatalog._lock:
+            catalog = SymbolCatalog._catalogs.get(key)
+            if catalog is None or catalog.interval != interval:
+                catalog = SymbolCatalog(folder_path, interval, SymbolCatalog.load(folder_path, interval))
+                SymbolCatalog._catalogs[key] = catalog
+        refreshed_at = catalog._refreshed_at
+        if refresh or refreshed_at is None or time.monotonic() - refreshed_at >= SymbolCatalog.refresh_seconds():
+            catalog.refresh()
+        return catalog
+
+    @staticmethod
+    def refresh_seconds() -> float:
+        section = load_config().get("catalog") or {}
+        return float(section.get("refresh_seconds", SymbolCatalog.DEFAULT_REFRESH_SECONDS))
+
+    @staticmethod
+    def catalog_path(folder_path: str) -> str:
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, SymbolCatalog.CATALOG_FILE)
+
+    @staticmethod
+    def load(folder_path: str, interval: str) -> Dict[str, CatalogEntry]:
+        """Entries of the persisted catalog, empty if there is none or it is unreadable."""
+        try:
+            with open(SymbolCatalog.catalog_path(folder_path), "r") as f:
+                data = json.load(f)
+            if data.get("interval") != interval:
+                return {}
+            return {symbol: CatalogEntry(symbol, os.path.join(folder_path, item["file"]), item["size"], item["mtime_ns"],
+                                         item["rows"], item["first_timestamp"], item["last_timestamp"])
+                    for symbol, item in data.get("symbols", {}).items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def refresh(self) -> int:
+        """Bring the catalog up to date with the folder. Returns the number of entries added, changed or removed."""
+        prefix = f"{self.interval}-"
+        with self._lock:
+            seen = {}
+            changed = 0
+            with os.scandir(self.folder_path) as it:
+                for item in it:
+                    if not (item.name.startswith(prefix) and item.name.endswith(".csv")):
+                        continue
+                    try:
+                        if not item.is_file():
+                            continue
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    symbol = item.name[len(prefix):-4]
+                    entry = self._entries.get(symbol)
+                    if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                        try:
+                            entry = (SymbolCatalog.extend(entry, item.path, stat.st_size, stat.st_mtime_ns)
+                                     or SymbolCatalog.describe(item.path, symbol, stat.st_size, stat.st_mtime_ns))
+                        except OSError as e:
+                            logger.debug(f"SymbolCatalog: Skipping {item.path}: {e}")
+                            continue
+                        changed += 1
+                    seen[symbol] = entry
+            changed += len(self._entries.keys() - seen.keys())
+            self._entries = seen
+            self._refreshed_at = time.monotonic()
+            if changed:
+                self._fingerprint = None
+                self.save()
+            return changed
+
+    def save(self) -> None:
+        """Write the catalog atomically; a read-only data folder only costs the next process a rescan."""
+        data = {
+            "interval": self.interval,
+            "symbols": {symbol: {"file": os.path.basename(entry.path), "size": entry.size, "mtime_ns": entry.mtime_ns,
+                                 "rows": entry.rows, "first_timestamp": entry.first_timestamp,
+                                 "last_timestamp": entry.last_timestamp}
+                        for symbol, entry in self._entries.items()},
+        }
+        catalog_path = SymbolCatalog.catalog_path(self.folder_path)
+        try:
+            os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(catalog_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, catalog_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"SymbolCatalog: Could not write {catalog_path}: {e}")
+
+    def symbols(self) -> List[str]:
+        return sorted(self._entries)
+
+    def entries(self) -> List[CatalogEntry]:
+        """All entries, ordered by symbol."""
+        entries = self._entries
+        return [entries[symbol] for symbol in sorted(entries)]
+
+    def entry(self, symbol: str) -> Optional[CatalogEntry]:
+        return self._entries.get(symbol)
+
+    def fingerprint(self) -> str:
+        """Digest of the (symbol, mtime, size) of every file, changing whenever a file is added, removed or modified."""
+        with self._lock:
+            if self._fingerprint is None:
+                digest = hashlib.blake2b(digest_size=16)
+                for symbol in sorted(self._entries):
+                    entry = self._entries[symbol]
+                    digest.update(f"{symbol}\0{entry.mtime_ns}\0{entry.size}\n".encode())
+                self._fingerprint = digest.hexdigest()
+            return self._fingerprint
+
+    @staticmethod
+    def describe(file_path: str, symbol: str, size: int, mtime_ns: int) -> CatalogEntry:
+        """Count the rows of a CSV file and take its first/last Timestamp from the raw lines."""
+        with open(file_path, "rb") as f:
+            header = f.readline()
+            first_line = f.readline()
+            f.seek(0)
+            lines = 0
+            last_block = b""
+            while True:
+                block = f.read(SymbolCatalog.BLOCK_SIZE)
+                if not block:
+                    break
+                lines += block.count(b"\n")
+                last_block = (last_block + block)[-SymbolCatalog.BLOCK_SIZE:]
+        if last_block and not last_block.endswith(b"\n"):
+            lines += 1  # last line without a line break
+        rows = max(lines - 1, 0) if header.strip() else 0
+        tail = last_block.rstrip(b"\r\n")
+        last_line = tail[tail.rfind(b"\n") + 1:] if rows else b""
+        first_line = first_line.strip() if rows else b""
+
+        columns = [name.strip() for name in header.decode("utf-8", "replace").split(",")]
+        column = columns.index("Timestamp") if "Timestamp" in columns else None
+        return CatalogEntry(symbol, file_path, size, mtime_ns, rows,
+                            SymbolCatalog._field(first_line, column), SymbolCatalog._field(last_line, column))
+
+    @staticmethod
+    def extend(entry: Optional[CatalogEntry], file_path: str, size: int, mtime_ns: int) -> Optional[CatalogEntry]:
+        """
+        The entry of a file that only had lines appended since entry, from the appended bytes
+        alone; None if it needs a full describe (empty, shrunk, replaced or last line incomplete).
+        """
+        if entry is None or size <= entry.size or entry.rows == 0:
+            return None
+        with open(file_path, "rb") as f:
+            header = f.readline()
+            first_line = f.readline()
+            f.seek(entry.size - 1)
+            if f.read(1) != b"\n":
+                return None
+            columns = [name.strip() for name in header.decode("utf-8", "replace").split(",")]
+            column = columns.index("Timestamp") if "Timestamp" in columns else None
+            # a different first row means the file was rewritten, not appended to
+            if SymbolCatalog._field(first_line.strip(), column) != entry.first_timestamp:
+                return None
+            lines = 0
+            last_block = b""
+            while True:
+                block = f.read(min(SymbolCatalog.BLOCK_SIZE, size - f.tell()))
+                if not block:
+                    break
+                lines += block.count(b"\n")
+                last_block = (last_block + block)[-SymbolCatalog.BLOCK_SIZE:]
+        if last_block and not last_block.endswith(b"\n"):
+            lines += 1  # last line without a line break
+        tail = last_block.rstrip(b"\r\n")
+        last_line = tail[tail.rfind(b"\n") + 1:]
+        return CatalogEntry(entry.symbol, file_path, size, mtime_ns, entry.rows + lines,
+                            entry.first_timestamp, SymbolCatalog._field(last_line, column))
+
+    @staticmethod
+    def _field(line: bytes, column: Optional[int]) -> Optional[str]:
+        if column is None or not line:
+            return None
+        fields = line.decode("utf-8", "replace").rstrip("\r").split(",")
+        return fields[column].strip() if column < len(fields) else None
+
+    @staticmethod
+    def clear() -> None:
+        """Forget the catalogs opened by this process (the persisted files are kept)."""
+        with SymbolCatalog._lock:
+            SymbolCatalog._catalogs.clear()
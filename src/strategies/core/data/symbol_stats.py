@@ -0,0 +1,212 @@
+import io
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.csv_tail_reader import CsvTailReader
+from strategies.core.data.incremental_csv_reader import IncrementalCsvReader, TailState
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.utils.config_loader import load_config
+
+class SymbolStats(NamedTuple):
+    """Summary of one symbol's series, enough to rule it out of a scan without loading it."""
+    symbol: str
+    version: Tuple[int, int]
+    bars: int
+    last_timestamp: Optional[str]
+    last_close: Optional[float]
+    avg_volume: Optional[float]
+    min_price: Optional[float]
+    max_price: Optional[float]
+    tail: Optional[Tuple[int, int, str]] = None  # (offset, checksum, header) of the parsed bytes, see TailState
+
+class SymbolStatsTable:
+    """
+    Per-interval table of SymbolStats, like the zone maps of a columnar database.
+
+    Kept in "<interval>/.cache/stats.json" and refreshed from the folder's SymbolCatalog:
+    only symbols whose CSV (mtime, size) changed are read again, and of a file that only
+    grew only the appended rows (see IncrementalCsvReader). avg_volume is the mean Volume
+    of the last stats.volume_bars bars from config.yaml.
+    """
+
+    STATS_FILE = "stats.json"
+    DEFAULT_VOLUME_BARS = 20
+
+    _tables: Dict[str, "SymbolStatsTable"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, folder_path: str, interval: str, volume_bars: int, stats: Dict[str, SymbolStats]):
+        self.folder_path = folder_path
+        self.interval = interval
+        self.volume_bars = volume_bars
+        self._stats = stats
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get(folder_path: str, interval: str, symbols: Optional[Iterable[str]] = None) -> "SymbolStatsTable":
+        """
+        Return the refreshed stats table of a folder, loading the persisted one on first use.
+        With symbols, only their stats are brought up to date (see refresh).
+        """
+        key = os.path.abspath(folder_path)
+        volume_bars = SymbolStatsTable.configured_volume_bars()
+        with SymbolStatsTable._lock:
+            table = SymbolStatsTable._tables.get(key)
+            if table is None or (table.interval, table.volume_bars) != (interval, volume_bars):
+                table = SymbolStatsTable(folder_path, interval, volume_bars,
+                                         SymbolStatsTable.load(folder_path, interval, volume_bars))
+                SymbolStatsTable._tables[key] = table
+        table.refresh(symbols)
+        return table
+
+    @staticmethod
+    def stats_path(folder_path: str) -> str:
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, SymbolStatsTable.STATS_FILE)
+
+    @staticmethod
+    def configured_volume_bars() -> int:
+        stats = load_config().get("stats") or {}
+        return int(stats.get("volume_bars", SymbolStatsTable.DEFAULT_VOLUME_BARS))
+
+    @staticmethod
+    def load(folder_path: str, interval: str, volume_bars: int) -> Dict[str, SymbolStats]:
+        """Stats of the persisted table, empty if there is none, it is unreadable or was built differently."""
+        try:
+            with open(SymbolStatsTable.stats_path(folder_path), "r") as f:
+                data = json.load(f)
+            if (data.get("interval"), data.get("volume_bars")) != (interval, volume_bars):
+                return {}
+            return {symbol: SymbolStats(symbol, tuple(item["version"]), item["bars"], item["last_timestamp"],
+                                        item["last_close"], item["avg_volume"], item["min_price"], item["max_price"],
+                                        tuple(item["tail"]) if item.get("tail") else None)
+                    for symbol, item in data.get("symbols", {}).items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def refresh(self, symbols: Optional[Iterable[str]] = None) -> int:
+        """
+        Recompute the stats of new or changed files and drop removed ones. Returns the number of
+        changes. With symbols, files of other symbols are not read: their stats are kept as they are.
+        """
+        catalog = SymbolCatalog.get(self.folder_path, self.interval)
+        wanted = None if symbols is None else set(symbols)
+        with self._lock:
+            stats = {}
+            changed = 0
+            for entry in catalog.entries():
+                version = (entry.mtime_ns, entry.size)
+                current = self._stats.get(entry.symbol)
+                if wanted is not None and entry.symbol not in wanted:
+                    if current is not None:
+                        stats[entry.symbol] = current
+                    continue
+                if current is None or current.version != version:
+                    try:
+                        current = (SymbolStatsTable.extend(current, entry.path, version, self.volume_bars)
+                                   or SymbolStatsTable.read(entry.symbol, entry.path, version, self.volume_bars))
+                    except Exception as e:
+                        logger.warning(f"SymbolStatsTable: Skipping {entry.path}: {e}")
+                        continue
+                    changed += 1
+                stats[entry.symbol] = current
+            changed += len(self._stats.keys() - stats.keys())
+            self._stats = stats
+            if changed:
+                self.save()
+            return changed
+
+    def save(self) -> None:
+        data = {
+            "interval": self.interval,
+            "volume_bars": self.volume_bars,
+            "symbols": {symbol: {field: getattr(item, field) for field in SymbolStats._fields if field != "symbol"}
+                        for symbol, item in self._stats.items()},
+        }
+        stats_path = SymbolStatsTable.stats_path(self.folder_path)
+        try:
+            os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(stats_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, stats_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"SymbolStatsTable: Could not write {stats_path}: {e}")
+
+    def stats(self, symbol: str) -> Optional[SymbolStats]:
+        return self._stats.get(symbol)
+
+    def symbols(self) -> List[str]:
+        return sorted(self._stats)
+
+    @staticmethod
+    def read(symbol: str, file_path: str, version: Tuple[int, int], volume_bars: int) -> SymbolStats:
+        """Stats of a whole file, with the tail state to extend them from when it grows."""
+        df = ColumnarCache.read_csv(file_path)
+        stats = SymbolStatsTable.compute(symbol, df, version, volume_bars)
+        state = IncrementalCsvReader.snapshot(file_path, df, version)
+        if state is None:
+            return stats
+        return stats._replace(tail=(state.offset, state.checksum, state.header.decode("latin-1")))
+
+    @staticmethod
+    def extend(current: Optional[SymbolStats], file_path: str, version: Tuple[int, int],
+               volume_bars: int) -> Optional[SymbolStats]:
+        """
+        Stats of a file that only had rows appended since current was computed, from those rows
+        alone (and the last volume_bars rows if fewer were appended). None if it needs a full read.
+        """
+        if current is None or current.tail is None:
+            return None
+        offset, checksum, header = current.tail
+        state = TailState(offset, current.bars, header.encode("latin-1"), checksum)
+        columns = pd.read_csv(io.BytesIO(state.header), nrows=0)
+        result = IncrementalCsvReader.read_appended(file_path, columns, state)
+        if result is None:
+            return None
+        appended, state = result
+        tail = (state.offset, state.checksum, header)
+        if appended.empty:
+            return current._replace(version=tuple(version), tail=tail)
+
+        stats = SymbolStatsTable.compute(current.symbol, appended, version, volume_bars)
+        avg_volume = stats.avg_volume
+        if avg_volume is not None and len(appended) < volume_bars:
+            recent = CsvTailReader.read_last(file_path, volume_bars)["Volume"]
+            avg_volume = None if pd.isna(recent.mean()) else float(recent.mean())
+        prices = [(current.min_price, stats.min_price, min), (current.max_price, stats.max_price, max)]
+        min_price, max_price = (pick(old, new) if old is not None and new is not None else new
+                                for old, new, pick in prices)
+        return stats._replace(bars=current.bars + stats.bars, avg_volume=avg_volume,
+                              min_price=min_price, max_price=max_price, tail=tail)
+
+    @staticmethod
+    def compute(symbol: str, df: pd.DataFrame, version: Tuple[int, int], volume_bars: int) -> SymbolStats:
+        """Summarize one series; columns it lacks leave their statistics as None."""
+        def number(value) -> Optional[float]:
+            return None if value is None or pd.isna(value) else float(value)
+
+        if df.empty:
+            return SymbolStats(symbol, tuple(version), 0, None, None, None, None, None)
+        last_timestamp = str(df["Timestamp"].iloc[-1]) if "Timestamp" in df.columns else None
+        last_close = number(df["Close"].iloc[-1]) if "Close" in df.columns else None
+        avg_volume = number(df["Volume"].iloc[-volume_bars:].mean()) if "Volume" in df.columns else None
+        low = "Low" if "Low" in df.columns else "Close"
+        high = "High" if "High" in df.columns else "Close"
+        min_price = number(df[low].min()) if low in df.columns else None
+        max_price = number(df[high].max()) if high in df.columns else None
+        return SymbolStats(symbol, tuple(version), len(df), last_timestamp, last_close, avg_volume, min_price, max_price)
+
+    @staticmethod
+    def clear() -> None:
+        """Forget the tables opened by this process (the persisted files are kept)."""
+        with SymbolStatsTable._lock:
+            SymbolStatsTable._tables.clear()
@@ -0,0 +1,87 @@
+import fnmatch
+import os
+from typing import Iterable, List, Optional
+from strategies.utils.config_loader import load_config
+
+class UnknownUniverseError(KeyError):
+    """Raised by SymbolUniverse.saved for a universe not defined in config.yaml."""
+
+class SymbolUniverse:
+    """
+    Restricts a scan to part of an interval folder.
+
+    A scope (see SymbolScope) narrows the folder's symbols by an explicit list, a named
+    universe saved in the universes section of config.yaml, and a glob on the symbol such as
+    "AA*"; when several are given a symbol must satisfy all of them. A saved universe is a
+    list of symbols, or the path of a text file with one symbol per line ("#" starts a
+    comment), relative to the data directory.
+    """
+
+    @staticmethod
+    def is_scoped(scope) -> bool:
+        return scope is not None and any(getattr(scope, field, None) is not None
+                                         for field in ("symbols", "universe", "glob"))
+
+    @staticmethod
+    def saved(name: str) -> List[str]:
+        """
+        Symbols of a saved universe; raises UnknownUniverseError for an unknown one and
+        FileNotFoundError when its file is missing.
+        """
+        config = load_config()
+        universes = config.get("universes") or {}
+        if name not in universes:
+            raise UnknownUniverseError(f"No saved universe '{name}'")
+        universe = universes[name]
+        if not isinstance(universe, str):
+            return [str(symbol) for symbol in universe or []]
+        path = universe if os.path.isabs(universe) else os.path.join(config.get("data").get("directory"), universe)
+        with open(path, "r") as f:
+            lines = (line.split("#", 1)[0].strip() for line in f)
+            return [line for line in lines if line]
+
+    @staticmethod
+    def resolve(available: Iterable[str], scope=None) -> List[str]:
+        """The available symbols within a scope, in their given order; all of them without one."""
+        symbols = list(available)
+        if not SymbolUniverse.is_scoped(scope):
+            return symbols
+        for allowed in SymbolUniverse._lists(scope):
+            symbols = [symbol for symbol in symbols if symbol in allowed]
+        if scope.glob is not None:
+            symbols = [symbol for symbol in symbols if fnmatch.fnmatchcase(symbol, scope.glob)]
+        return symbols
+
+    @staticmethod
+    def definition(scope) -> Optional[dict]:
+        """The fields set on a scope, symbols sorted, None when unscoped."""
+        if not SymbolUniverse.is_scoped(scope):
+            return None
+        fields = {field: getattr(scope, field) for field in ("symbols", "universe", "glob")
+                  if getattr(scope, field) is not None}
+        if "symbols" in fields:
+            fields["symbols"] = sorted(fields["symbols"])
+        return fields
+
+    @staticmethod
+    def _lists(scope) -> List[set]:
+        lists = []
+        if scope.symbols is not None:
+            lists.append(set(scope.symbols))
+        if scope.universe is not None:
+            lists.append(set(SymbolUniverse.saved(scope.universe)))
+        return lists
+
+    @staticmethod
+    def describe(scope) -> Optional[str]:
+        """Short text of a scope for logs, None when unscoped."""
+        if not SymbolUniverse.is_scoped(scope):
+            return None
+        parts = []
+        if scope.symbols is not None:
+            parts.append(f"{len(scope.symbols)} symbols")
+        if scope.universe is not None:
+            parts.append(f"universe '{scope.universe}'")
+        if scope.glob is not None:
+            parts.append(f"glob '{scope.glob}'")
+        return ", ".join(parts)
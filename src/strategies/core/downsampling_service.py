@@ -17,10 +17,9 @@ class DownsamplingService:
         try:
             now = datetime.now()
             timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
-            dfs = FileService.read_all_csv(input_interval)
-            ds_dfs = [self.downsample(df, output_interval) for df in dfs]
-
-            for ds_df in ds_dfs:
+            # one file in memory at a time (plus the prefetched ones)
+            for df in FileService.iter_all_csv(input_interval):
+                ds_df = self.downsample(df, output_interval)
                 symbol = ds_df.iloc[0]["Symbol"]
                 FileService.write(output_interval, ds_df, f"{output_interval}-{symbol}.csv")
             
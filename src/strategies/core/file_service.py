@@ -1,6 +1,10 @@
 import os
+import time
+from typing import Dict, Iterator, Optional, Tuple
 import pandas as pd
 from loguru import logger
+from strategies.core.data.bulk_loader import BulkLoader
+from strategies.core.data.dataframe_cache import DataFrameCache
 from strategies.utils.config_loader import load_config
 
 class FileService:
@@ -27,7 +31,7 @@ class FileService:
             file_path = os.path.join(directory, filename)            
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File '{file_path}' does not exist")            
-            df = pd.read_csv(file_path)
+            df = DataFrameCache.read_csv(file_path)
             logger.info("Data read successfully from %s", file_path)
             return df
         except Exception as e:
@@ -38,24 +42,78 @@ class FileService:
     def read_all_csv(subdirectory: str) -> list[pd.DataFrame]:
         """
         Read all CSV files in a given subdirectory.
-        Returns a list of pandas DataFrames.
+        Returns a list of pandas DataFrames, ordered by file name.
         """
-        dataframes = []
+        return [df for _, df in FileService.__read_all(subdirectory)]
+
+    @staticmethod
+    def read_all_csv_by_symbol(subdirectory: str, workers: Optional[int] = None,
+                               max_in_flight: Optional[int] = None, executor: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Read all "<subdirectory>-<symbol>.csv" files of a subdirectory in parallel (see BulkLoader).
+        Returns a {symbol: DataFrame} mapping ordered by symbol and logs a per-file timing summary.
+        Raises ValueError when two files name the same symbol (e.g. "1m-AAPL.csv" and "AAPL.csv").
+        """
+        dataframes = {}
+        files = {}
+        for file_path, df in FileService.__read_all(subdirectory, workers, max_in_flight, executor):
+            file_name = os.path.basename(file_path)
+            symbol = BulkLoader.symbol(file_name, subdirectory)
+            if symbol in files:
+                raise ValueError(f"Files '{files[symbol]}' and '{file_name}' in '{subdirectory}' are both for symbol '{symbol}'")
+            files[symbol] = file_name
+            dataframes[symbol] = df
+        return dataframes
+
+    @staticmethod
+    def __read_all(subdirectory: str, workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                   executor: Optional[str] = None) -> list[Tuple[str, pd.DataFrame]]:
+        """(relative path, DataFrame) of every CSV file of a subdirectory, ordered by file name."""
         directory = FileService.__get_directory()
         folder_path = os.path.join(directory, subdirectory)
         try:
             if not os.path.exists(folder_path):
                 raise FileNotFoundError(f"Directory '{folder_path}' does not exist")
-            csv_files = [f for f in os.listdir(folder_path) if f.lower().endswith(".csv")]
-            for csv_file in csv_files:
-                full_path = os.path.join(subdirectory, csv_file)  # relative path for read()
-                df = FileService.read(full_path)
-                dataframes.append(df)
-            return dataframes
+            csv_files = sorted(f for f in os.listdir(folder_path) if f.lower().endswith(".csv"))
+            relative_paths = [os.path.join(subdirectory, csv_file) for csv_file in csv_files]  # relative path for read()
+            timings = []
+            start = time.perf_counter()
+            frames = list(BulkLoader.load(relative_paths, read=FileService.read, workers=workers,
+                                          max_in_flight=max_in_flight, executor=executor, timings=timings))
+            BulkLoader.log_summary(folder_path, timings, time.perf_counter() - start)
+            return frames
         except Exception as e:
             logger.exception("Failed to read all CSV files in '%s': %s", folder_path, e)
             raise
 
+    @staticmethod
+    def iter_csv(subdirectory: str, prefetch: Optional[int] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (symbol, DataFrame) for every "<subdirectory>-<symbol>.csv" file, one at a time and
+        ordered by symbol, reading up to prefetch files ahead (see BulkLoader.stream). Frames are
+        not kept in the in-memory cache, so a folder of any size is read in roughly constant memory.
+        """
+        directory = FileService.__get_directory()
+        folder_path = os.path.join(directory, subdirectory)
+        if not os.path.exists(folder_path):
+            raise FileNotFoundError(f"Directory '{folder_path}' does not exist")
+        yield from BulkLoader.stream(folder_path, subdirectory, prefetch=prefetch)
+
+    @staticmethod
+    def iter_all_csv(subdirectory: str, prefetch: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the DataFrame of every CSV file in a given subdirectory, ordered by file name like
+        read_all_csv (files without the "<subdirectory>-" prefix included), but one at a time and
+        reading up to prefetch files ahead like iter_csv.
+        """
+        directory = FileService.__get_directory()
+        folder_path = os.path.join(directory, subdirectory)
+        if not os.path.exists(folder_path):
+            raise FileNotFoundError(f"Directory '{folder_path}' does not exist")
+        csv_files = sorted(f for f in os.listdir(folder_path) if f.lower().endswith(".csv"))
+        for _, df in BulkLoader.read_ahead([os.path.join(folder_path, f) for f in csv_files], prefetch):
+            yield df
+
     @staticmethod
     def __get_directory() -> str:
         config = load_config()
@@ -0,0 +1,200 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from strategies.utils.config_loader import load_config
+
+class JobCancelledError(Exception):
+    """Raised from PipelineJob.advance once the job is cancelled, to stop its scan."""
+
+class JobQueueFullError(RuntimeError):
+    """Raised by PipelineJobs.submit when jobs.max_queued jobs are already waiting."""
+
+class PipelineJob:
+    """A pipeline run in the background: its state, progress and, once done, its result."""
+
+    QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.state = PipelineJob.QUEUED
+        self.done = 0
+        self.total = 0
+        self.matches: List[str] = []
+        self.error: Optional[str] = None
+        self.cached = False
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def advance(self, symbols: int) -> None:
+        """Count symbols as finished; raises JobCancelledError once the job is cancelled."""
+        if self._cancelled.is_set():
+            raise JobCancelledError(self.id)
+        with self._lock:
+            self.done += symbols
+
+    def add_match(self, symbol: str) -> None:
+        with self._lock:
+            self.matches.append(symbol)
+
+    def finish(self, state: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.finished_at = time.time()
+
+    def result(self) -> Optional[List[str]]:
+        """The matching symbols of a done job, None before."""
+        with self._lock:
+            return list(self.matches) if self.state == PipelineJob.DONE else None
+
+    def status(self) -> dict:
+        """Snapshot of the job's state and progress."""
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                "job_id": self.id,
+                "state": self.state,
+                "done": self.done,
+                "total": self.total,
+                "matches": len(self.matches),
+                "cached": self.cached,
+                "error": self.error,
+                "elapsed_seconds": end - self.started_at if self.started_at is not None else 0.0,
+            }
+
+class PipelineJobs:
+    """
+    Process-wide queue of background pipeline jobs.
+
+    Jobs run on their own bounded thread pool (jobs.workers), never on the threads serving
+    requests. At most jobs.max_queued jobs wait for a worker, further submits are rejected.
+    Finished jobs stay retrievable until jobs.keep_finished newer ones have finished.
+    """
+
+    DEFAULT_WORKERS = 2
+    DEFAULT_MAX_QUEUED = 16
+    DEFAULT_KEEP_FINISHED = 100
+
+    _jobs: "OrderedDict[str, PipelineJob]" = OrderedDict()
+    _executor = None
+    _workers = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def settings() -> Tuple[int, int, int]:
+        """(workers, max_queued, keep_finished) from the jobs config section."""
+        section = load_config().get("jobs") or {}
+        workers = int(section.get("workers", PipelineJobs.DEFAULT_WORKERS))
+        max_queued = int(section.get("max_queued", PipelineJobs.DEFAULT_MAX_QUEUED))
+        keep_finished = int(section.get("keep_finished", PipelineJobs.DEFAULT_KEEP_FINISHED))
+        return max(workers, 1), max(max_queued, 0), max(keep_finished, 0)
+
+    @staticmethod
+    def submit(run: Callable[[PipelineJob], List[str]]) -> PipelineJob:
+        """
+        Queue run(job), which scans reporting progress through job.advance and job.add_match.
+        Raises JobQueueFullError when the queue is full.
+        """
+        workers, max_queued, keep_finished = PipelineJobs.settings()
+        job = PipelineJob()
+        with PipelineJobs._lock:
+            queued = sum(1 for other in PipelineJobs._jobs.values() if other.state == PipelineJob.QUEUED)
+            if queued >= max_queued:
+                raise JobQueueFullError(f"{queued} pipeline jobs are already queued")
+            if PipelineJobs._executor is None or PipelineJobs._workers != workers:
+                if PipelineJobs._executor is not None:
+                    PipelineJobs._executor.shutdown(wait=False)
+                PipelineJobs._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline-job")
+                PipelineJobs._workers = workers
+            PipelineJobs._jobs[job.id] = job
+            PipelineJobs._prune(keep_finished)
+            job.future = PipelineJobs._executor.submit(PipelineJobs._run, job, run)
+        return job
+
+    @staticmethod
+    def _run(job: PipelineJob, run) -> None:
+        with job._lock:
+            if job.state != PipelineJob.QUEUED:
+                return
+            job.state = PipelineJob.RUNNING
+            job.started_at = time.time()
+        try:
+            run(job)
+        except JobCancelledError:
+            job.finish(PipelineJob.CANCELLED)
+            logger.info(f"PipelineJobs: Job {job.id} cancelled after {job.done} of {job.total} symbols")
+        except Exception as e:
+            job.finish(PipelineJob.FAILED, str(e))
+            logger.warning(f"PipelineJobs: Job {job.id} failed: {e}")
+        else:
+            # a cancel arriving after the last symbol still wins, the caller asked for it
+            job.finish(PipelineJob.CANCELLED if job.cancelled else PipelineJob.DONE)
+            logger.info(f"PipelineJobs: Job {job.id} finished with {len(job.matches)} matches")
+
+    @staticmethod
+    def _prune(keep_finished: int) -> None:
+        finished = [key for key, job in PipelineJobs._jobs.items() if job.state in PipelineJob.FINISHED]
+        for key in finished[:max(len(finished) - keep_finished, 0)]:
+            del PipelineJobs._jobs[key]
+
+    @staticmethod
+    def get(job_id: str) -> PipelineJob:
+        """The job with an id; raises KeyError for an unknown or pruned one."""
+        with PipelineJobs._lock:
+            return PipelineJobs._jobs[job_id]
+
+    @staticmethod
+    def cancel(job_id: str) -> PipelineJob:
+        """
+        Cancel a job: a queued one never starts, a running one stops at its next symbol.
+        A finished job is left as it is. Raises KeyError for an unknown job.
+        """
+        job = PipelineJobs.get(job_id)
+        job._cancelled.set()
+        with job._lock:
+            if job.state == PipelineJob.QUEUED:
+                job.state = PipelineJob.CANCELLED
+                job.finished_at = time.time()
+        if job.future is not None:
+            job.future.cancel()
+        return job
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with PipelineJobs._lock:
+            counts = {state: 0 for state in (PipelineJob.QUEUED, PipelineJob.RUNNING) + PipelineJob.FINISHED}
+            for job in PipelineJobs._jobs.values():
+                counts[job.state] += 1
+            return counts
+
+    @staticmethod
+    def shutdown() -> None:
+        """Cancel every unfinished job and stop the workers."""
+        with PipelineJobs._lock:
+            jobs = list(PipelineJobs._jobs.values())
+        for job in jobs:
+            PipelineJobs.cancel(job.id)
+        with PipelineJobs._lock:
+            if PipelineJobs._executor is not None:
+                PipelineJobs._executor.shutdown(wait=False, cancel_futures=True)
+            PipelineJobs._executor = None
+            PipelineJobs._workers = None
+
+    @staticmethod
+    def clear() -> None:
+        PipelineJobs.shutdown()
+        with PipelineJobs._lock:
+            PipelineJobs._jobs.clear()
@@ -0,0 +1,104 @@
+import json
+import threading
+from statistics import median
+from typing import Any, Dict, List, NamedTuple, Optional
+from strategies.utils.config_loader import load_config
+
+class PlannedStep(NamedTuple):
+    """A pipeline step with the estimates it was ordered by."""
+    item: Any
+    cost: Optional[float]        # seconds per symbol, None before the step has run
+    pass_rate: Optional[float]   # share of the evaluated symbols that passed, None before the step has run
+    rank: float
+
+class PipelinePlanner:
+    """
+    Orders the AND-chain of a pipeline by expected work, from runtime statistics of its steps.
+
+    Every step, identified by strategy, interval and params, records the symbols it evaluated,
+    how many passed and the time it took (loading included). A symbol must pass every step, so
+    any order returns the same symbols; for independent steps the least work is done running
+    them by ascending cost / (1 - pass rate). Steps that have not run yet are ranked with the
+    median cost of the known ones and DEFAULT_PASS_RATE, and equal ranks keep the request order.
+    """
+
+    DEFAULT_PASS_RATE = 0.5
+    MAX_SAMPLES = 10000
+
+    _steps: Dict[str, List[float]] = {}   # key -> [evaluated, passed, seconds]
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        pipeline = load_config().get("pipeline") or {}
+        return bool(pipeline.get("planner", True))
+
+    @staticmethod
+    def key(item) -> str:
+        params = json.dumps(item.params or {}, sort_keys=True, default=str)
+        return f"{item.interval}|{item.strategy}|{params}"
+
+    @staticmethod
+    def record(item, evaluated: int, passed: int, seconds: float) -> None:
+        """Add a run of a step over evaluated symbols; past MAX_SAMPLES older runs weigh half."""
+        if evaluated <= 0:
+            return
+        key = PipelinePlanner.key(item)
+        with PipelinePlanner._lock:
+            counts = PipelinePlanner._steps.setdefault(key, [0.0, 0.0, 0.0])
+            counts[0] += evaluated
+            counts[1] += passed
+            counts[2] += seconds
+            if counts[0] > PipelinePlanner.MAX_SAMPLES:
+                PipelinePlanner._steps[key] = [value / 2 for value in counts]
+
+    @staticmethod
+    def estimate(item) -> Optional[tuple]:
+        """(seconds per symbol, pass rate) of a step, None before it has run."""
+        with PipelinePlanner._lock:
+            counts = PipelinePlanner._steps.get(PipelinePlanner.key(item))
+        if counts is None:
+            return None
+        evaluated, passed, seconds = counts
+        return seconds / evaluated, passed / evaluated
+
+    @staticmethod
+    def plan(strategies) -> List[PlannedStep]:
+        """The steps in the order to run them, with the estimates used to order them."""
+        estimates = [PipelinePlanner.estimate(item) for item in strategies]
+        known = [estimate[0] for estimate in estimates if estimate is not None]
+        default_cost = median(known) if known else 1.0
+
+        steps = []
+        for item, estimate in zip(strategies, estimates):
+            cost, pass_rate = estimate if estimate is not None else (None, None)
+            rate = PipelinePlanner.DEFAULT_PASS_RATE if pass_rate is None else pass_rate
+            rank = (default_cost if cost is None else cost) / (1 - rate) if rate < 1 else float("inf")
+            steps.append(PlannedStep(item, cost, pass_rate, rank))
+        if not PipelinePlanner.enabled():
+            return steps
+        return sorted(steps, key=lambda step: step.rank)
+
+    @staticmethod
+    def describe(plan: List[PlannedStep]) -> str:
+        """One line summary of a plan, e.g. "1d is_rsi_oversold (0.12 ms, 5% pass) -> 5min is_failed_bo (new)"."""
+        parts = []
+        for step in plan:
+            name = f"{step.item.interval} {step.item.strategy}"
+            if step.cost is None:
+                parts.append(f"{name} (new)")
+            else:
+                parts.append(f"{name} ({step.cost * 1000:.2f} ms, {step.pass_rate:.0%} pass)")
+        return " -> ".join(parts)
+
+    @staticmethod
+    def stats() -> Dict[str, Dict[str, float]]:
+        """Recorded statistics of every step seen by this process."""
+        with PipelinePlanner._lock:
+            return {key: {"evaluated": evaluated, "passed": passed, "seconds": seconds}
+                    for key, (evaluated, passed, seconds) in PipelinePlanner._steps.items()}
+
+    @staticmethod
+    def clear() -> None:
+        with PipelinePlanner._lock:
+            PipelinePlanner._steps.clear()
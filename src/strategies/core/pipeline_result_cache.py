@@ -0,0 +1,124 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from strategies.utils.config_loader import load_config
+
+class CachedResult(NamedTuple):
+    """Symbols a request returned over the data versions it was run on."""
+    symbols: Tuple[str, ...]
+    intervals: FrozenSet[str]
+    versions: Optional[Tuple[Tuple[str, Optional[str]], ...]]   # (interval, catalog fingerprint), None when not verified
+    stored_at: float
+
+class PipelineResultCache:
+    """
+    Process-wide LRU cache of run_pipeline results.
+
+    Results are keyed by a canonical fingerprint of the request: steps and filters with sorted
+    params, in sorted order since every one of them must pass. Each result keeps the catalog
+    fingerprint of every interval folder the run read, and a hit requires them unchanged
+    (result_cache.verify_versions, on by default). The fingerprints are the memoized ones of
+    the polled catalogs, so checking them is a lookup, not a folder scan. Entries expire after ttl_seconds, the
+    oldest are evicted past max_entries, and invalidate(interval) drops the results reading it.
+    """
+
+    DEFAULT_TTL_SECONDS = 300.0
+    DEFAULT_MAX_ENTRIES = 256
+
+    _entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    @staticmethod
+    def settings() -> Tuple[float, int, bool]:
+        """(ttl_seconds, max_entries, verify_versions) from the result_cache config section."""
+        section = load_config().get("result_cache") or {}
+        ttl = float(section.get("ttl_seconds", PipelineResultCache.DEFAULT_TTL_SECONDS))
+        max_entries = int(section.get("max_entries", PipelineResultCache.DEFAULT_MAX_ENTRIES))
+        return ttl, max_entries, bool(section.get("verify_versions", True))
+
+    @staticmethod
+    def enabled() -> bool:
+        ttl, max_entries, _ = PipelineResultCache.settings()
+        return ttl > 0 and max_entries > 0
+
+    @staticmethod
+    def fingerprint(strategies, filters=None, scope=None, directory=None) -> str:
+        """
+        Canonical hash of a pipeline request, the same for any order of its steps and filters.
+        A request scoped to part of the folder also passes what identifies its scope, and
+        directory is the data root it reads, so pipelines over different roots never share a key.
+        """
+        steps = sorted(json.dumps([item.strategy, item.interval, item.params or {}], sort_keys=True, default=str)
+                       for item in strategies)
+        conditions = sorted(json.dumps({name: value for name, value in vars(flt).items() if value is not None},
+                                       sort_keys=True, default=str)
+                            for flt in (filters or []))
+        request = {"steps": steps, "filters": conditions}
+        if scope is not None:
+            request["scope"] = scope
+        if directory is not None:
+            request["directory"] = directory
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def get(key: str, versions=None) -> Optional[List[str]]:
+        """The cached symbols of a request, None if missing, expired or run on other data versions."""
+        ttl, _, verify = PipelineResultCache.settings()
+        with PipelineResultCache._lock:
+            entry = PipelineResultCache._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at > ttl:
+                del PipelineResultCache._entries[key]
+                PipelineResultCache._evictions += 1
+                entry = None
+            if entry is None or (verify and entry.versions != versions):
+                PipelineResultCache._misses += 1
+                return None
+            PipelineResultCache._entries.move_to_end(key)
+            PipelineResultCache._hits += 1
+            return list(entry.symbols)
+
+    @staticmethod
+    def put(key: str, symbols: List[str], intervals, versions=None) -> None:
+        _, max_entries, _ = PipelineResultCache.settings()
+        entry = CachedResult(tuple(symbols), frozenset(intervals), versions, time.monotonic())
+        with PipelineResultCache._lock:
+            PipelineResultCache._entries[key] = entry
+            PipelineResultCache._entries.move_to_end(key)
+            while len(PipelineResultCache._entries) > max_entries:
+                PipelineResultCache._entries.popitem(last=False)
+                PipelineResultCache._evictions += 1
+
+    @staticmethod
+    def invalidate(interval: Optional[str] = None) -> int:
+        """Drop the results that read an interval, or all of them. Returns the number dropped."""
+        with PipelineResultCache._lock:
+            keys = [key for key, entry in PipelineResultCache._entries.items()
+                    if interval is None or interval in entry.intervals]
+            for key in keys:
+                del PipelineResultCache._entries[key]
+            return len(keys)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with PipelineResultCache._lock:
+            return {
+                "hits": PipelineResultCache._hits,
+                "misses": PipelineResultCache._misses,
+                "evictions": PipelineResultCache._evictions,
+                "entries": len(PipelineResultCache._entries),
+            }
+
+    @staticmethod
+    def clear() -> None:
+        with PipelineResultCache._lock:
+            PipelineResultCache._entries.clear()
+            PipelineResultCache._hits = 0
+            PipelineResultCache._misses = 0
+            PipelineResultCache._evictions = 0
@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from strategies.utils.config_loader import load_config
+
+Versions = Tuple[Optional[Tuple[int, int]], ...]
+
+class StandingResult(NamedTuple):
+    """Outcome of one run of a standing pipeline."""
+    symbols: List[str]     # the whole match set, ordered by symbol
+    added: List[str]       # symbols that started matching on this run
+    removed: List[str]     # symbols that stopped matching, or whose files are gone
+    evaluated: int         # symbols re-evaluated because an input file changed
+
+class StandingState:
+    """What a standing pipeline knows about each symbol: its input file versions and whether it matched."""
+
+    def __init__(self):
+        self.versions: Dict[str, Versions] = {}
+        self.matches: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def changed(self, versions: Dict[str, Versions]) -> List[str]:
+        """Symbols, in the given order, that are new or have an input file version different from the last run."""
+        return [symbol for symbol, version in versions.items() if self.versions.get(symbol) != version]
+
+    def update(self, versions: Dict[str, Versions], evaluated: List[str], passed: Set[str]) -> StandingResult:
+        """Record a run over the current universe (the keys of versions) and return the merged result."""
+        previous = set(self.matches)
+        for symbol in evaluated:
+            self.versions[symbol] = versions[symbol]
+            if symbol in passed:
+                self.matches.add(symbol)
+            else:
+                self.matches.discard(symbol)
+        for symbol in self.versions.keys() - versions.keys():
+            del self.versions[symbol]
+            self.matches.discard(symbol)
+        return StandingResult(sorted(self.matches), sorted(self.matches - previous),
+                              sorted(previous - self.matches), len(evaluated))
+
+class StandingPipelines:
+    """
+    Process-wide registry of standing pipelines, keyed by request fingerprint.
+
+    A standing pipeline remembers, for every symbol, the versions of the files it read on
+    each interval and whether it matched, so a run re-evaluates only the symbols with a
+    changed file. The least recently run pipelines are dropped past standing.max_pipelines.
+    """
+
+    DEFAULT_MAX_PIPELINES = 32
+
+    _states: "OrderedDict[str, StandingState]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(key: str) -> StandingState:
+        """The state of a standing pipeline, empty on its first run."""
+        section = load_config().get("standing") or {}
+        max_pipelines = int(section.get("max_pipelines", StandingPipelines.DEFAULT_MAX_PIPELINES))
+        with StandingPipelines._lock:
+            state = StandingPipelines._states.get(key)
+            if state is None:
+                state = StandingPipelines._states[key] = StandingState()
+            StandingPipelines._states.move_to_end(key)
+            while len(StandingPipelines._states) > max(max_pipelines, 1):
+                StandingPipelines._states.popitem(last=False)
+            return state
+
+    @staticmethod
+    def count() -> int:
+        with StandingPipelines._lock:
+            return len(StandingPipelines._states)
+
+    @staticmethod
+    def clear() -> None:
+        with StandingPipelines._lock:
+            StandingPipelines._states.clear()
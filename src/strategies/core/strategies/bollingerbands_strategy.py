@@ -1,20 +1,25 @@
 import talib as ta
 import numpy as np
 import pandas as pd
+from strategies.core.strategies.incremental_indicators import IncrementalBollingerBands
+from strategies.core.strategies.indicator_cache import IndicatorCache
+from strategies.core.strategies.lookback import lookback, min_bars
 
 class BollingerBandsStrategy:
     
     @staticmethod
+    @lookback(lambda period, duration, **_: period + duration)
+    @min_bars(lambda period, duration, **_: max(period, duration))
     def is_near_lower_bb(df: pd.DataFrame, period: int = 12, nbdev: float = 2.0, duration=12, tolerance=0.01) -> bool:
         if (len(df) < period) or (len(df) < duration):
             return False
-        upper, middle, lower = ta.BBANDS(
+        upper, middle, lower = IndicatorCache.get(df, "BBANDS", (period, nbdev), lambda: ta.BBANDS(
             df["Close"],
             timeperiod=period,
             nbdevup=nbdev,
             nbdevdn=nbdev,
             matype=0
-        )
+        ), lambda: IncrementalBollingerBands(period, nbdev))
         duration = min(duration, len(df))
         recent_close = df["Close"][-duration:]
         recent_lower = lower[-duration:]
@@ -22,16 +27,18 @@ class BollingerBandsStrategy:
         return np.any(dist_to_lower <= tolerance)
     
     @staticmethod
+    @lookback(lambda period, duration, **_: period + duration)
+    @min_bars(lambda period, duration, **_: max(period, duration))
     def is_near_upper_bb(df: pd.DataFrame, period: int = 12, nbdev: float = 2.0, duration=12, tolerance=0.01) -> bool:
         if (len(df) < period) or (len(df) < duration):
             return False
-        upper, middle, lower = ta.BBANDS(
+        upper, middle, lower = IndicatorCache.get(df, "BBANDS", (period, nbdev), lambda: ta.BBANDS(
             df["Close"],
             timeperiod=period,
             nbdevup=nbdev,
             nbdevdn=nbdev,
             matype=0
-        )
+        ), lambda: IncrementalBollingerBands(period, nbdev))
         duration = min(duration, len(df))
         recent_close = df["Close"][-duration:]
         recent_upper = upper[-duration:]
@@ -1,19 +1,30 @@
 import numpy as np
 import pandas as pd
 import talib
+import talib.abstract
 from loguru import logger
 from strategies.constants.candlestick_patterns import get_patterns
+from strategies.core.strategies.lookback import lookback
+from strategies.core.strategies.pattern_matrix import PatternMatrix
+
+def _patterns_lookback(group: str, subgroup: str, pattern: str, duration: int, **_) -> int:
+    """Bars needed for the last `duration` results: duration plus the longest talib CDL lookback."""
+    patterns = get_patterns(group, subgroup, pattern)
+    if not patterns:
+        raise KeyError(f"No pattern available for group:'{group}', subgroup:'{subgroup}', and pattern:'{pattern}'")
+    return duration + max(talib.abstract.Function(ptrn.upper()).lookback for ptrn in patterns)
 
 class CandlestickPatternsStrategy:
-    @staticmethod    
+    @staticmethod
+    @lookback(_patterns_lookback)
     def contains_candlestick_pattern(df: pd.DataFrame, group: str, subgroup: str, pattern: str, duration: int = 12) -> bool:
         patterns = get_patterns(group, subgroup, pattern)
         if not patterns:
             raise KeyError(f"No pattern available for group:'{group}', subgroup:'{subgroup}', and pattern:'{pattern}'")
-        try:            
+        try:
+            signals = PatternMatrix.signals(df, patterns)
             for ptrn in patterns:
-                func = getattr(talib, ptrn.upper())
-                result = func(df["Open"], df["High"], df["Low"], df["Close"])
+                result = signals[ptrn]
                 if len(result) >= duration:
                     if ((group == "bullish" and np.any(result[-duration:] > 0)) or 
                         (group == "bearish" and np.any(result[-duration:] < 0)) or 
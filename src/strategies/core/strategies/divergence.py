@@ -0,0 +1,73 @@
+import numpy as np
+from strategies.core.strategies.kernels import Kernels
+
+class Divergence:
+    """
+    Vectorized divergence between prices and an oscillator such as RSI.
+
+    Pivots are bars strictly below (lows) or above (highs) the order bars on each side.
+    Two consecutive pivots diverge when price makes a lower low while the oscillator makes
+    a higher one (bullish), or price a higher high and the oscillator a lower one (bearish).
+    Bar t marks an event when such a pair lies in the window bars ending at t, each pivot
+    with its order neighbours inside the window, i.e. what a scipy argrelextrema scan of
+    that window would find for order 1. Inputs are one series or a symbols x time matrix.
+    """
+
+    KINDS = ("bullish", "bearish")
+
+    @staticmethod
+    def pivots(values: np.ndarray, kind: str = "bullish", order: int = 1) -> np.ndarray:
+        """Boolean mask of the pivot lows ("bullish") or highs ("bearish") along the last axis."""
+        Divergence._check(kind, order)
+        values = np.asarray(values, dtype=np.float64)
+        compare = np.less if kind == "bullish" else np.greater
+        mask = np.ones(values.shape, dtype=bool)
+        bars = values.shape[-1]
+        with np.errstate(invalid="ignore"):
+            for shift in range(1, order + 1):
+                if shift >= bars:
+                    return np.zeros(values.shape, dtype=bool)
+                mask[..., shift:] &= compare(values[..., shift:], values[..., :-shift])
+                mask[..., :-shift] &= compare(values[..., :-shift], values[..., shift:])
+                mask[..., :shift] = False
+                mask[..., bars - shift:] = False
+        return mask
+
+    @staticmethod
+    def events(prices: np.ndarray, oscillator: np.ndarray, kind: str = "bullish", order: int = 1, window: int = 12) -> np.ndarray:
+        """Boolean mask, shaped like prices, of the bars ending a window that holds a divergence."""
+        Divergence._check(kind, order)
+        prices = np.asarray(prices, dtype=np.float64)
+        oscillator = np.asarray(oscillator, dtype=np.float64)
+        matrix = prices.reshape(-1, prices.shape[-1])
+        levels = oscillator.reshape(matrix.shape)
+        rows, bars = matrix.shape
+        compiled = Kernels.compiled("divergence")
+        if compiled is not None:
+            events = compiled(np.ascontiguousarray(matrix), np.ascontiguousarray(levels), kind == "bullish", order, window)
+            return events.reshape(prices.shape)
+
+        row, col = np.nonzero(Divergence.pivots(matrix, kind, order))
+        same_row = row[:-1] == row[1:]
+        first, second = np.flatnonzero(same_row), np.flatnonzero(same_row) + 1
+        p1, p2 = matrix[row[first], col[first]], matrix[row[second], col[second]]
+        o1, o2 = levels[row[first], col[first]], levels[row[second], col[second]]
+        with np.errstate(invalid="ignore"):
+            diverges = (p2 < p1) & (o2 > o1) if kind == "bullish" else (p2 > p1) & (o2 < o1)
+        first, second = first[diverges], second[diverges]
+
+        # a pair is visible from the bar its second pivot is confirmed until its first one leaves the window
+        start = col[second] + order
+        end = col[first] - order + window - 1
+        keep = start <= np.minimum(end, bars - 1)
+        marks = np.zeros((rows, bars + 1), dtype=np.int64)
+        np.add.at(marks, (row[second][keep], start[keep]), 1)
+        np.add.at(marks, (row[second][keep], np.minimum(end, bars - 1)[keep] + 1), -1)
+        return (np.cumsum(marks[:, :bars], axis=1) > 0).reshape(prices.shape)
+
+    @staticmethod
+    def _check(kind: str, order: int) -> None:
+        if kind not in Divergence.KINDS:
+            raise ValueError(f"kind must be one of {Divergence.KINDS}, got '{kind}'")
+        if order < 1:
+            raise ValueError(f"order must be at least 1, got {order}")
@@ -1,7 +1,10 @@
 import os
 from typing import List
-import pandas as pd
 from loguru import logger
+from strategies.core.data.ohlcv_store import OhlcvStore
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.strategies.panel import Panel
+from strategies.core.strategies.panel_strategies import PanelStrategies
 from strategies.utils.config_loader import load_config
 
 class EngulfingStrategy:
@@ -13,25 +16,17 @@ class EngulfingStrategy:
         self.folder_path = os.path.join(directory, interval)
 
     def get_symbols(self) -> List[str]:
-        symbols = []
-        for file_name in os.listdir(self.folder_path):
-            # Select only files with format "1d-<symbol>.csv"
-            if file_name.startswith(f"{self.interval}-") and file_name.endswith(".csv"):
-                full_file_name = os.path.join(self.folder_path, file_name)
-                if not os.path.isfile(full_file_name):
-                    continue
-                try:
-                    df = pd.read_csv(full_file_name)
-                    if df.empty:
-                        continue
-                    if len(df) > 1:
-                        o1, c1 = df.iloc[-2]['Open'], df.iloc[-2]['Close']
-                        o2, c2 = df.iloc[-1]['Open'], df.iloc[-1]['Close']
-                        if (((c1 < o1) and (c2 > o2) and (o2 < c1) and (c2 > o1)) or
-                        ((c1 > o1) and (c2 < o2) and (o2 > c1) and (c2 < o1))):
-                            symbol = file_name.split("-")[1].replace(".csv", "")
-                            symbols.append(symbol)
-                except Exception as e:
-                    logger.warning(f"Skipping {file_name}: {e}")
+        frames = {}
+        for entry in SymbolCatalog.get(self.folder_path, self.interval).entries():
+            # the catalog already knows files too short to hold a pattern
+            if entry.rows < 2:
+                continue
+            try:
+                frames[entry.symbol] = OhlcvStore.read_csv(entry.path, last_rows=2)
+            except Exception as e:
+                logger.warning(f"Skipping {os.path.basename(entry.path)}: {e}")
+        # one vectorized check of the last two bars of every symbol
+        panel = Panel.from_frames(frames, ("Open", "Close"))
+        symbols = [symbol for symbol, engulfing in zip(panel.symbols, PanelStrategies.is_engulfing(panel)) if engulfing]
         logger.info(f"EngulfingStrategy: Found {len(symbols)} symbols")
         return symbols
@@ -1,130 +1,95 @@
+from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
+from strategies.core.strategies.indicator_cache import IndicatorCache
+from strategies.core.strategies.kernels import Kernels
+from strategies.core.strategies.lookback import lookback
 
 class FailedBreakoutStrategy:
 
+    # The current and the previous session can span any number of bars, so these need the full history
     @staticmethod
+    @lookback(None)
     def is_failed_bo(df: pd.DataFrame, max_accept_bars: int = 3) -> bool:
-        return FailedBreakoutStrategy.is_failed_brbo(df, max_accept_bars) or FailedBreakoutStrategy.is_failed_blbo(df, max_accept_bars)
-    
+        return any(FailedBreakoutStrategy.failed_breakouts(df, max_accept_bars))
+
     # Wyckoff-Aligned Failed Bear Auction (Single-Close Acceptance)
     # Acceptance on the SAME bar is invalid in Wyckoff, but OK here
     @staticmethod
+    @lookback(None)
     def is_failed_brbo(df: pd.DataFrame, max_accept_bars: int = 3) -> bool:
-        df = df.copy()
-        df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-
-        if df.empty:
-            return False
-
-        # --- Define current and previous day based on data ---
-        last_ts = df["Timestamp"].max()
-        current_day = last_ts.normalize()
-        prev_ts = df[df["Timestamp"] < current_day]["Timestamp"].max()
-        if pd.isna(prev_ts):
-            return False 
-        prev_day = prev_ts.normalize()
-        if pd.isna(prev_day):
-            return False  # no data for previous day
-
-        # --- compute LOY ---
-        df_prev_day = df[df["Timestamp"].dt.normalize() == prev_day]
-        if df_prev_day.empty:
-            return False
-
-        loy = df_prev_day["Low"].min()
-
-        # --- signal detection ---
-        df_current_day = df[df["Timestamp"].dt.normalize() == current_day]
-        if df_current_day.empty:
-            return False
-
-        df_current_day.sort_values("Timestamp", inplace=True)
-        df_current_day.reset_index(drop=True, inplace=True)
-
-        lows = df_current_day["Low"].values
-        closes = df_current_day["Close"].values
-        n = len(df_current_day)
-
-        for i in range(n):
-            # 1. Break below LOY
-            if lows[i] < loy:
-                # Wyckoff: rejection must occur quickly
-                search_end = min(i + max_accept_bars + 1, n)
-
-                # 2. Acceptance back above LOY (single decisive close)
-                # SAME bar acceptance allowed
-                for j in range(i, search_end):
-                    if closes[j] > loy:
+        return FailedBreakoutStrategy.failed_breakouts(df, max_accept_bars)[0]
 
-                        # 3. No acceptance below LOY afterward
-                        if j + 1 < n:
-                            if np.all(closes[j + 1:] >= loy):
-                                return True
-                            else:
-                                return False
-                        else:
-                            return True  # last bar was acceptance                        
-                return False
-        return False
-    
     # Wyckoff-Aligned Failed Bull Auction (Single-Close Acceptance)
     # Acceptance on the SAME bar is invalid in Wyckoff, but OK here
     @staticmethod
+    @lookback(None)
     def is_failed_blbo(df: pd.DataFrame, max_accept_bars: int = 3) -> bool:
-        df = df.copy()
-        df["Timestamp"] = pd.to_datetime(df["Timestamp"])
+        return FailedBreakoutStrategy.failed_breakouts(df, max_accept_bars)[1]
 
-        if df.empty:
-            return False
+    @staticmethod
+    def failed_breakouts(df: pd.DataFrame, max_accept_bars: int = 3) -> Tuple[bool, bool]:
+        """
+        (failed bear breakout below LOY, failed bull breakout above HOY) of the current session,
+        found together in one pass and shared by the is_failed_* steps reading the same bars.
+        """
+        return IndicatorCache.get(df, "FAILED_BREAKOUTS", (max_accept_bars,),
+                                  lambda: FailedBreakoutStrategy._failed_breakouts(df, max_accept_bars))
 
-        # --- Define current and previous day based on data ---
-        last_ts = df["Timestamp"].max()
-        current_day = last_ts.normalize()
-        prev_ts = df[df["Timestamp"] < current_day]["Timestamp"].max()
-        if pd.isna(prev_ts):
-            return False 
-        prev_day = prev_ts.normalize()
-        if pd.isna(prev_day):
-            return False  # no data for previous day
+    @staticmethod
+    def _failed_breakouts(df: pd.DataFrame, max_accept_bars: int) -> Tuple[bool, bool]:
+        sessions = FailedBreakoutStrategy._last_sessions(df)
+        if sessions is None:
+            return False, False
+        previous, current = sessions
+        loy = df["Low"].iloc[previous].min()
+        hoy = df["High"].iloc[previous].max()
+        lows = df["Low"].to_numpy(dtype=np.float64)[current]
+        highs = df["High"].to_numpy(dtype=np.float64)[current]
+        closes = df["Close"].to_numpy(dtype=np.float64)[current]
+        with np.errstate(invalid="ignore"):
+            bear = FailedBreakoutStrategy._failed(lows < loy, closes > loy, closes >= loy, max_accept_bars)
+            bull = FailedBreakoutStrategy._failed(highs > hoy, closes < hoy, closes <= hoy, max_accept_bars)
+        return bear, bull
 
-        # --- compute HOY ---
-        df_prev_day = df[df["Timestamp"].dt.normalize() == prev_day]
-        if df_prev_day.empty:
+    @staticmethod
+    def _failed(broke: np.ndarray, accepted: np.ndarray, held: np.ndarray, max_accept_bars: int) -> bool:
+        """
+        The first break must be followed, on the same bar or within max_accept_bars bars, by a
+        close back inside the level, and every later close must hold inside it.
+        """
+        compiled = Kernels.compiled("failed_breakout")
+        if compiled is not None:
+            return bool(compiled(broke, accepted, held, int(max_accept_bars)))
+        breaks = np.flatnonzero(broke)
+        if not breaks.size:
             return False
-
-        hoy = df_prev_day["High"].max()
-
-        # --- signal detection ---
-        df_current_day = df[df["Timestamp"].dt.normalize() == current_day]
-        if df_current_day.empty:
+        first = breaks[0]
+        accepts = np.flatnonzero(accepted[first:first + max_accept_bars + 1])
+        if not accepts.size:
             return False
+        return bool(held[first + accepts[0] + 1:].all())
 
-        df_current_day.sort_values("Timestamp", inplace=True)
-        df_current_day.reset_index(drop=True, inplace=True)
-
-        highs = df_current_day["High"].values
-        closes = df_current_day["Close"].values
-        n = len(df_current_day)
-
-        for i in range(n):
-            # 1. Bullish attempt: break above HOY
-            if highs[i] > hoy:
-                # Wyckoff: rejection must occur quickly
-                search_end = min(i + max_accept_bars + 1, n)
-
-                # 2. Acceptance back below HOY (single decisive close)
-                # SAME bar failure allowed (close back below HOY)
-                for j in range(i, search_end):
-                    if closes[j] < hoy:
-
-                        # 3. No acceptance below LOY afterward
-                        if j + 1 < n:
-                            if np.all(closes[j + 1:] <= hoy):
-                                return True
-                            else:
-                                return False
-                        else:
-                            return True  # last bar was acceptance
-                return False
-        return False
+    @staticmethod
+    def _last_sessions(df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Row positions of the previous and the current (last) day, in time order. Timestamps
+        are parsed and split into days once; None when there is no current or previous day.
+        """
+        if df.empty:
+            return None
+        timestamps = pd.to_datetime(df["Timestamp"])
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        values = timestamps.to_numpy()
+        rows = np.flatnonzero(~np.isnat(values))
+        if not rows.size:
+            return None
+        if np.any(values[rows[1:]] < values[rows[:-1]]):
+            rows = rows[np.argsort(values[rows], kind="stable")]
+        days = values[rows].astype("datetime64[D]")
+        current_start = np.searchsorted(days, days[-1], side="left")
+        if current_start == 0:
+            return None
+        previous_start = np.searchsorted(days, days[current_start - 1], side="left")
+        return rows[previous_start:current_start], rows[current_start:]
@@ -0,0 +1,232 @@
+import math
+from collections import deque
+from typing import Any, Dict, Iterable, Optional, Tuple
+import numpy as np
+
+class IncrementalEma:
+    """
+    Exponential moving average advanced one bar at a time, like ta.EMA: seeded with the
+    simple average of the first period values, then value = prev + k * (x - prev), k = 2 / (period + 1).
+    """
+
+    OUTPUTS = 1
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"period must be at least 1, got {period}")
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed: list = []
+
+    def update(self, x: float) -> Optional[float]:
+        """Add one value; returns the EMA, or None while it is warming up."""
+        if self.value is None:
+            self._seed.append(float(x))
+            if len(self._seed) < self.period:
+                return None
+            self.value = sum(self._seed) / self.period
+            self._seed = []
+            return self.value
+        self.value += self.k * (float(x) - self.value)
+        return self.value
+
+    def seed(self, value: float) -> None:
+        """Start from a known average instead of collecting period values."""
+        self.value = float(value)
+        self._seed = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"period": self.period, "value": self.value, "seed": list(self._seed)}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "IncrementalEma":
+        ema = IncrementalEma(data["period"])
+        ema.value = data["value"]
+        ema._seed = list(data["seed"])
+        return ema
+
+
+class IncrementalRsi:
+    """
+    Wilder RSI advanced one bar at a time, like ta.RSI: the first average gain/loss is the
+    simple average of the first period changes, later ones are smoothed with weight 1 / period.
+    """
+
+    OUTPUTS = 1
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError(f"period must be at least 1, got {period}")
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes = 0
+        self.value: Optional[float] = None
+
+    def update(self, close: float) -> Optional[float]:
+        """Add one close; returns the RSI, or None for the first period closes."""
+        close = float(close)
+        if self.prev_close is None:
+            self.prev_close = close
+            return None
+        change = close - self.prev_close
+        self.prev_close = close
+        gain, loss = (change, 0.0) if change > 0 else (0.0, -change)
+        self.changes += 1
+        if self.changes <= self.period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            if self.changes < self.period:
+                return None
+            self.avg_gain /= self.period
+            self.avg_loss /= self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        total = self.avg_gain + self.avg_loss
+        self.value = 100.0 * self.avg_gain / total if total != 0 else 0.0
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"period": self.period, "prev_close": self.prev_close, "avg_gain": self.avg_gain,
+                "avg_loss": self.avg_loss, "changes": self.changes, "value": self.value}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "IncrementalRsi":
+        rsi = IncrementalRsi(data["period"])
+        rsi.prev_close = data["prev_close"]
+        rsi.avg_gain = data["avg_gain"]
+        rsi.avg_loss = data["avg_loss"]
+        rsi.changes = data["changes"]
+        rsi.value = data["value"]
+        return rsi
+
+
+class IncrementalMacd:
+    """
+    MACD line, signal and histogram advanced one bar at a time, like ta.MACD: both EMAs start
+    on the slow-th close (the fast one seeded with the average of the last fast closes) and
+    the signal EMA starts once signal MACD values are known.
+    """
+
+    OUTPUTS = 3
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if fast > slow:
+            fast, slow = slow, fast  # ta.MACD swaps them too
+        self.fast = IncrementalEma(fast)
+        self.slow = IncrementalEma(slow)
+        self.signal = IncrementalEma(signal)
+        self._closes: deque = deque(maxlen=slow)
+        self.value: Optional[Tuple[float, float, float]] = None
+
+    def update(self, close: float) -> Optional[Tuple[float, float, float]]:
+        """Add one close; returns (macd, signal, hist), or None while any of them is warming up."""
+        if self.slow.value is None:
+            self._closes.append(float(close))
+            if len(self._closes) < self.slow.period:
+                return None
+            closes = list(self._closes)
+            self.slow.seed(sum(closes) / self.slow.period)
+            self.fast.seed(sum(closes[-self.fast.period:]) / self.fast.period)
+            self._closes.clear()
+        else:
+            self.fast.update(close)
+            self.slow.update(close)
+        macd = self.fast.value - self.slow.value
+        signal = self.signal.update(macd)
+        if signal is None:
+            return None
+        self.value = (macd, signal, macd - signal)
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"fast": self.fast.to_dict(), "slow": self.slow.to_dict(), "signal": self.signal.to_dict(),
+                "closes": list(self._closes), "value": list(self.value) if self.value is not None else None}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "IncrementalMacd":
+        macd = IncrementalMacd(data["fast"]["period"], data["slow"]["period"], data["signal"]["period"])
+        macd.fast = IncrementalEma.from_dict(data["fast"])
+        macd.slow = IncrementalEma.from_dict(data["slow"])
+        macd.signal = IncrementalEma.from_dict(data["signal"])
+        macd._closes.extend(data["closes"])
+        macd.value = tuple(data["value"]) if data["value"] is not None else None
+        return macd
+
+
+class IncrementalBollingerBands:
+    """
+    Bollinger Bands advanced one bar at a time, like ta.BBANDS with matype=0: a rolling mean
+    and population standard deviation over the last period closes. The mean and the sum of
+    squared deviations are updated Welford style when a close enters and the oldest leaves,
+    which stays accurate on large prices where running sums of squares cancel out, and are
+    recomputed from the window once per period bars so rounding never accumulates.
+    """
+
+    OUTPUTS = 3
+
+    def __init__(self, period: int = 20, nbdev: float = 2.0):
+        if period < 1:
+            raise ValueError(f"period must be at least 1, got {period}")
+        self.period = period
+        self.nbdev = float(nbdev)
+        self._window: deque = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+        self.value: Optional[Tuple[float, float, float]] = None
+
+    def update(self, close: float) -> Optional[Tuple[float, float, float]]:
+        """Add one close; returns (upper, middle, lower), or None for the first period - 1 closes."""
+        close = float(close)
+        if len(self._window) < self.period:
+            self._window.append(close)
+            delta = close - self._mean
+            self._mean += delta / len(self._window)
+            self._m2 += delta * (close - self._mean)
+            if len(self._window) < self.period:
+                return None
+        else:
+            dropped = self._window[0]
+            self._window.append(close)
+            mean = self._mean + (close - dropped) / self.period
+            self._m2 += (close - dropped) * (close - mean + dropped - self._mean)
+            self._mean = mean
+            self._updates += 1
+            if self._updates % self.period == 0:
+                self._mean = math.fsum(self._window) / self.period
+                self._m2 = math.fsum((x - self._mean) ** 2 for x in self._window)
+        std = math.sqrt(max(self._m2 / self.period, 0.0))
+        self.value = (self._mean + self.nbdev * std, self._mean, self._mean - self.nbdev * std)
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"period": self.period, "nbdev": self.nbdev, "window": list(self._window),
+                "mean": self._mean, "m2": self._m2, "updates": self._updates,
+                "value": list(self.value) if self.value is not None else None}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "IncrementalBollingerBands":
+        bands = IncrementalBollingerBands(data["period"], data["nbdev"])
+        bands._window.extend(data["window"])
+        bands._mean = data["mean"]
+        bands._m2 = data["m2"]
+        bands._updates = data["updates"]
+        bands.value = tuple(data["value"]) if data["value"] is not None else None
+        return bands
+
+
+def run(indicator, values: Iterable[float]) -> np.ndarray:
+    """
+    Feed values to an incremental indicator and return its outputs aligned with them, NaN
+    while it warms up, shaped like the matching talib function (one column per output).
+    """
+    outputs = [indicator.update(x) for x in values]
+    array = np.full((len(outputs), indicator.OUTPUTS), np.nan)
+    for i, result in enumerate(outputs):
+        if result is not None:
+            array[i] = result
+    return array[:, 0] if indicator.OUTPUTS == 1 else array
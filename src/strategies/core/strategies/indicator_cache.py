@@ -0,0 +1,163 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.strategies import incremental_indicators
+from strategies.utils.config_loader import load_config
+
+class IndicatorCache:
+    """
+    Process-wide, memory-bounded LRU cache of indicator results.
+
+    Results are keyed by (interval, symbol, data version, file, bar count, indicator, params),
+    where everything up to the bar count comes from the source tag DataFrameCache puts on
+    the frames it returns. One pipeline step, another step or a concurrent request asking
+    for the same indicator of the same bars gets the result computed first. Frames without
+    a source tag (built in memory) are never cached; code changing the values of a frame
+    it read must clear df.attrs first.
+
+    When a file only had bars appended (see DataFrameCache.appended), the result over its
+    full frame is the cached result of the previous version extended by an incremental
+    state (see incremental_indicators) advanced over the new closes, instead of a recompute.
+    The state is rebuilt from the old closes the first time a file grows, then kept.
+
+    Cached results are shared, callers must not modify them.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    _entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+    # (file, indicator, params) -> (source, incremental state after the source's last bar)
+    _states: Dict[tuple, Tuple[tuple, Any]] = {}
+    _lock = threading.Lock()
+    _bytes = 0
+    _hits = 0
+    _misses = 0
+    _extensions = 0
+
+    @staticmethod
+    def get(df: pd.DataFrame, indicator: str, params: tuple, compute: Callable[[], Any],
+            incremental: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Return the cached result of indicator(params) over df, calling compute() on a miss.
+        incremental builds the matching incremental_indicators state, to extend the result
+        of the previous version of a file that only grew.
+        """
+        key = IndicatorCache.key(df, indicator, params)
+        if key is None:
+            return compute()
+        with IndicatorCache._lock:
+            entry = IndicatorCache._entries.get(key)
+            if entry is not None:
+                IndicatorCache._entries.move_to_end(key)
+                IndicatorCache._hits += 1
+                return entry[0]
+            IndicatorCache._misses += 1
+
+        result = IndicatorCache._extend(df, key, incremental) if incremental is not None else None
+        if result is None:
+            result = compute()
+        nbytes = IndicatorCache._nbytes(result)
+        max_bytes = IndicatorCache.max_bytes()
+        with IndicatorCache._lock:
+            if nbytes <= max_bytes and key not in IndicatorCache._entries:
+                IndicatorCache._entries[key] = (result, nbytes)
+                IndicatorCache._bytes += nbytes
+                while IndicatorCache._bytes > max_bytes:
+                    _, (_, evicted_bytes) = IndicatorCache._entries.popitem(last=False)
+                    IndicatorCache._bytes -= evicted_bytes
+        return result
+
+    @staticmethod
+    def key(df: pd.DataFrame, indicator: str, params: tuple) -> Optional[tuple]:
+        source = df.attrs.get(DataFrameCache.SOURCE_ATTR)
+        if source is None:
+            return None
+        return source, len(df), indicator, tuple(params)
+
+    @staticmethod
+    def _extend(df: pd.DataFrame, key: tuple, incremental: Callable[[], Any]) -> Optional[Any]:
+        """The result over df from the previous version's one, None unless df is a full frame of a file that only grew."""
+        source, rows, indicator, params = key
+        grown = DataFrameCache.appended(source)
+        if grown is None or grown[2] != rows:
+            return None
+        previous_source, previous_rows, _ = grown
+        state_key = (source[3], indicator, params)
+        with IndicatorCache._lock:
+            entry = IndicatorCache._entries.get((previous_source, previous_rows, indicator, params))
+            # taken out while it advances, so concurrent callers never share one state
+            saved = IndicatorCache._states.pop(state_key, None)
+        if entry is None:
+            return None
+
+        closes = df["Close"].to_numpy(dtype=np.float64)
+        if saved is not None and saved[0] == previous_source:
+            state = saved[1]
+        else:
+            state = incremental()
+            incremental_indicators.run(state, closes[:previous_rows])
+        appended = incremental_indicators.run(state, closes[previous_rows:])
+        with IndicatorCache._lock:
+            IndicatorCache._states[state_key] = (source, state)
+            IndicatorCache._extensions += 1
+        return IndicatorCache._concat(entry[0], appended, df.index)
+
+    @staticmethod
+    def _concat(previous: Any, appended: np.ndarray, index: pd.Index) -> Any:
+        if isinstance(previous, tuple):
+            return tuple(IndicatorCache._concat(item, appended[:, i], index) for i, item in enumerate(previous))
+        values = np.concatenate([np.asarray(previous, dtype=np.float64), appended])
+        return pd.Series(values, index=index) if isinstance(previous, pd.Series) else values
+
+    @staticmethod
+    def invalidate(interval: Optional[str] = None) -> int:
+        """Drop all cached results, or only those of one interval. Returns the number dropped."""
+        with IndicatorCache._lock:
+            for state_key in [state_key for state_key, (source, _) in IndicatorCache._states.items()
+                              if interval is None or source[0] == interval]:
+                del IndicatorCache._states[state_key]
+            keys = [key for key in IndicatorCache._entries if interval is None or key[0][0] == interval]
+            for key in keys:
+                _, nbytes = IndicatorCache._entries.pop(key)
+                IndicatorCache._bytes -= nbytes
+            return len(keys)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with IndicatorCache._lock:
+            return {
+                "hits": IndicatorCache._hits,
+                "misses": IndicatorCache._misses,
+                "extensions": IndicatorCache._extensions,
+                "entries": len(IndicatorCache._entries),
+                "bytes": IndicatorCache._bytes,
+                "max_bytes": IndicatorCache.max_bytes(),
+            }
+
+    @staticmethod
+    def clear() -> None:
+        """Drop all entries and reset the counters."""
+        with IndicatorCache._lock:
+            IndicatorCache._entries.clear()
+            IndicatorCache._states.clear()
+            IndicatorCache._bytes = IndicatorCache._hits = IndicatorCache._misses = IndicatorCache._extensions = 0
+
+    @staticmethod
+    def max_bytes() -> int:
+        cache = load_config().get("cache") or {}
+        return int(cache.get("indicator_cache_bytes", IndicatorCache.DEFAULT_MAX_BYTES))
+
+    @staticmethod
+    def _nbytes(result: Any) -> int:
+        if isinstance(result, (tuple, list)):
+            return sum(IndicatorCache._nbytes(item) for item in result)
+        if isinstance(result, pd.DataFrame):
+            return int(result.memory_usage(index=True).sum())
+        if isinstance(result, pd.Series):
+            return int(result.memory_usage(index=True))
+        if isinstance(result, np.ndarray):
+            return int(result.nbytes)
+        return 64
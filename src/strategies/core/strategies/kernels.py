@@ -0,0 +1,130 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+import numpy as np
+from loguru import logger
+from strategies.utils.config_loader import load_config
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the NumPy kernels are used without it
+    njit = None
+
+
+def _failed_breakout_loop(broke, accepted, held, max_accept_bars):
+    n = broke.shape[0]
+    for i in range(n):
+        if broke[i]:
+            for j in range(i, min(i + max_accept_bars + 1, n)):
+                if accepted[j]:
+                    for k in range(j + 1, n):
+                        if not held[k]:
+                            return False
+                    return True
+            return False
+    return False
+
+
+def _divergence_loop(prices, oscillator, bullish, order, window):
+    rows, bars = prices.shape
+    events = np.zeros((rows, bars), dtype=np.bool_)
+    for r in range(rows):
+        previous = -1
+        for p in range(order, bars - order):
+            x = prices[r, p]
+            pivot = True
+            for s in range(1, order + 1):
+                if bullish:
+                    pivot = x < prices[r, p - s] and x < prices[r, p + s]
+                else:
+                    pivot = x > prices[r, p - s] and x > prices[r, p + s]
+                if not pivot:
+                    break
+            if not pivot:
+                continue
+            if previous >= 0:
+                p1, o1, o2 = prices[r, previous], oscillator[r, previous], oscillator[r, p]
+                if (bullish and x < p1 and o2 > o1) or (not bullish and x > p1 and o2 < o1):
+                    for t in range(p + order, min(previous - order + window - 1, bars - 1) + 1):
+                        events[r, t] = True
+            previous = p
+    return events
+
+
+def _engulfing_loop(opens, closes):
+    rows, bars = opens.shape
+    events = np.zeros((rows, bars), dtype=np.bool_)
+    for r in range(rows):
+        for t in range(1, bars):
+            o1, c1, o2, c2 = opens[r, t - 1], closes[r, t - 1], opens[r, t], closes[r, t]
+            events[r, t] = ((c1 < o1 and c2 > o2 and o2 < c1 and c2 > o1) or
+                            (c1 > o1 and c2 < o2 and o2 > c1 and c2 < o1))
+    return events
+
+
+class Kernels:
+    """
+    Numba-compiled versions of the path-dependent kernels: the failed-breakout acceptance
+    search, divergence pivot pairing and engulfing sequence check.
+
+    kernels.backend in config.yaml picks "numba", "numpy" or "auto" (numba when installed).
+    compiled(name) returns the compiled loop, or None when the caller should run its NumPy
+    version; both give the same results. warm_up() compiles everything at service start.
+    """
+
+    LOOPS: Dict[str, Callable] = {
+        "failed_breakout": _failed_breakout_loop,
+        "divergence": _divergence_loop,
+        "engulfing": _engulfing_loop,
+    }
+    BACKENDS = ("auto", "numba", "numpy")
+
+    _compiled: Dict[str, Callable] = {}
+    _lock = threading.Lock()
+    _warned = False
+
+    @staticmethod
+    def available() -> bool:
+        return njit is not None
+
+    @staticmethod
+    def backend() -> str:
+        """The backend in use: "numba" or "numpy"."""
+        kernels = load_config().get("kernels") or {}
+        backend = kernels.get("backend", "auto")
+        if backend not in Kernels.BACKENDS:
+            raise ValueError(f"kernels.backend must be one of {Kernels.BACKENDS}, got '{backend}'")
+        if backend == "numpy":
+            return "numpy"
+        if not Kernels.available():
+            if backend == "numba" and not Kernels._warned:
+                Kernels._warned = True
+                logger.warning("Kernels: numba is not installed, using the NumPy kernels")
+            return "numpy"
+        return "numba"
+
+    @staticmethod
+    def compiled(name: str) -> Optional[Callable]:
+        """The compiled kernel, or None when the NumPy backend is in use."""
+        if Kernels.backend() != "numba":
+            return None
+        with Kernels._lock:
+            kernel = Kernels._compiled.get(name)
+            if kernel is None:
+                kernel = Kernels._compiled[name] = njit(cache=True, nogil=True)(Kernels.LOOPS[name])
+        return kernel
+
+    @staticmethod
+    def warm_up() -> str:
+        """Compile every kernel on tiny inputs so no request pays for it. Returns the backend."""
+        backend = Kernels.backend()
+        if backend != "numba":
+            return backend
+        started = time.perf_counter()
+        flags = np.zeros(2, dtype=np.bool_)
+        values = np.zeros((1, 4), dtype=np.float64)
+        Kernels.compiled("failed_breakout")(flags, flags, flags, 1)
+        Kernels.compiled("divergence")(values, values, True, 1, 2)
+        Kernels.compiled("engulfing")(values, values)
+        logger.info(f"Kernels: Compiled {len(Kernels.LOOPS)} numba kernels in {time.perf_counter() - started:.2f}s")
+        return backend
@@ -0,0 +1,50 @@
+import inspect
+from typing import Any, Callable, Dict, Optional
+
+# Recursive indicators (Wilder RSI, EMA based MACD) depend on the whole history. Starting
+# them this many periods before the checked bars makes the truncated result converge to
+# the full-history one well below any threshold the strategies compare against.
+WARMUP_PERIODS = 10
+
+def lookback(bars: Optional[Callable[..., Optional[int]]]):
+    """
+    Declare how many trailing bars a strategy function needs.
+    bars is called with the function's arguments (defaults applied, without df) and
+    returns the number of bars, or None when the full history is needed.
+    """
+    def decorate(func):
+        func.lookback = bars
+        return func
+    return decorate
+
+def min_bars(bars: Callable[..., int]):
+    """
+    Declare the fewest bars a strategy function needs to ever return True.
+    bars is called like the one of lookback; the function must return False on shorter series,
+    which lets a scan skip those symbols from their bar count alone.
+    """
+    def decorate(func):
+        func.min_bars = bars
+        return func
+    return decorate
+
+def required_bars(func: Callable, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+    """Number of trailing bars func needs for the given params, None if unknown or the full history."""
+    return _evaluate(func, "lookback", params)
+
+def required_min_bars(func: Callable, params: Optional[Dict[str, Any]] = None) -> int:
+    """Fewest bars func can return True on for the given params, 0 if it did not declare any."""
+    return _evaluate(func, "min_bars", params) or 0
+
+def _evaluate(func: Callable, attribute: str, params: Optional[Dict[str, Any]]) -> Optional[int]:
+    bars = getattr(func, "__dict__", {}).get(attribute)
+    if bars is None:
+        return None
+    try:
+        bound = inspect.signature(func).bind_partial(**(params or {}))
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items() if name != "df"}
+        return bars(**arguments)
+    except (TypeError, KeyError, ValueError):
+        # let the strategy itself report invalid params on the full history
+        return None
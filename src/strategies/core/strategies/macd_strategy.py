@@ -1,17 +1,22 @@
 import talib as ta
 import pandas as pd
+from strategies.core.strategies.incremental_indicators import IncrementalMacd
+from strategies.core.strategies.indicator_cache import IndicatorCache
+from strategies.core.strategies.lookback import WARMUP_PERIODS, lookback, min_bars
 
 class MacdStrategy:
     @staticmethod
+    @lookback(lambda slow, signal, duration, **_: duration + slow * WARMUP_PERIODS + signal)
+    @min_bars(lambda slow, duration, **_: max(slow, duration))
     def is_bullish_macd_crossover(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9, duration: int = 12) -> bool:
         if (len(df) < slow) or (len(df) < duration):
             return False
-        macd, signal, hist = ta.MACD(
+        macd, signal, hist = IndicatorCache.get(df, "MACD", (fast, slow, signal), lambda: ta.MACD(
             df['Close'],
             fastperiod=fast,
             slowperiod=slow,
             signalperiod=signal
-        )
+        ), lambda: IncrementalMacd(fast, slow, signal))
         macd = pd.Series(macd, index=df.index)
         signal = pd.Series(signal, index=df.index)
         bullish = (macd.shift(1) < signal.shift(1)) & (macd > signal)
@@ -19,15 +24,17 @@ class MacdStrategy:
         return bullish.iloc[-duration:].any()   
     
     @staticmethod
+    @lookback(lambda slow, signal, duration, **_: duration + slow * WARMUP_PERIODS + signal)
+    @min_bars(lambda slow, duration, **_: max(slow, duration))
     def is_bearish_macd_crossover(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9, duration: int = 12) -> bool:
         if (len(df) < slow) or (len(df) < duration):
             return False
-        macd, signal, hist = ta.MACD(
+        macd, signal, hist = IndicatorCache.get(df, "MACD", (fast, slow, signal), lambda: ta.MACD(
             df['Close'],
             fastperiod=fast,
             slowperiod=slow,
             signalperiod=signal
-        )
+        ), lambda: IncrementalMacd(fast, slow, signal))
         macd = pd.Series(macd, index=df.index)
         signal = pd.Series(signal, index=df.index)
         bearish = (macd.shift(1) > signal.shift(1)) & (macd < signal)
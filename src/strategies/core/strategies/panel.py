@@ -0,0 +1,69 @@
+from typing import Dict, Iterable, List, Mapping, Sequence
+import numpy as np
+import pandas as pd
+
+class Panel:
+    """
+    Bars of many symbols as one symbols x time matrix per field.
+
+    Series are aligned on their last bar: column -1 is every symbol's latest bar and shorter
+    histories are NaN-padded on the left, so "the last n bars" is the same column slice for
+    all symbols. A field a frame lacks, or cannot convert to numbers, is all NaN for that symbol.
+    """
+
+    FIELDS = ("Open", "High", "Low", "Close")
+
+    def __init__(self, symbols: Sequence[str], fields: Dict[str, np.ndarray], lengths: np.ndarray):
+        self.symbols: List[str] = list(symbols)
+        self.fields = fields
+        self.lengths = lengths
+
+    @staticmethod
+    def from_frames(frames: Mapping[str, pd.DataFrame], fields: Iterable[str] = FIELDS) -> "Panel":
+        """Stack frames keyed by symbol, in the mapping's order."""
+        symbols = list(frames)
+        fields = list(fields)
+        lengths = np.array([len(frames[symbol]) for symbol in symbols], dtype=np.int64)
+        bars = int(lengths.max()) if len(lengths) else 0
+        matrices = {field: np.full((len(symbols), bars), np.nan) for field in fields}
+        for row, symbol in enumerate(symbols):
+            df = frames[symbol]
+            if len(df) == 0:
+                continue
+            for field in fields:
+                if field not in df.columns:
+                    continue
+                try:
+                    matrices[field][row, bars - len(df):] = df[field].to_numpy(dtype=np.float64)
+                except (TypeError, ValueError):
+                    pass
+        return Panel(symbols, matrices, lengths)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def bars(self) -> int:
+        """Width of the time axis, the length of the longest series."""
+        return next(iter(self.fields.values())).shape[1] if self.fields else 0
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Column of each symbol's first bar."""
+        return self.bars - self.lengths
+
+    def select(self, mask: np.ndarray) -> "Panel":
+        """The rows of the symbols where mask is True."""
+        mask = np.asarray(mask, dtype=bool)
+        return Panel([symbol for symbol, keep in zip(self.symbols, mask) if keep],
+                     {field: matrix[mask] for field, matrix in self.fields.items()}, self.lengths[mask])
+
+    def last(self, field: str, bars: int) -> np.ndarray:
+        """The last bars columns of a field, NaN-padded on the left when the panel is narrower."""
+        matrix = self.fields[field]
+        if bars <= matrix.shape[1]:
+            return matrix[:, matrix.shape[1] - bars:]
+        return np.hstack([np.full((matrix.shape[0], bars - matrix.shape[1]), np.nan), matrix])
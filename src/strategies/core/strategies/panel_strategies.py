@@ -0,0 +1,194 @@
+from typing import Dict, List
+import numpy as np
+from strategies.core.strategies.divergence import Divergence
+from strategies.core.strategies.kernels import Kernels
+from strategies.core.strategies.panel import Panel
+from strategies.core.strategies.pivotpoints_strategy import PivotPointsStrategy
+
+class PanelStrategies:
+    """
+    Vectorized counterparts of the per-symbol strategy checks.
+
+    Each takes a Panel and the parameters of the per-symbol check and returns one boolean
+    per panel symbol, equal to what that check returns on the symbol's frame. Indicators are
+    computed column by column across all symbols with talib's seeding, so the cost grows
+    with the bars looked at, not with the number of symbols.
+    """
+
+    @staticmethod
+    def is_near_lower_bb(panel: Panel, period: int = 12, nbdev: float = 2.0, duration=12, tolerance=0.01) -> np.ndarray:
+        close, _, lower = PanelStrategies._recent_bbands(panel, period, nbdev, duration)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            near = (close - lower) / close <= tolerance
+        return near.any(axis=1) & PanelStrategies._long_enough(panel, period, duration)
+
+    @staticmethod
+    def is_near_upper_bb(panel: Panel, period: int = 12, nbdev: float = 2.0, duration=12, tolerance=0.01) -> np.ndarray:
+        close, upper, _ = PanelStrategies._recent_bbands(panel, period, nbdev, duration)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            near = (upper - close) / close <= tolerance
+        return near.any(axis=1) & PanelStrategies._long_enough(panel, period, duration)
+
+    @staticmethod
+    def is_rsi_overbought(panel: Panel, period: int = 14, overbought: int = 70, duration: int = 12) -> np.ndarray:
+        rsi = PanelStrategies.rsi(panel, period)[:, -duration:]
+        with np.errstate(invalid="ignore"):
+            return (rsi >= overbought).any(axis=1) & PanelStrategies._long_enough(panel, period, duration)
+
+    @staticmethod
+    def is_rsi_oversold(panel: Panel, period: int = 14, oversold: int = 30, duration: int = 12) -> np.ndarray:
+        rsi = PanelStrategies.rsi(panel, period)[:, -duration:]
+        with np.errstate(invalid="ignore"):
+            return (rsi <= oversold).any(axis=1) & PanelStrategies._long_enough(panel, period, duration)
+
+    @staticmethod
+    def is_rsi_bullish_divergence(panel: Panel, period: int = 14, duration: int = 12, order: int = 1) -> np.ndarray:
+        return PanelStrategies._has_divergence(panel, "bullish", period, duration, order)
+
+    @staticmethod
+    def is_rsi_bearish_divergence(panel: Panel, period: int = 14, duration: int = 12, order: int = 1) -> np.ndarray:
+        return PanelStrategies._has_divergence(panel, "bearish", period, duration, order)
+
+    @staticmethod
+    def is_bullish_macd_crossover(panel: Panel, fast: int = 12, slow: int = 26, signal: int = 9, duration: int = 12) -> np.ndarray:
+        macd, signal_line = PanelStrategies._recent_macd(panel, fast, slow, signal, duration)
+        with np.errstate(invalid="ignore"):
+            crossed = (macd[:, :-1] < signal_line[:, :-1]) & (macd[:, 1:] > signal_line[:, 1:])
+        return crossed.any(axis=1) & PanelStrategies._long_enough(panel, slow, duration)
+
+    @staticmethod
+    def is_bearish_macd_crossover(panel: Panel, fast: int = 12, slow: int = 26, signal: int = 9, duration: int = 12) -> np.ndarray:
+        macd, signal_line = PanelStrategies._recent_macd(panel, fast, slow, signal, duration)
+        with np.errstate(invalid="ignore"):
+            crossed = (macd[:, :-1] > signal_line[:, :-1]) & (macd[:, 1:] < signal_line[:, 1:])
+        return crossed.any(axis=1) & PanelStrategies._long_enough(panel, slow, duration)
+
+    @staticmethod
+    def is_engulfing(panel: Panel) -> np.ndarray:
+        """Bullish or bearish engulfing on the last two bars, like EngulfingStrategy."""
+        return PanelStrategies.engulfing(panel.last("Open", 2), panel.last("Close", 2))[:, -1]
+
+    @staticmethod
+    def engulfing(opens: np.ndarray, closes: np.ndarray) -> np.ndarray:
+        """Bars (symbols x time) whose body engulfs the previous bar's opposite-colored body."""
+        compiled = Kernels.compiled("engulfing")
+        if compiled is not None:
+            return compiled(np.ascontiguousarray(opens, dtype=np.float64), np.ascontiguousarray(closes, dtype=np.float64))
+        o1, c1, o2, c2 = opens[:, :-1], closes[:, :-1], opens[:, 1:], closes[:, 1:]
+        events = np.zeros(opens.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            events[:, 1:] = (((c1 < o1) & (c2 > o2) & (o2 < c1) & (c2 > o1)) |
+                             ((c1 > o1) & (c2 < o2) & (o2 > c1) & (c2 < o1)))
+        return events
+
+    @staticmethod
+    def is_last_close_near_pivotpoints(panel: Panel, levels=None, tolerance=0.01, method="classic") -> np.ndarray:
+        pivots = PanelStrategies.pivot_points(panel.symbols, method)
+        selected = [lvl for lvl in (levels if levels else pivots.keys()) if lvl in pivots]
+        if not selected:
+            return np.zeros(len(panel), dtype=bool)
+        close = panel.last("Close", 1)[:, 0]
+        values = np.stack([pivots[lvl] for lvl in selected], axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (np.abs(close[:, None] - values) / close[:, None] <= tolerance).any(axis=1)
+
+    @staticmethod
+    def pivot_points(symbols: List[str], method: str = "classic") -> Dict[str, np.ndarray]:
+        """Daily pivot levels of each symbol from the PivotTable, NaN for the symbols without them."""
+        return PivotPointsStrategy._table().levels(symbols, method)
+
+    @staticmethod
+    def rsi(panel: Panel, period: int = 14, field: str = "Close") -> np.ndarray:
+        """Wilder RSI of every symbol, like ta.RSI on each series: NaN for its first period bars."""
+        values = panel[field]
+        rows, bars = values.shape
+        rsi = np.full((rows, bars), np.nan)
+        if rows == 0 or bars == 0:
+            return rsi
+        change = np.full((rows, bars), np.nan)
+        change[:, 1:] = values[:, 1:] - values[:, :-1]
+        gain = np.where(change > 0, change, 0.0)
+        loss = np.where(change < 0, -change, 0.0)
+        first = panel.starts + period   # column of the first RSI of each row
+        avg_gain = np.full(rows, np.nan)
+        avg_loss = np.full(rows, np.nan)
+        for t in range(max(int(first.min()), 0), bars):
+            seed = first == t
+            if seed.any():
+                avg_gain[seed] = gain[seed, t - period + 1:t + 1].sum(axis=1) / period
+                avg_loss[seed] = loss[seed, t - period + 1:t + 1].sum(axis=1) / period
+            step = first < t
+            avg_gain = np.where(step, (avg_gain * (period - 1) + gain[:, t]) / period, avg_gain)
+            avg_loss = np.where(step, (avg_loss * (period - 1) + loss[:, t]) / period, avg_loss)
+            total = avg_gain + avg_loss
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rsi[:, t] = np.where(np.abs(total) < 1e-14, 0.0, 100.0 * (avg_gain / total))
+            rsi[first > t, t] = np.nan
+        return rsi
+
+    @staticmethod
+    def macd(panel: Panel, fast: int = 12, slow: int = 26, signal: int = 9, field: str = "Close"):
+        """(macd, signal, hist) of every symbol, like ta.MACD on each series."""
+        if fast > slow:
+            fast, slow = slow, fast
+        values = panel[field]
+        first = panel.starts + slow - 1
+        macd = PanelStrategies.ema(values, fast, first) - PanelStrategies.ema(values, slow, first)
+        signal_line = PanelStrategies.ema(macd, signal, first + signal - 1)
+        # like talib, no output before the signal line starts
+        macd = np.where(np.isnan(signal_line), np.nan, macd)
+        return macd, signal_line, macd - signal_line
+
+    @staticmethod
+    def ema(values: np.ndarray, period: int, first: np.ndarray) -> np.ndarray:
+        """
+        EMA of every row, seeded at column first[row] with the mean of the period values ending
+        there (like ta.EMA when first is the row's start + period - 1), NaN before.
+        """
+        rows, bars = values.shape
+        ema = np.full((rows, bars), np.nan)
+        k = 2.0 / (period + 1)
+        if rows == 0 or bars == 0:
+            return ema
+        prev = np.full(rows, np.nan)
+        for t in range(max(int(first.min()), 0), bars):
+            seed = first == t
+            if seed.any():
+                prev[seed] = values[seed, t - period + 1:t + 1].sum(axis=1) / period
+            step = first < t
+            prev = np.where(step, (values[:, t] - prev) * k + prev, prev)
+            ema[:, t] = prev
+        ema[first[:, None] > np.arange(bars)[None, :]] = np.nan
+        return ema
+
+    @staticmethod
+    def _recent_bbands(panel: Panel, period: int, nbdev: float, duration: int):
+        """(close, upper, lower) over the last duration bars, bands like ta.BBANDS with matype=0."""
+        closes = panel.last("Close", duration + period - 1)
+        windows = np.lib.stride_tricks.sliding_window_view(closes, period, axis=1)
+        middle = windows.mean(axis=2)
+        std = windows.std(axis=2)
+        return closes[:, period - 1:], middle + nbdev * std, middle - nbdev * std
+
+    @staticmethod
+    def _recent_macd(panel: Panel, fast: int, slow: int, signal: int, duration: int):
+        """MACD and signal over the last duration bars plus the one before them."""
+        macd, signal_line, _ = PanelStrategies.macd(panel, fast, slow, signal)
+        width = duration + 1
+        pad = max(width - macd.shape[1], 0)
+        if pad:
+            macd = np.hstack([np.full((len(panel), pad), np.nan), macd])
+            signal_line = np.hstack([np.full((len(panel), pad), np.nan), signal_line])
+        return macd[:, -width:], signal_line[:, -width:]
+
+    @staticmethod
+    def _has_divergence(panel: Panel, kind: str, period: int, duration: int, order: int) -> np.ndarray:
+        width = min(duration, panel.bars)
+        prices = panel["Close"][:, panel.bars - width:]
+        rsi = PanelStrategies.rsi(panel, period)[:, panel.bars - width:]
+        events = Divergence.events(prices, rsi, kind, order, width)
+        return (events[:, -1] if width else np.zeros(len(panel), dtype=bool)) & PanelStrategies._long_enough(panel, period, duration)
+
+    @staticmethod
+    def _long_enough(panel: Panel, period: int, duration: int) -> np.ndarray:
+        return (panel.lengths >= period) & (panel.lengths >= duration)
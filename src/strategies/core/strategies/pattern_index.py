@@ -0,0 +1,186 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.ohlcv_store import OhlcvStore
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.strategies.pattern_matrix import PatternMatrix
+from strategies.utils.config_loader import load_config
+
+class Posting(NamedTuple):
+    """Recent hits of one pattern for one symbol version."""
+    version: Tuple[int, int]
+    rows: int
+    hits: List[Tuple[int, int]]   # (bars before the last one, sign), 0 is the last bar
+
+class PatternIndex:
+    """
+    Inverted index of one interval folder from candlestick pattern to the symbols with a
+    hit in their last pattern_index.recent_bars bars, keeping each hit's position and sign.
+
+    A pattern is indexed the first time it is queried, afterwards a symbol is re-read only
+    when its CSV version changes (signals come from its PatternMatrix). The index is kept in
+    "<interval>/.cache/pattern_index.json", so a screen is a lookup plus a set union.
+    """
+
+    INDEX_FILE = "pattern_index.json"
+    DEFAULT_RECENT_BARS = 50
+    REQUIRED_COLUMNS = ("Open", "High", "Low", "Close")
+
+    _indexes: Dict[str, "PatternIndex"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, folder_path: str, interval: str, recent_bars: int, postings: Dict[str, Dict[str, Posting]]):
+        self.folder_path = folder_path
+        self.interval = interval
+        self.recent_bars = recent_bars
+        self.postings = postings
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get(folder_path: str, interval: str) -> "PatternIndex":
+        """Return the index of a folder, loading the persisted one on first use."""
+        key = os.path.abspath(folder_path)
+        recent_bars = PatternIndex.configured_recent_bars()
+        with PatternIndex._lock:
+            index = PatternIndex._indexes.get(key)
+            if index is None or (index.interval, index.recent_bars) != (interval, recent_bars):
+                index = PatternIndex(folder_path, interval, recent_bars,
+                                     PatternIndex.load(folder_path, interval, recent_bars))
+                PatternIndex._indexes[key] = index
+        return index
+
+    @staticmethod
+    def configured_recent_bars() -> int:
+        section = load_config().get("pattern_index") or {}
+        return int(section.get("recent_bars", PatternIndex.DEFAULT_RECENT_BARS))
+
+    @staticmethod
+    def index_path(folder_path: str) -> str:
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, PatternIndex.INDEX_FILE)
+
+    def symbols(self, patterns: Iterable[str], group: str, period: int,
+                compute: Optional[Callable[[pd.DataFrame, str], object]] = None,
+                universe: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Symbols, without duplicates and ordered by symbol, with at least period bars and a hit of
+        one of the patterns in their last period bars: bullish hits for "bullish", bearish ones
+        for "bearish", any for "neutral" and "all". period must not exceed recent_bars.
+        With universe, only those symbols are indexed and returned.
+        """
+        if period > self.recent_bars:
+            raise ValueError(f"period {period} exceeds the {self.recent_bars} bars kept by the pattern index")
+        patterns = [ptrn.upper() for ptrn in patterns]
+        universe = None if universe is None else set(universe)
+        self.refresh(patterns, compute, universe)
+
+        def matches(sign: int) -> bool:
+            return ((group == "bullish" and sign > 0) or (group == "bearish" and sign < 0) or
+                    ((group == "neutral" or group == "all") and sign != 0))
+
+        symbols = set()
+        for ptrn in patterns:
+            for symbol, posting in self.postings.get(ptrn, {}).items():
+                if universe is not None and symbol not in universe:
+                    continue
+                if posting.rows >= period and any(offset < period and matches(sign) for offset, sign in posting.hits):
+                    symbols.add(symbol)
+        return sorted(symbols)
+
+    def refresh(self, patterns: List[str], compute: Optional[Callable[[pd.DataFrame, str], object]] = None,
+                universe: Optional[Iterable[str]] = None) -> int:
+        """
+        Index the given patterns for the symbols, of universe when given, that are new or changed.
+        Returns the number of symbols re-read.
+        """
+        catalog = SymbolCatalog.get(self.folder_path, self.interval)
+        with self._lock:
+            current = {entry.symbol: entry for entry in catalog.entries()}
+            changed = 0
+            for ptrn in patterns:
+                postings = self.postings.setdefault(ptrn, {})
+                for symbol in postings.keys() - current.keys():
+                    del postings[symbol]
+            targets = current if universe is None else {symbol: current[symbol] for symbol in sorted(universe) if symbol in current}
+            for symbol, entry in targets.items():
+                version = (entry.mtime_ns, entry.size)
+                stale = [ptrn for ptrn in patterns
+                         if ptrn not in self.postings or symbol not in self.postings[ptrn]
+                         or self.postings[ptrn][symbol].version != version]
+                if not stale:
+                    continue
+                try:
+                    self._index_symbol(symbol, entry.path, stale, compute)
+                except Exception as e:
+                    logger.warning(f"Skipping {os.path.basename(entry.path)}: {e}")
+                    for ptrn in stale:
+                        self.postings[ptrn].pop(symbol, None)
+                    continue
+                changed += 1
+            if changed:
+                self.save()
+            return changed
+
+    def _index_symbol(self, symbol: str, file_path: str, patterns: List[str],
+                      compute: Optional[Callable[[pd.DataFrame, str], object]]) -> None:
+        df = OhlcvStore.read_csv(file_path)
+        source = df.attrs.get(DataFrameCache.SOURCE_ATTR)
+        version = tuple(source[2]) if source else ColumnarCache.file_version(file_path)
+        if df.empty or not all(col in df.columns for col in PatternIndex.REQUIRED_COLUMNS):
+            for ptrn in patterns:
+                self.postings[ptrn][symbol] = Posting(version, 0, [])
+            return
+        signals = PatternMatrix.signals(df, patterns, compute)
+        for ptrn in patterns:
+            recent = signals[ptrn][-self.recent_bars:]
+            hits = [(len(recent) - 1 - int(i), int(recent[i])) for i in np.flatnonzero(recent)]
+            self.postings[ptrn][symbol] = Posting(version, len(df), hits)
+
+    @staticmethod
+    def load(folder_path: str, interval: str, recent_bars: int) -> Dict[str, Dict[str, Posting]]:
+        """Postings of the persisted index, empty if there is none, it is unreadable or was built differently."""
+        try:
+            with open(PatternIndex.index_path(folder_path), "r") as f:
+                data = json.load(f)
+            if (data.get("interval"), data.get("recent_bars")) != (interval, recent_bars):
+                return {}
+            return {ptrn: {symbol: Posting(tuple(item["version"]), item["rows"], [tuple(hit) for hit in item["hits"]])
+                           for symbol, item in postings.items()}
+                    for ptrn, postings in data.get("patterns", {}).items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save(self) -> None:
+        data = {
+            "interval": self.interval,
+            "recent_bars": self.recent_bars,
+            "patterns": {ptrn: {symbol: {"version": list(posting.version), "rows": posting.rows,
+                                         "hits": [list(hit) for hit in posting.hits]}
+                                for symbol, posting in postings.items()}
+                         for ptrn, postings in self.postings.items()},
+        }
+        index_path = PatternIndex.index_path(self.folder_path)
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(index_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, index_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"PatternIndex: Could not write {index_path}: {e}")
+
+    @staticmethod
+    def clear() -> None:
+        """Forget the indexes opened by this process (the persisted files are kept)."""
+        with PatternIndex._lock:
+            PatternIndex._indexes.clear()
@@ -0,0 +1,195 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+import talib
+from loguru import logger
+from strategies.constants.candlestick_patterns import reverse_lookup
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.ohlcv_store import OhlcvStore
+from strategies.utils.config_loader import load_config
+
+def _talib_pattern(df: pd.DataFrame, pattern: str):
+    func = getattr(talib, pattern.upper())
+    return func(df["Open"], df["High"], df["Low"], df["Close"])
+
+class PatternMatrix:
+    """
+    Candlestick pattern signals of one CSV file version, as an int8 matrix (bars x patterns).
+
+    A cell is the sign of the talib CDL result: 1 bullish, -1 bearish, 0 no pattern.
+    Columns are filled the first time a pattern is asked for and kept in memory (LRU,
+    cache.pattern_matrix_bytes from config.yaml) and in "<interval>/.cache/patterns/",
+    so every pattern is computed once per data version across endpoints and pipeline steps.
+    """
+
+    PATTERNS: Tuple[str, ...] = tuple(sorted({name.upper() for name in reverse_lookup}))
+    COLUMNS: Dict[str, int] = {name: i for i, name in enumerate(PATTERNS)}
+    STORE_DIR = "patterns"
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    _matrices: "OrderedDict[str, PatternMatrix]" = OrderedDict()
+    _lock = threading.Lock()
+    _bytes = 0
+
+    def __init__(self, file_path: str, version: Tuple[int, int], values: np.ndarray, computed: np.ndarray):
+        self.file_path = file_path
+        self.version = tuple(version)
+        self.values = values
+        self.computed = computed
+        self._lock = threading.Lock()
+
+    @property
+    def rows(self) -> int:
+        return self.values.shape[0]
+
+    @staticmethod
+    def signals(df: pd.DataFrame, patterns: Iterable[str],
+                compute: Optional[Callable[[pd.DataFrame, str], object]] = None) -> Dict[str, np.ndarray]:
+        """
+        Signals of each pattern for the bars of df (the last len(df) bars of the file it was
+        read from). compute(df, pattern) returns the raw talib result and defaults to talib;
+        frames without a DataFrameCache source tag, and patterns outside PATTERNS, are
+        computed directly on df.
+        """
+        compute = compute or _talib_pattern
+        patterns = list(patterns)
+        known = [ptrn for ptrn in patterns if ptrn.upper() in PatternMatrix.COLUMNS]
+        matrix = PatternMatrix.for_frame(df, known, compute) if known else None
+
+        signals = {}
+        for ptrn in patterns:
+            if matrix is not None and ptrn.upper() in PatternMatrix.COLUMNS:
+                column = matrix.values[:, PatternMatrix.COLUMNS[ptrn.upper()]]
+                signals[ptrn] = column[matrix.rows - len(df):]
+            else:
+                signals[ptrn] = PatternMatrix._sign(compute(df, ptrn))
+        return signals
+
+    @staticmethod
+    def for_frame(df: pd.DataFrame, patterns: Iterable[str],
+                  compute: Callable[[pd.DataFrame, str], object]) -> Optional["PatternMatrix"]:
+        """The matrix of the file df was read from, with the given patterns filled; None if df is untagged or stale."""
+        source = df.attrs.get(DataFrameCache.SOURCE_ATTR)
+        if source is None:
+            return None
+        _, _, version, file_path = source
+        matrix = PatternMatrix.get(file_path, version)
+        missing = [ptrn for ptrn in patterns if matrix is None or not matrix.computed[PatternMatrix.COLUMNS[ptrn.upper()]]]
+        if not missing:
+            return matrix
+
+        full = OhlcvStore.read_csv(file_path)
+        if full.attrs.get(DataFrameCache.SOURCE_ATTR) != source or len(full) < len(df):
+            return None  # the file changed since df was read
+        if matrix is None:
+            matrix = PatternMatrix.empty(file_path, version, len(full))
+        matrix.fill(full, missing, compute)
+        PatternMatrix.put(matrix)
+        return matrix
+
+    @staticmethod
+    def empty(file_path: str, version: Tuple[int, int], rows: int) -> "PatternMatrix":
+        return PatternMatrix(file_path, version, np.zeros((rows, len(PatternMatrix.PATTERNS)), dtype=np.int8),
+                             np.zeros(len(PatternMatrix.PATTERNS), dtype=bool))
+
+    def fill(self, df: pd.DataFrame, patterns: Iterable[str], compute: Callable[[pd.DataFrame, str], object]) -> None:
+        """Compute the missing columns of patterns over the full frame of this version and persist them."""
+        with self._lock:
+            added = False
+            for ptrn in patterns:
+                column = PatternMatrix.COLUMNS[ptrn.upper()]
+                if self.computed[column]:
+                    continue
+                values = PatternMatrix._sign(compute(df, ptrn))
+                if len(values) != self.rows:
+                    raise ValueError(f"{ptrn} returned {len(values)} values for {self.rows} bars")
+                self.values[:, column] = values
+                self.computed[column] = True
+                added = True
+            if added:
+                self.save()
+
+    @staticmethod
+    def store_path(file_path: str) -> str:
+        folder_path, file_name = os.path.split(file_path)
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, PatternMatrix.STORE_DIR, f"{file_name}.npz")
+
+    @staticmethod
+    def get(file_path: str, version: Tuple[int, int]) -> Optional["PatternMatrix"]:
+        """The matrix of a file version from memory or disk, None if neither has it."""
+        version = tuple(version)
+        with PatternMatrix._lock:
+            matrix = PatternMatrix._matrices.get(file_path)
+            if matrix is not None and matrix.version == version:
+                PatternMatrix._matrices.move_to_end(file_path)
+                return matrix
+        matrix = PatternMatrix.load(file_path, version)
+        if matrix is not None:
+            PatternMatrix.put(matrix)
+        return matrix
+
+    @staticmethod
+    def load(file_path: str, version: Tuple[int, int]) -> Optional["PatternMatrix"]:
+        try:
+            with np.load(PatternMatrix.store_path(file_path), allow_pickle=False) as data:
+                meta = json.loads(str(data["__meta__"]))
+                if tuple(meta["version"]) != tuple(version) or meta["patterns"] != list(PatternMatrix.PATTERNS):
+                    return None
+                return PatternMatrix(file_path, version, data["values"].copy(), data["computed"].copy())
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self) -> None:
+        """Write the matrix atomically; failing to only costs a recompute in the next process."""
+        store_path = PatternMatrix.store_path(self.file_path)
+        meta = json.dumps({"version": list(self.version), "patterns": list(PatternMatrix.PATTERNS)})
+        try:
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(store_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, values=self.values, computed=self.computed, __meta__=np.array(meta))
+                os.replace(tmp_path, store_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"PatternMatrix: Could not write {store_path}: {e}")
+
+    @staticmethod
+    def put(matrix: "PatternMatrix") -> None:
+        max_bytes = PatternMatrix.max_bytes()
+        with PatternMatrix._lock:
+            previous = PatternMatrix._matrices.pop(matrix.file_path, None)
+            if previous is not None:
+                PatternMatrix._bytes -= previous.values.nbytes
+            if matrix.values.nbytes > max_bytes:
+                return
+            PatternMatrix._matrices[matrix.file_path] = matrix
+            PatternMatrix._bytes += matrix.values.nbytes
+            while PatternMatrix._bytes > max_bytes:
+                _, evicted = PatternMatrix._matrices.popitem(last=False)
+                PatternMatrix._bytes -= evicted.values.nbytes
+
+    @staticmethod
+    def clear() -> None:
+        """Drop the in-memory matrices (the persisted ones are kept)."""
+        with PatternMatrix._lock:
+            PatternMatrix._matrices.clear()
+            PatternMatrix._bytes = 0
+
+    @staticmethod
+    def max_bytes() -> int:
+        cache = load_config().get("cache") or {}
+        return int(cache.get("pattern_matrix_bytes", PatternMatrix.DEFAULT_MAX_BYTES))
+
+    @staticmethod
+    def _sign(result) -> np.ndarray:
+        values = np.asarray(result, dtype=np.float64)
+        return np.sign(np.nan_to_num(values)).astype(np.int8)
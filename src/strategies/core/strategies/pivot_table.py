@@ -0,0 +1,212 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+from strategies.core.data.columnar_cache import ColumnarCache
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.ohlcv_store import OhlcvStore
+
+class LatestPivots(NamedTuple):
+    """Levels of the last day of one daily CSV version, one row per method."""
+    version: Tuple[int, int]
+    levels: np.ndarray   # methods x levels, NaN without a previous day
+
+class PivotTable:
+    """
+    Daily pivot levels (PP, R1-R3, S1-S3) of every symbol of a "1d" folder, for every day.
+
+    Day t of a symbol holds the levels computed from day t-1's High, Low and Close, for the
+    classic, Fibonacci and Camarilla methods; the first day has none. A symbol is rebuilt
+    only when its daily CSV version changes. The full history is kept in
+    "1d/.cache/pivots/<file>.npz" and the last day of every symbol in memory, so the
+    intraday checks are a lookup instead of a read of each daily file.
+    """
+
+    INTERVAL = "1d"
+    METHODS = ("classic", "fibonacci", "camarilla")
+    LEVELS = ("PP", "R1", "S1", "R2", "S2", "R3", "S3")
+    STORE_DIR = "pivots"
+
+    _tables: Dict[str, "PivotTable"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, folder_path: str):
+        self.folder_path = folder_path
+        self._latest: Dict[str, LatestPivots] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get(folder_path: str) -> "PivotTable":
+        """Return the table of a daily folder, shared by the whole process."""
+        key = os.path.abspath(folder_path)
+        with PivotTable._lock:
+            table = PivotTable._tables.get(key)
+            if table is None:
+                table = PivotTable._tables[key] = PivotTable(folder_path)
+        return table
+
+    @staticmethod
+    def compute(high, low, close, method: str = "classic") -> np.ndarray:
+        """Levels (days x LEVELS) for the day after each given High, Low and Close."""
+        PivotTable._check(method)
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        pp = (high + low + close) / 3
+        span = high - low
+        if method == "classic":
+            r1, s1 = 2*pp - low, 2*pp - high
+            r2, s2 = pp + span, pp - span
+            r3, s3 = high + 2*(pp - low), low - 2*(high - pp)
+        elif method == "fibonacci":
+            r1, s1 = pp + 0.382*span, pp - 0.382*span
+            r2, s2 = pp + 0.618*span, pp - 0.618*span
+            r3, s3 = pp + span, pp - span
+        else:
+            r1, s1 = close + span*1.1/12, close - span*1.1/12
+            r2, s2 = close + span*1.1/6, close - span*1.1/6
+            r3, s3 = close + span*1.1/4, close - span*1.1/4
+        return np.stack([pp, r1, s1, r2, s2, r3, s3], axis=-1)
+
+    def file_path(self, symbol: str) -> str:
+        return os.path.join(self.folder_path, f"{PivotTable.INTERVAL}-{symbol}.csv")
+
+    def latest(self, symbol: str, method: str = "classic") -> Optional[Dict[str, float]]:
+        """
+        Levels of the symbol's last day, None if it has no daily file or a single day.
+        Errors reading the file (e.g. a KeyError for a missing column) are raised.
+        """
+        PivotTable._check(method)
+        entry = self._entry(symbol)
+        if entry is None:
+            return None
+        values = entry.levels[PivotTable.METHODS.index(method)]
+        if np.isnan(values).all():
+            return None
+        return {lvl: float(value) for lvl, value in zip(PivotTable.LEVELS, values)}
+
+    def levels(self, symbols: List[str], method: str = "classic") -> Dict[str, np.ndarray]:
+        """Last-day levels of each symbol as one array per level, NaN for the symbols without them."""
+        PivotTable._check(method)
+        column = PivotTable.METHODS.index(method)
+        values = np.full((len(symbols), len(PivotTable.LEVELS)), np.nan)
+        for row, symbol in enumerate(symbols):
+            try:
+                entry = self._entry(symbol)
+            except (KeyError, ValueError, IndexError) as e:
+                logger.debug(f"PivotTable: No pivots for {symbol}: {e}")
+                continue
+            if entry is not None:
+                values[row] = entry.levels[column]
+        return {lvl: values[:, i] for i, lvl in enumerate(PivotTable.LEVELS)}
+
+    def history(self, symbol: str, method: str = "classic") -> Optional[pd.DataFrame]:
+        """Levels of every day of a symbol, with its Timestamp column when the daily file has one."""
+        PivotTable._check(method)
+        file_path = self.file_path(symbol)
+        try:
+            version = ColumnarCache.file_version(file_path)
+        except OSError:
+            return None
+        stored = PivotTable.load(file_path, version)
+        if stored is None:
+            stored = self._build(file_path)
+        timestamps, levels, _ = stored
+        history = pd.DataFrame(levels[PivotTable.METHODS.index(method)], columns=list(PivotTable.LEVELS))
+        if timestamps is not None:
+            history.insert(0, "Timestamp", timestamps)
+        return history
+
+    def _entry(self, symbol: str) -> Optional[LatestPivots]:
+        file_path = self.file_path(symbol)
+        try:
+            version = ColumnarCache.file_version(file_path)
+        except OSError:
+            with self._lock:
+                self._latest.pop(symbol, None)
+            return None
+        with self._lock:
+            entry = self._latest.get(symbol)
+        if entry is not None and entry.version == version:
+            return entry
+
+        stored = PivotTable.load(file_path, version)
+        if stored is None:
+            stored = self._build(file_path)
+        _, levels, version = stored
+        if levels.shape[1]:
+            last = levels[:, -1, :]
+        else:
+            last = np.full((len(PivotTable.METHODS), len(PivotTable.LEVELS)), np.nan)
+        entry = LatestPivots(version, last)
+        with self._lock:
+            self._latest[symbol] = entry
+        return entry
+
+    def _build(self, file_path: str) -> Tuple[Optional[np.ndarray], np.ndarray, Tuple[int, int]]:
+        """Compute every day's levels of a daily file and persist them."""
+        df = OhlcvStore.read_csv(file_path)
+        source = df.attrs.get(DataFrameCache.SOURCE_ATTR)
+        version = tuple(source[2]) if source else ColumnarCache.file_version(file_path)
+        high, low, close = df["High"].to_numpy(), df["Low"].to_numpy(), df["Close"].to_numpy()
+        levels = np.full((len(PivotTable.METHODS), len(df), len(PivotTable.LEVELS)), np.nan)
+        for i, method in enumerate(PivotTable.METHODS):
+            levels[i, 1:] = PivotTable.compute(high[:-1], low[:-1], close[:-1], method)
+        timestamps = df["Timestamp"].astype(str).to_numpy(dtype=str) if "Timestamp" in df.columns else None
+        PivotTable.save(file_path, version, timestamps, levels)
+        return timestamps, levels, version
+
+    @staticmethod
+    def store_path(file_path: str) -> str:
+        folder_path, file_name = os.path.split(file_path)
+        return os.path.join(folder_path, ColumnarCache.CACHE_DIR, PivotTable.STORE_DIR, f"{file_name}.npz")
+
+    @staticmethod
+    def load(file_path: str, version: Tuple[int, int]) -> Optional[Tuple[Optional[np.ndarray], np.ndarray, Tuple[int, int]]]:
+        """(timestamps, levels, version) persisted for a file version, None if missing, unreadable or stale."""
+        try:
+            with np.load(PivotTable.store_path(file_path), allow_pickle=False) as data:
+                meta = json.loads(str(data["__meta__"]))
+                if (tuple(meta["version"]) != tuple(version) or meta["methods"] != list(PivotTable.METHODS)
+                        or meta["levels"] != list(PivotTable.LEVELS)):
+                    return None
+                timestamps = data["timestamps"].copy() if "timestamps" in data.files else None
+                return timestamps, data["levels"].copy(), tuple(version)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def save(file_path: str, version: Tuple[int, int], timestamps: Optional[np.ndarray], levels: np.ndarray) -> None:
+        """Write a symbol's levels atomically; failing to only costs a rebuild in the next process."""
+        store_path = PivotTable.store_path(file_path)
+        meta = json.dumps({"version": list(version), "methods": list(PivotTable.METHODS), "levels": list(PivotTable.LEVELS)})
+        arrays = {"levels": levels, "__meta__": np.array(meta)}
+        if timestamps is not None:
+            arrays["timestamps"] = timestamps
+        try:
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(store_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **arrays)
+                os.replace(tmp_path, store_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"PivotTable: Could not write {store_path}: {e}")
+
+    @staticmethod
+    def clear() -> None:
+        """Forget the tables opened by this process (the persisted levels are kept)."""
+        with PivotTable._lock:
+            PivotTable._tables.clear()
+
+    @staticmethod
+    def _check(method: str) -> None:
+        if method not in PivotTable.METHODS:
+            raise ValueError(f"method must be one of {PivotTable.METHODS}, got '{method}'")
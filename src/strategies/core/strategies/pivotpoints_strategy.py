@@ -1,50 +1,41 @@
 import os
+import numpy as np
 import pandas as pd
+from strategies.core.strategies.lookback import lookback
+from strategies.core.strategies.pivot_table import PivotTable
 from strategies.utils.config_loader import load_config
 
 class PivotPointsStrategy:
     @staticmethod
-    def _pivot_points(symbol: str) -> dict:
-        """
-        Calculate daily pivot points (PP, S1-S3, R1-R3) using the previous day's data.
-        Assumes df contains at least one full day of OHLC data.
-        """
+    def _table() -> PivotTable:
         directory = load_config().get("data").get("directory")
-        folder_path = os.path.join(directory, "1d")
-        full_file_name = os.path.join(folder_path, f"1d-{symbol}.csv")
-        if not os.path.exists(full_file_name):
-            return None
-        df = pd.read_csv(full_file_name)
-        prev_day = df.iloc[-2]
-        high, low, close = prev_day["High"], prev_day["Low"], prev_day["Close"]
+        return PivotTable.get(os.path.join(directory, PivotTable.INTERVAL))
 
-        pp = (high + low + close) / 3
-        r1 = 2*pp - low
-        s1 = 2*pp - high
-        r2 = pp + (high - low)
-        s2 = pp - (high - low)
-        r3 = high + 2*(pp - low)
-        s3 = low - 2*(high - pp)
-
-        return {"PP": pp, "R1": r1, "S1": s1, "R2": r2, "S2": s2, "R3": r3, "S3": s3}
+    @staticmethod
+    def _pivot_points(symbol: str, method: str = "classic") -> dict:
+        """
+        Daily pivot points (PP, S1-S3, R1-R3) of the last day, computed from the previous
+        day's data by the given method ("classic", "fibonacci" or "camarilla").
+        Looked up in the daily PivotTable, None if the symbol has no daily file or history.
+        """
+        return PivotPointsStrategy._table().latest(symbol, method)
 
     @staticmethod
-    def is_last_close_near_pivotpoints(df: pd.DataFrame, levels=None, tolerance=0.01) -> bool:
+    @lookback(lambda **_: 1)
+    def is_last_close_near_pivotpoints(df: pd.DataFrame, levels=None, tolerance=0.01, method="classic") -> bool:
         """
         Returns True if the latest close is near one of the specified pivot levels.
         levels = list of strings, e.g. ["PP","S1","R1"]
         tolerance = % distance allowed (e.g., 0.01 = 1%)
+        method = "classic", "fibonacci" or "camarilla"
         """
-        pivots = PivotPointsStrategy._pivot_points(df.iloc[0]["Symbol"])
+        pivots = PivotPointsStrategy._pivot_points(df.iloc[0]["Symbol"], method)
         if not pivots:
             return False
         latest_close = df["Close"].iloc[-1]
 
         # If no specific levels provided, check all
-        levels_to_check = levels if levels else pivots.keys()
-
-        for lvl in levels_to_check:
-            if lvl in pivots:
-                if abs(latest_close - pivots[lvl]) / latest_close <= tolerance:
-                    return True
-        return False
+        levels_to_check = [lvl for lvl in (levels if levels else pivots.keys()) if lvl in pivots]
+        values = np.array([pivots[lvl] for lvl in levels_to_check], dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            return bool((np.abs(latest_close - values) / latest_close <= tolerance).any())
@@ -1,77 +1,62 @@
-from scipy.signal import argrelextrema
 import talib as ta
 import numpy as np
 import pandas as pd
+from strategies.core.strategies.divergence import Divergence
+from strategies.core.strategies.incremental_indicators import IncrementalRsi
+from strategies.core.strategies.indicator_cache import IndicatorCache
+from strategies.core.strategies.lookback import WARMUP_PERIODS, lookback, min_bars
 
 class RsiStrategy:
     @staticmethod
+    @lookback(lambda period, duration, **_: duration + period * WARMUP_PERIODS)
+    @min_bars(lambda period, duration, **_: max(period, duration))
     def is_rsi_overbought(df: pd.DataFrame, period: int = 14, overbought: int = 70, duration: int = 12) -> bool:
         if (len(df) < period) or (len(df) < duration):
             return False
-        rsi = ta.RSI(df["Close"], timeperiod=period)
+        rsi = IndicatorCache.get(df, "RSI", (period,), lambda: ta.RSI(df["Close"], timeperiod=period),
+                                 lambda: IncrementalRsi(period))
         duration = min(duration, len(df))
         return np.any(rsi[-duration:] >= overbought)
     
     @staticmethod
+    @lookback(lambda period, duration, **_: duration + period * WARMUP_PERIODS)
+    @min_bars(lambda period, duration, **_: max(period, duration))
     def is_rsi_oversold(df: pd.DataFrame, period: int = 14, oversold: int = 30, duration: int = 12) -> bool:
         if (len(df) < period) or (len(df) < duration):
             return False
-        rsi = ta.RSI(df["Close"], timeperiod=period)
+        rsi = IndicatorCache.get(df, "RSI", (period,), lambda: ta.RSI(df["Close"], timeperiod=period),
+                                 lambda: IncrementalRsi(period))
         duration = min(duration, len(df))
         return np.any(rsi[-duration:] <= oversold)
 
     @staticmethod
-    def is_rsi_bullish_divergence(df: pd.DataFrame, period: int = 14, duration: int = 12) -> bool:
-        if (len(df) < period) or (len(df) < duration):
-            return False
-        rsi = ta.RSI(df["Close"], timeperiod=period)
-        duration = min(duration, len(df))
-        prices = df["Close"][-duration:].values
-        rsi_window = rsi[-duration:].values
-        
-        # Detect pivot lows (local minima)
-        pivot_indices = argrelextrema(prices, np.less)[0]
+    @lookback(lambda period, duration, **_: duration + period * WARMUP_PERIODS)
+    @min_bars(lambda period, duration, **_: max(period, duration))
+    def is_rsi_bullish_divergence(df: pd.DataFrame, period: int = 14, duration: int = 12, order: int = 1) -> bool:
+        # Price lower low, RSI higher low, between two pivot lows of the last duration bars
+        return RsiStrategy._has_divergence(df, "bullish", period, duration, order)
 
-        if len(pivot_indices) < 2:
-            return False  # Not enough pivots to check divergence
-
-        # Check all pairs of pivots
-        for i in range(len(pivot_indices) - 1):
-            i1 = pivot_indices[i]
-            i2 = pivot_indices[i + 1]
-            p1, p2 = prices[i1], prices[i2]
-            rsi1, rsi2 = rsi_window[i1], rsi_window[i2]
+    @staticmethod
+    @lookback(lambda period, duration, **_: duration + period * WARMUP_PERIODS)
+    @min_bars(lambda period, duration, **_: max(period, duration))
+    def is_rsi_bearish_divergence(df: pd.DataFrame, period: int = 14, duration: int = 12, order: int = 1) -> bool:
+        # Price higher high, RSI lower high, between two pivot highs of the last duration bars
+        return RsiStrategy._has_divergence(df, "bearish", period, duration, order)
 
-            # Bullish divergence: price lower low, RSI higher low
-            if p2 < p1 and rsi2 > rsi1:
-                return True
+    @staticmethod
+    def rsi_divergences(df: pd.DataFrame, kind: str = "bullish", period: int = 14, window: int = 12, order: int = 1) -> np.ndarray:
+        """Divergence events at every bar of the series, each over the window bars ending there."""
+        rsi = IndicatorCache.get(df, "RSI", (period,), lambda: ta.RSI(df["Close"], timeperiod=period),
+                                 lambda: IncrementalRsi(period))
+        return Divergence.events(df["Close"].to_numpy(), np.asarray(rsi, dtype=np.float64), kind, order, window)
 
-        return False
-    
     @staticmethod
-    def is_rsi_bearish_divergence(df: pd.DataFrame, period: int = 14, duration: int = 12) -> bool:
+    def _has_divergence(df: pd.DataFrame, kind: str, period: int, duration: int, order: int) -> bool:
         if (len(df) < period) or (len(df) < duration):
             return False
-        rsi = ta.RSI(df["Close"], timeperiod=period)
+        rsi = IndicatorCache.get(df, "RSI", (period,), lambda: ta.RSI(df["Close"], timeperiod=period),
+                                 lambda: IncrementalRsi(period))
         duration = min(duration, len(df))
-        prices = df["Close"][-duration:].values
-        rsi_window = rsi[-duration:].values
-
-        # Detect pivot highs (local maxima)
-        pivot_indices = argrelextrema(prices, np.greater)[0]
-
-        if len(pivot_indices) < 2:
-            return False  # Not enough pivots to check divergence
-
-        # Check all pairs of consecutive pivots
-        for i in range(len(pivot_indices) - 1):
-            i1 = pivot_indices[i]
-            i2 = pivot_indices[i + 1]
-            p1, p2 = prices[i1], prices[i2]
-            rsi1, rsi2 = rsi_window[i1], rsi_window[i2]
-
-            # Bearish divergence: price higher high, RSI lower high
-            if p2 > p1 and rsi2 < rsi1:
-                return True
-
-        return False
\ No newline at end of file
+        prices = df["Close"].to_numpy()[-duration:]
+        rsi_window = np.asarray(rsi, dtype=np.float64)[-duration:]
+        return bool(Divergence.events(prices, rsi_window, kind, order, duration)[-1])
@@ -1,13 +1,51 @@
 import os
-import pandas as pd
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+import numpy as np
 from loguru import logger
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.ohlcv_store import OhlcvStore
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.data.symbol_stats import SymbolStatsTable
+from strategies.core.data.symbol_universe import SymbolUniverse
+from strategies.core.pipeline_jobs import PipelineJob, PipelineJobs
+from strategies.core.pipeline_planner import PipelinePlanner
+from strategies.core.pipeline_result_cache import PipelineResultCache
+from strategies.core.standing_pipeline import StandingPipelines, StandingResult
 from strategies.core.strategies.bollingerbands_strategy import BollingerBandsStrategy
 from strategies.core.strategies.candlestick_patterns_strategy import CandlestickPatternsStrategy
 from strategies.core.strategies.macd_strategy import MacdStrategy
+from strategies.core.strategies.panel import Panel
+from strategies.core.strategies.panel_strategies import PanelStrategies
 from strategies.core.strategies.pivotpoints_strategy import PivotPointsStrategy
 from strategies.core.strategies.rsi_strategy import RsiStrategy
 from strategies.utils.config_loader import load_config
 from strategies.core.strategies.failed_breakout_strategy import FailedBreakoutStrategy
+from strategies.core.strategies.kernels import Kernels
+from strategies.core.strategies.lookback import required_bars, required_min_bars
+
+class PipelineStep(NamedTuple):
+    """A pipeline step as sent to the pool workers."""
+    strategy: str
+    interval: str
+    params: Optional[dict]
+
+# pipeline of the current pool worker process, set up once by _init_worker
+_worker_pipeline = None
+
+def _init_worker(directory):
+    # module level so the pool can run it in every worker; importing this module already loaded talib and pandas
+    global _worker_pipeline
+    _worker_pipeline = StrategyPipeline(directory)
+    Kernels.warm_up()
+
+def _evaluate_chunk(symbols, steps, lookbacks):
+    return _worker_pipeline.evaluate(symbols, steps, lookbacks)
+
+def _ping():
+    return os.getpid()
 
 class StrategyPipeline:
     # Map strategy names to functions
@@ -27,26 +65,240 @@ class StrategyPipeline:
         "is_failed_brbo": FailedBreakoutStrategy.is_failed_brbo,
     }
 
+    # Vectorized counterparts evaluating a step for all symbols at once, keyed by the per-symbol function
+    PANEL_MAP = {
+        BollingerBandsStrategy.is_near_lower_bb: PanelStrategies.is_near_lower_bb,
+        BollingerBandsStrategy.is_near_upper_bb: PanelStrategies.is_near_upper_bb,
+        MacdStrategy.is_bullish_macd_crossover: PanelStrategies.is_bullish_macd_crossover,
+        MacdStrategy.is_bearish_macd_crossover: PanelStrategies.is_bearish_macd_crossover,
+        PivotPointsStrategy.is_last_close_near_pivotpoints: PanelStrategies.is_last_close_near_pivotpoints,
+        RsiStrategy.is_rsi_overbought: PanelStrategies.is_rsi_overbought,
+        RsiStrategy.is_rsi_oversold: PanelStrategies.is_rsi_oversold,
+        RsiStrategy.is_rsi_bullish_divergence: PanelStrategies.is_rsi_bullish_divergence,
+        RsiStrategy.is_rsi_bearish_divergence: PanelStrategies.is_rsi_bearish_divergence,
+    }
+
     INTERVAL = "1d"
+    EXECUTORS = ("serial", "process")
+    CHUNKS_PER_WORKER = 4
 
-    def __init__(self):
-        self.symbols = []
-        self.directory = load_config().get("data").get("directory")
-        folder_path = os.path.join(self.directory, StrategyPipeline.INTERVAL)
-        # select only files with format "<INTERVAL>-<symbol>.csv"
-        for filename in os.listdir(folder_path):
-            if filename.startswith(StrategyPipeline.INTERVAL + "-") and filename.endswith(".csv"):
-                self.symbols.append(filename[len(StrategyPipeline.INTERVAL) + 1 : -4])
+    _pool = None
+    _pool_key = None
+    _pool_lock = threading.Lock()
 
-    def load_data(self, symbol, interval):
-        folder_path = os.path.join(self.directory, interval)
-        full_file_name = os.path.join(folder_path, f"{interval}-{symbol}.csv")
+    def __init__(self, directory=None):
+        self.directory = directory or load_config().get("data").get("directory")
+        self.folder_path = os.path.join(self.directory, StrategyPipeline.INTERVAL)
+        # fail early on a missing data folder
+        SymbolCatalog.get(self.folder_path, StrategyPipeline.INTERVAL)
+
+    @property
+    def symbols(self):
+        """Symbols of the "<INTERVAL>-<symbol>.csv" files, refreshed from the catalog on every access."""
+        return SymbolCatalog.get(self.folder_path, StrategyPipeline.INTERVAL).symbols()
+
+    def universe(self, scope=None):
+        """The symbols a request scans: all of them, or those within its scope (see SymbolUniverse)."""
+        symbols = self.symbols
+        if not SymbolUniverse.is_scoped(scope):
+            return symbols
+        scoped = SymbolUniverse.resolve(symbols, scope)
+        logger.info(f"StrategyPipeline: Scope {SymbolUniverse.describe(scope)} selects {len(scoped)} of {len(symbols)} symbols")
+        return scoped
+
+    @staticmethod
+    def universe_key(symbols, scope=None):
+        """What the cached result of a scoped request is keyed on besides its steps and filters: the symbols it scans."""
+        return sorted(symbols) if SymbolUniverse.is_scoped(scope) else None
+
+    def load_data(self, symbol, interval, last_rows=None):
+        """Load a symbol's bars for an interval, only the last `last_rows` of them when given."""
+        full_file_name = os.path.join(self.directory, interval, f"{interval}-{symbol}.csv")
         if not os.path.exists(full_file_name):
             return None
-        df = pd.read_csv(full_file_name)
-        return df
+        # zero-copy views of the packed store while it is current for this symbol
+        return OhlcvStore.read_csv(full_file_name, last_rows=last_rows)
+
+    @staticmethod
+    def lookbacks(strategies) -> dict:
+        """
+        Trailing bars each interval of the pipeline needs: the largest lookback declared by
+        its steps, or None when any of them needs the full history.
+        """
+        lookbacks = {}
+        for item in strategies:
+            strategy_func = StrategyPipeline.STRATEGY_MAP.get(item.strategy)
+            bars = required_bars(strategy_func, item.params) if strategy_func else None
+            if item.interval not in lookbacks:
+                lookbacks[item.interval] = bars
+            elif lookbacks[item.interval] is not None:
+                lookbacks[item.interval] = None if bars is None else max(bars, lookbacks[item.interval])
+        return lookbacks
 
-    def run_pipeline(self, strategies):
+    def prefilter(self, symbols, strategies, filters=None):
+        """
+        Drop the symbols ruled out before any series is loaded: those with fewer bars than a
+        step can ever pass on (see lookback.min_bars) or no data for such a step's interval,
+        from the row counts of the symbol catalogs, and those failing one of the request's
+        filters, from the per-interval stats tables (only consulted when there are filters).
+        """
+        min_bars = {}
+        for item in strategies:
+            strategy_func = StrategyPipeline.STRATEGY_MAP.get(item.strategy)
+            bars = required_min_bars(strategy_func, item.params) if strategy_func else 0
+            if bars:
+                min_bars[item.interval] = max(bars, min_bars.get(item.interval, 0))
+        filters = list(filters or [])
+        catalogs = {}
+        for interval in min_bars:
+            folder_path = os.path.join(self.directory, interval)
+            if os.path.isdir(folder_path):
+                catalogs[interval] = SymbolCatalog.get(folder_path, interval)
+        tables = {}
+        for interval in {flt.interval for flt in filters}:
+            folder_path = os.path.join(self.directory, interval)
+            if os.path.isdir(folder_path):
+                # only the stats of the symbols being screened are brought up to date
+                tables[interval] = SymbolStatsTable.get(folder_path, interval, symbols)
+
+        selected = []
+        for symbol in symbols:
+            if (all(StrategyPipeline._has_bars(catalog.entry(symbol), min_bars[interval])
+                    for interval, catalog in catalogs.items()) and
+                    all(StrategyPipeline._passes(table.stats(symbol), [flt for flt in filters if flt.interval == interval])
+                        for interval, table in tables.items())):
+                selected.append(symbol)
+        if len(selected) < len(symbols):
+            logger.info(f"StrategyPipeline: Stats tables ruled out {len(symbols) - len(selected)} of {len(symbols)} symbols")
+        return selected
+
+    @staticmethod
+    def _has_bars(entry, min_bars) -> bool:
+        return entry is not None and entry.rows >= min_bars
+
+    @staticmethod
+    def _passes(stats, filters) -> bool:
+        if stats is None:
+            return False
+        for flt in filters:
+            if getattr(flt, "min_bars", None) is not None and stats.bars < flt.min_bars:
+                return False
+            if getattr(flt, "min_avg_volume", None) is not None and (stats.avg_volume is None or stats.avg_volume < flt.min_avg_volume):
+                return False
+            if getattr(flt, "min_last_close", None) is not None and (stats.last_close is None or stats.last_close < flt.min_last_close):
+                return False
+            if getattr(flt, "max_last_close", None) is not None and (stats.last_close is None or stats.last_close > flt.max_last_close):
+                return False
+            if getattr(flt, "min_last_timestamp", None) is not None and (stats.last_timestamp is None or stats.last_timestamp < flt.min_last_timestamp):
+                return False
+        return True
+
+    @staticmethod
+    def panel_enabled() -> bool:
+        pipeline = load_config().get("pipeline") or {}
+        return bool(pipeline.get("panel", True))
+
+    def load_panel(self, symbols, interval, last_rows=None) -> Panel:
+        """Panel of the symbols with data for an interval; those without, or failing to load, are left out."""
+        frames = {}
+        for symbol in symbols:
+            try:
+                df = self.load_data(symbol, interval, last_rows)
+            except Exception as e:
+                logger.warning(f"Skipping {symbol}: {e}")
+                continue
+            if df is not None:
+                frames[symbol] = df
+        return Panel.from_frames(frames)
+
+    def screen_panels(self, symbols, strategies, lookbacks):
+        """
+        Evaluate the steps with a PANEL_MAP kernel for all symbols at once, in pipeline order,
+        each on the symbols that passed the previous ones. Returns the passing symbols and the
+        steps left for the per-symbol loop; a kernel that fails hands its step back to it.
+        """
+        if not StrategyPipeline.panel_enabled():
+            return symbols, list(strategies)
+        remaining = []
+        panels = {}
+        for item in strategies:
+            strategy_func = StrategyPipeline.STRATEGY_MAP.get(item.strategy)
+            kernel = StrategyPipeline.PANEL_MAP.get(strategy_func)
+            if kernel is None or not symbols:
+                remaining.append(item)
+                continue
+            started = time.perf_counter()
+            if item.interval not in panels:
+                last_rows = lookbacks.get(item.interval)
+                if last_rows is None:
+                    last_rows = required_bars(strategy_func, item.params)
+                panels[item.interval] = self.load_panel(symbols, item.interval, last_rows)
+            panel = panels[item.interval]
+            panel = panel.select(np.isin(panel.symbols, symbols))
+            try:
+                passed = kernel(panel, **item.params) if item.params else kernel(panel)
+            except Exception as e:
+                logger.warning(f"StrategyPipeline: Evaluating {item.strategy} per symbol, its panel kernel failed: {e}")
+                remaining.append(item)
+                continue
+            evaluated = len(symbols)
+            symbols = [symbol for symbol, ok in zip(panel.symbols, passed) if ok]
+            PipelinePlanner.record(item, evaluated, len(symbols), time.perf_counter() - started)
+        return symbols, remaining
+
+    def build_store(self, interval) -> str:
+        """Pack all CSV files of an interval into its memory-mapped OHLCV store."""
+        folder_path = os.path.join(self.directory, interval)
+        if not os.path.isdir(folder_path):
+            raise FileNotFoundError(f"Directory '{folder_path}' does not exist")
+        store = OhlcvStore.build(folder_path, interval)
+        message = f"Built {interval} OHLCV store with {len(store.symbols())} symbols"
+        logger.info(message)
+        return message
+
+    @staticmethod
+    def intervals(strategies, filters=None) -> set:
+        """Intervals a run reads: those of its steps and filters, and INTERVAL for the universe and daily pivots."""
+        return {item.interval for item in strategies} | {flt.interval for flt in (filters or [])} | {StrategyPipeline.INTERVAL}
+
+    def data_versions(self, intervals):
+        """
+        (interval, catalog fingerprint) of each interval folder, None for a missing folder. Reads
+        the polled catalogs, so within catalog.refresh_seconds it does not stat any file.
+        """
+        versions = []
+        for interval in sorted(intervals):
+            folder_path = os.path.join(self.directory, interval)
+            fingerprint = SymbolCatalog.get(folder_path, interval).fingerprint() if os.path.isdir(folder_path) else None
+            versions.append((interval, fingerprint))
+        return tuple(versions)
+
+    def symbol_versions(self, symbols, intervals):
+        """(mtime, size) of each symbol's file on every interval, in sorted interval order, None where it has none."""
+        entries = []
+        for interval in sorted(intervals):
+            folder_path = os.path.join(self.directory, interval)
+            entries.append(SymbolCatalog.get(folder_path, interval) if os.path.isdir(folder_path) else None)
+        versions = {}
+        for symbol in symbols:
+            version = []
+            for catalog in entries:
+                entry = catalog.entry(symbol) if catalog is not None else None
+                version.append((entry.mtime_ns, entry.size) if entry is not None else None)
+            versions[symbol] = tuple(version)
+        return versions
+
+    def invalidate_results(self, interval=None) -> int:
+        """Drop the cached pipeline results that read an interval, or all of them."""
+        dropped = PipelineResultCache.invalidate(interval)
+        logger.info(f"StrategyPipeline: Invalidated {dropped} cached results for interval:{interval or 'all'}")
+        return dropped
+
+    def cache_stats(self) -> dict:
+        """Counters of the process-wide DataFrame cache the pipeline reads through."""
+        return DataFrameCache.stats()
+
+    def run_pipeline(self, strategies, filters=None, scope=None):
         """
         {
             "strategies": [
@@ -59,32 +311,289 @@ class StrategyPipeline:
                 {"strategy":"is_failed_bo","interval":"5min"},
                 {"strategy":"is_failed_blbo","interval":"5min"},
                 {"strategy":"is_failed_brbo","interval":"5min"},
-            ]
+            ],
+            "filters": [
+                {"interval":"1d","min_bars":60,"min_avg_volume":100000,"min_last_timestamp":"2024-01-02"},
+            ],
+            "scope": {"universe":"watchlist","glob":"A*"}
         }
         """
-        valid_symbols = []
-        df = pd.DataFrame.empty
-        for symbol in self.symbols:
+        symbols = self.universe(scope)
+        key, intervals, versions, cached = self.cached_result(strategies, filters, StrategyPipeline.universe_key(symbols, scope))
+        if cached is not None:
+            logger.info(f"Found {len(cached)} cached symbols for strategies:'{strategies}'")
+            return cached
+
+        valid_symbols = self.screen(symbols, strategies, filters)
+        if key is not None:
+            PipelineResultCache.put(key, valid_symbols, intervals, versions)
+        logger.info(f"Found {len(valid_symbols)} symbols for strategies:'{strategies}'")
+        return valid_symbols
+
+    def stream_pipeline(self, strategies, filters=None, scope=None):
+        """
+        Like run_pipeline, but yield {"symbol": symbol} for each match as soon as it passes,
+        then one {"summary": {...}} record with the number of matches, the elapsed seconds and
+        whether they came from the result cache. The scope is resolved on the call, so an
+        unknown universe raises before the first record.
+        """
+        symbols = self.universe(scope)
+        return self._stream(symbols, strategies, filters, scope)
+
+    def _stream(self, symbols, strategies, filters, scope):
+        started = time.perf_counter()
+        key, intervals, versions, cached = self.cached_result(strategies, filters, StrategyPipeline.universe_key(symbols, scope))
+        if cached is not None:
+            matches = cached
+            for symbol in matches:
+                yield {"symbol": symbol}
+        else:
+            matches = []
+            for symbol in self.iter_screen(symbols, strategies, filters):
+                matches.append(symbol)
+                yield {"symbol": symbol}
+            if key is not None:
+                PipelineResultCache.put(key, matches, intervals, versions)
+        logger.info(f"Streamed {len(matches)} symbols for strategies:'{strategies}'")
+        yield {"summary": {"message": f"Returns {len(matches)} symbols for strategies:{strategies}",
+                           "matches": len(matches), "elapsed_seconds": time.perf_counter() - started,
+                           "cached": cached is not None}}
+
+    def cached_result(self, strategies, filters=None, universe=None):
+        """
+        (key, intervals, versions, symbols) of a request in the result cache: symbols is None on a
+        miss, key is None when the cache is disabled. universe is the universe_key of a scoped request.
+        """
+        intervals = StrategyPipeline.intervals(strategies, filters)
+        if not PipelineResultCache.enabled():
+            return None, intervals, None, None
+        key = PipelineResultCache.fingerprint(strategies, filters, universe, os.path.abspath(self.directory))
+        _, _, verify = PipelineResultCache.settings()
+        versions = self.data_versions(intervals) if verify else None
+        return key, intervals, versions, PipelineResultCache.get(key, versions)
+
+    def submit_job(self, strategies, filters=None, scope=None) -> PipelineJob:
+        """
+        Queue a run_pipeline of the request on the background job workers and return its job,
+        to poll for progress and the result. Raises JobQueueFullError when the queue is full.
+        The scope is resolved before queueing, so an unknown universe raises here.
+        """
+        symbols = self.universe(scope)
+        job = PipelineJobs.submit(lambda job: self.run_job(job, strategies, filters, scope, symbols))
+        logger.info(f"StrategyPipeline: Queued job {job.id} for strategies:'{strategies}'")
+        return job
+
+    def run_job(self, job: PipelineJob, strategies, filters=None, scope=None, symbols=None):
+        """
+        Run a request for a job, counting finished symbols and matches on it as the scan goes.
+        symbols is the already resolved universe of the scope.
+        """
+        if symbols is None:
+            symbols = self.universe(scope)
+        key, intervals, versions, cached = self.cached_result(strategies, filters, StrategyPipeline.universe_key(symbols, scope))
+        job.total = len(symbols)
+        if cached is not None:
+            job.done = job.total
+            job.cached = True
+            for symbol in cached:
+                job.add_match(symbol)
+            return cached
+        for symbol in self.iter_screen(symbols, strategies, filters, progress=job.advance):
+            job.add_match(symbol)
+        matches = job.matches
+        if key is not None and not job.cancelled:
+            PipelineResultCache.put(key, matches, intervals, versions)
+        return matches
+
+    def job(self, job_id) -> PipelineJob:
+        """A queued, running or recently finished job; raises KeyError for an unknown one."""
+        return PipelineJobs.get(job_id)
+
+    def cancel_job(self, job_id) -> PipelineJob:
+        job = PipelineJobs.cancel(job_id)
+        logger.info(f"StrategyPipeline: Cancelled job {job_id} in state {job.state}")
+        return job
+
+    def run_standing(self, strategies, filters=None, scope=None) -> StandingResult:
+        """
+        Run a request as a standing pipeline: only the symbols that are new or have a changed
+        file on one of the request's intervals are evaluated, the others keep their last
+        result. Returns the merged match set and the symbols added to or removed from it.
+        """
+        symbols = self.universe(scope)
+        # keyed on the scope itself: symbols entering or leaving it are handled like files added or removed
+        state = StandingPipelines.get(PipelineResultCache.fingerprint(strategies, filters, SymbolUniverse.definition(scope),
+                                                                      os.path.abspath(self.directory)))
+        with state.lock:
+            versions = self.symbol_versions(symbols, StrategyPipeline.intervals(strategies, filters))
+            changed = state.changed(versions)
+            passed = set(self.screen(changed, strategies, filters)) if changed else set()
+            result = state.update(versions, changed, passed)
+        logger.info(f"StrategyPipeline: Standing pipeline re-evaluated {result.evaluated} of {len(versions)} symbols, "
+                    f"{len(result.symbols)} match (+{len(result.added)} -{len(result.removed)})")
+        return result
+
+    def screen(self, symbols, strategies, filters=None):
+        """The symbols, in the given order, passing every filter and step of a request."""
+        return list(self.iter_screen(symbols, strategies, filters))
+
+    def iter_screen(self, symbols, strategies, filters=None, progress=None):
+        """
+        Yield the symbols passing every filter and step of a request, in order, each as soon as it has.
+        progress, when given, is called with the number of symbols newly finished as the scan goes.
+        """
+        lookbacks = StrategyPipeline.lookbacks(strategies)
+        # every step must pass, so running the cheapest and most selective ones first gives the same symbols
+        plan = PipelinePlanner.plan(strategies)
+        logger.info(f"StrategyPipeline: Plan {PipelinePlanner.describe(plan)}")
+        total = len(symbols)
+        symbols = self.prefilter(symbols, strategies, filters)
+        symbols, remaining = self.screen_panels(symbols, [step.item for step in plan], lookbacks)
+        if progress is not None:
+            progress(total - len(symbols))
+        counts = [[0, 0, 0.0] for _ in remaining]   # evaluated, passed, seconds of each step
+        try:
+            yield from self.iter_symbols(symbols, remaining, lookbacks, counts, progress)
+        finally:
+            for item, (evaluated, passed, seconds) in zip(remaining, counts):
+                PipelinePlanner.record(item, evaluated, passed, seconds)
+
+    def evaluate_symbols(self, symbols, steps, lookbacks):
+        """
+        Run the steps on each symbol. Returns the passing symbols, in the given order, and the
+        [evaluated, passed, seconds] of every step.
+        """
+        counts = [[0, 0, 0.0] for _ in steps]
+        return list(self.iter_symbols(symbols, steps, lookbacks, counts)), counts
+
+    def iter_symbols(self, symbols, steps, lookbacks, counts, progress=None):
+        """
+        Yield the symbols passing every step, in the given order, running them on the process
+        pool in chunks when pipeline.executor is "process". Adds the evaluated, passed and
+        seconds of every step to counts, and reports finished symbols to progress.
+        """
+        executor, workers = StrategyPipeline.parallel_settings()
+        if executor != "process" or len(symbols) < 2 or not steps:
+            yield from self.iter_evaluate(symbols, steps, lookbacks, counts, progress=progress)
+            return
+
+        steps = [PipelineStep(item.strategy, item.interval, item.params) for item in steps]
+        size = -(-len(symbols) // min(len(symbols), workers * StrategyPipeline.CHUNKS_PER_WORKER))
+        chunks = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+        pool = self.pool(workers)
+        futures = [pool.submit(_evaluate_chunk, chunk, steps, lookbacks) for chunk in chunks]
+        try:
+            for chunk, future in zip(chunks, futures):
+                try:
+                    chunk_valid, chunk_counts, errors = future.result()
+                except Exception as e:
+                    # a worker died or the chunk could not be sent: evaluate it here instead
+                    logger.warning(f"StrategyPipeline: Evaluating {len(chunk)} symbols in process, the pool failed: {e}")
+                    StrategyPipeline.shutdown_pool()
+                    chunk_valid, chunk_counts, errors = self.evaluate(chunk, steps, lookbacks)
+                StrategyPipeline._log_errors(errors)
+                for count, chunk_count in zip(counts, chunk_counts):
+                    for i in range(3):
+                        count[i] += chunk_count[i]
+                if progress is not None:
+                    progress(len(chunk))
+                yield from chunk_valid
+        finally:
+            # the consumer stopped early: drop the chunks not started yet
+            for future in futures:
+                future.cancel()
+
+    def evaluate(self, symbols, steps, lookbacks):
+        """
+        Run the steps on each symbol in turn, stopping at its first failing step.
+        Returns the passing symbols, the [evaluated, passed, seconds] of every step and the
+        (symbol, error) of the symbols skipped because loading or a step raised.
+        """
+        counts = [[0, 0, 0.0] for _ in steps]
+        errors = []
+        valid_symbols = list(self.iter_evaluate(symbols, steps, lookbacks, counts, errors))
+        return valid_symbols, counts, errors
+
+    def iter_evaluate(self, symbols, steps, lookbacks, counts, errors=None, progress=None):
+        """
+        Yield each symbol passing all steps as soon as it has, adding to the [evaluated, passed,
+        seconds] counts of every step and calling progress(1) after each symbol. A symbol whose
+        loading or step raises is skipped: the error is appended to errors when given, logged otherwise.
+        """
+        for symbol in symbols:
             passed = True
-            prior_interval = ""
+            frames = {}
             try:
-                for item in strategies:
+                for item, count in zip(steps, counts):
+                    started = time.perf_counter()
+                    count[0] += 1
                     strategy_func = StrategyPipeline.STRATEGY_MAP[item.strategy]
-                    if prior_interval != item.interval:
-                        df = self.load_data(symbol, item.interval)
-                        prior_interval = item.interval
+                    if item.interval not in frames:
+                        frames[item.interval] = self.load_data(symbol, item.interval, lookbacks[item.interval])
+                    df = frames[item.interval]
                     if df is None:
+                        count[2] += time.perf_counter() - started
                         passed = False
                         break
 
                     result = strategy_func(df, **item.params) if item.params else strategy_func(df)
+                    count[2] += time.perf_counter() - started
                     if not result:
                         passed = False
                         break
-
-                if passed:
-                    valid_symbols.append(symbol)
+                    count[1] += 1
             except Exception as e:
-                logger.warning(f"Skipping {symbol}: {e}")        
-        logger.info(f"Found {len(valid_symbols)} symbols for strategies:'{strategies}'")
-        return valid_symbols
+                if errors is None:
+                    StrategyPipeline._log_errors([(symbol, str(e))])
+                else:
+                    errors.append((symbol, str(e)))
+                passed = False
+            if progress is not None:
+                progress(1)
+            if passed:
+                yield symbol
+
+    @staticmethod
+    def _log_errors(errors) -> None:
+        for symbol, error in errors:
+            logger.warning(f"Skipping {symbol}: {error}")
+
+    @staticmethod
+    def parallel_settings():
+        """(executor, workers) of the per-symbol loop from the pipeline config section."""
+        pipeline = load_config().get("pipeline") or {}
+        executor = pipeline.get("executor") or "serial"
+        if executor not in StrategyPipeline.EXECUTORS:
+            raise ValueError(f"Unknown pipeline executor '{executor}', expected one of {StrategyPipeline.EXECUTORS}")
+        workers = int(pipeline.get("workers") or 0) or os.cpu_count() or 1
+        return executor, workers
+
+    def pool(self, workers) -> ProcessPoolExecutor:
+        """The warm process pool of this data directory, started on first use and kept between runs."""
+        key = (os.path.abspath(self.directory), workers)
+        with StrategyPipeline._pool_lock:
+            if StrategyPipeline._pool is None or StrategyPipeline._pool_key != key:
+                if StrategyPipeline._pool is not None:
+                    StrategyPipeline._pool.shutdown(wait=False, cancel_futures=True)
+                StrategyPipeline._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                             initargs=(self.directory,))
+                StrategyPipeline._pool_key = key
+            return StrategyPipeline._pool
+
+    def warm_up_pool(self) -> int:
+        """Start the pool workers now rather than on the first request. Returns their number, 0 when serial."""
+        executor, workers = StrategyPipeline.parallel_settings()
+        if executor != "process":
+            return 0
+        started = time.perf_counter()
+        self.pool(workers).submit(_ping).result()
+        logger.info(f"StrategyPipeline: Started {workers} pipeline workers in {time.perf_counter() - started:.2f}s")
+        return workers
+
+    @staticmethod
+    def shutdown_pool() -> None:
+        with StrategyPipeline._pool_lock:
+            if StrategyPipeline._pool is not None:
+                StrategyPipeline._pool.shutdown(wait=False, cancel_futures=True)
+            StrategyPipeline._pool = None
+            StrategyPipeline._pool_key = None
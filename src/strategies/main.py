@@ -7,6 +7,8 @@ from strategies.core.candlestick_patterns_service import CandlestickPatternsServ
 from strategies.core.downsampling_service import DownsamplingService
 from strategies.core.strategy_service import StrategyService
 from strategies.core.strategy_pipeline import StrategyPipeline
+from strategies.core.pipeline_jobs import PipelineJobs
+from strategies.core.strategies.kernels import Kernels
 from strategies.api.rest.routes import create_app
 from strategies.api.grpc.grpc_server import serve_grpc
 
@@ -27,11 +29,16 @@ async def main():
     strategy_service = StrategyService()
     strategy_pipeline = StrategyPipeline()
 
+    # Compile the numba kernels and start the pipeline workers now rather than on the first request
+    Kernels.warm_up()
+    strategy_pipeline.warm_up_pool()
+
     # Start gRPC server (in separate thread)
     grpc_server = serve_grpc(
         strategy_service,
         config["server"]["grpc_host"],
-        config["server"]["grpc_port"]
+        config["server"]["grpc_port"],
+        strategy_pipeline
     )
 
     # Start REST server (in asyncio loop)
@@ -46,6 +53,8 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Shutting down servers...")
         grpc_server.stop(0)
+        PipelineJobs.shutdown()
+        StrategyPipeline.shutdown_pool()
 
 if __name__ == "__main__":
     asyncio.run(main())
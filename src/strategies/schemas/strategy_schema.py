@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class Empty(BaseModel):
     """Equivalent to the gRPC Empty message."""
@@ -35,6 +35,65 @@ class StrategyValidationRequest(BaseModel):
     interval: str
     params: Dict[str, Any] = {}
 
+class SymbolFilter(BaseModel):
+    """Conditions checked against an interval's per-symbol stats table before any series is loaded."""
+    interval: str = "1d"
+    min_bars: Optional[int] = Field(None, description="Fewest bars of history")
+    min_avg_volume: Optional[float] = Field(None, description="Lowest average volume of the last stats.volume_bars bars")
+    min_last_close: Optional[float] = None
+    max_last_close: Optional[float] = None
+    min_last_timestamp: Optional[str] = Field(None, description="Oldest accepted last bar, e.g. 2024-01-02")
+
+class SymbolScope(BaseModel):
+    """Part of an interval folder to scan; a symbol must satisfy every condition given."""
+    symbols: Optional[List[str]] = Field(None, description="Explicit list of symbols, e.g. a watchlist")
+    universe: Optional[str] = Field(None, description="Name of a universe saved in the universes section of config.yaml")
+    glob: Optional[str] = Field(None, description="Shell-style pattern on the symbol, e.g. AA*")
+
 class StrategyPipelineRequest(BaseModel):
     """Request to get symbols that validate a given list of StrategyValidationRequest."""
-    strategies: List[StrategyValidationRequest]
\ No newline at end of file
+    strategies: List[StrategyValidationRequest]
+    filters: List[SymbolFilter] = []
+    scope: Optional[SymbolScope] = Field(None, description="Scan only these symbols instead of the whole folder")
+
+class StandingPipelineRequest(StrategyPipelineRequest):
+    """Request to run a StrategyPipelineRequest as a standing pipeline, re-evaluating only symbols whose data changed."""
+    delta: bool = Field(False, description="Return only the symbols added to or removed from the match set")
+
+class StandingPipelineResponse(BaseModel):
+    """Response containing the match set of a standing pipeline and how it changed since its last run."""
+    message: str = Field(..., description="Returns len(symbols) symbols, len(added) added and len(removed) removed")
+    symbols: List[str] = Field(default_factory=list, description="All matching symbols, empty for a delta request")
+    added: List[str] = Field(default_factory=list, description="Symbols matching since this run")
+    removed: List[str] = Field(default_factory=list, description="Symbols no longer matching")
+    evaluated: int = Field(0, description="Symbols re-evaluated because one of their files changed")
+
+class JobStatusResponse(BaseModel):
+    """Response containing the state and progress of a background pipeline job."""
+    job_id: str = Field(..., description="Id to poll, cancel and fetch the result of the job")
+    state: str = Field(..., description="queued, running, done, failed or cancelled")
+    done: int = Field(0, description="Symbols finished so far")
+    total: int = Field(0, description="Symbols in the universe of the run, 0 until it starts")
+    matches: int = Field(0, description="Symbols matching so far")
+    cached: bool = Field(False, description="Whether the result came from the pipeline result cache")
+    error: Optional[str] = Field(None, description="Why a failed job failed")
+    elapsed_seconds: float = Field(0.0, description="Seconds since the job started running")
+
+class StoreResponse(BaseModel):
+    """Response containing the status of an OHLCV store build."""
+    message: str = Field(..., description="Returns the number of symbols packed into the store")
+
+class InvalidateResponse(BaseModel):
+    """Response containing the number of cached pipeline results dropped."""
+    message: str = Field(..., description="Returns the number of results dropped and for which interval")
+    dropped: int = Field(..., description="Cached results dropped")
+
+class CacheStatsResponse(BaseModel):
+    """Response containing the counters of the DataFrame cache."""
+    hits: int = Field(..., description="Reads served from the cache")
+    misses: int = Field(..., description="Reads that had to load the file")
+    evictions: int = Field(..., description="Frames evicted to stay within the byte budget")
+    appends: int = Field(..., description="Stale frames extended by parsing only appended rows")
+    entries: int = Field(..., description="Frames currently cached")
+    bytes: int = Field(..., description="Memory used by the cached frames")
+    max_bytes: int = Field(..., description="Configured byte budget of the cache")
\ No newline at end of file
@@ -1,9 +1,12 @@
+import grpc
 import pytest
 from unittest.mock import Mock, patch
 from concurrent import futures
 
 from strategies.api.grpc import strategies_pb2
 from strategies.api.grpc.grpc_server import serve_grpc, StrategyServiceGRPC  # adjust import path if needed
+from strategies.core.data.symbol_universe import UnknownUniverseError
+from strategies.schemas.strategy_schema import SymbolScope
 
 
 @pytest.fixture
@@ -140,3 +143,84 @@ def test_serve_grpc_ServerCreationFails_RaisesException(mock_grpc_server, mock_s
     with pytest.raises(Exception, match="Failed to start server"):
         serve_grpc(mock_strategy_service, host, port)
 
+
+
+def test_StreamPipeline_ValidRequest_YieldsSymbolsThenSummary(mock_strategy_service):
+    # Arrange
+    mock_pipeline = Mock()
+    mock_pipeline.stream_pipeline.return_value = iter([
+        {"symbol": "AAPL"},
+        {"symbol": "MSFT"},
+        {"summary": {"message": "Returns 2 symbols", "matches": 2, "elapsed_seconds": 0.5, "cached": False}},
+    ])
+    service = StrategyServiceGRPC(mock_strategy_service, mock_pipeline)
+    request = strategies_pb2.PipelineRequest(
+        strategies=[strategies_pb2.PipelineStep(strategy="is_rsi_oversold", interval="1d", params_json='{"duration": 14}')],
+        filters=[strategies_pb2.SymbolFilter(interval="1d", min_bars=50)],
+    )
+
+    # Act
+    events = list(service.StreamPipeline(request, Mock()))
+
+    # Assert
+    assert [event.symbol for event in events[:2]] == ["AAPL", "MSFT"]
+    assert events[2].WhichOneof("event") == "summary"
+    assert events[2].summary.matches == 2
+    strategies, filters, scope = mock_pipeline.stream_pipeline.call_args.args
+    assert strategies[0].params == {"duration": 14}
+    assert filters[0].min_bars == 50
+    assert filters[0].min_avg_volume is None
+    assert scope is None
+
+
+def test_StreamPipeline_InvalidParamsJson_AbortsWithInvalidArgument(mock_strategy_service):
+    # Arrange
+    mock_pipeline = Mock()
+    service = StrategyServiceGRPC(mock_strategy_service, mock_pipeline)
+    request = strategies_pb2.PipelineRequest(
+        strategies=[strategies_pb2.PipelineStep(strategy="is_rsi_oversold", interval="1d", params_json="{oops")]
+    )
+    mock_context = Mock()
+    mock_context.abort.side_effect = Exception("aborted")
+
+    # Act / Assert
+    with pytest.raises(Exception, match="aborted"):
+        list(service.StreamPipeline(request, mock_context))
+    assert mock_context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+    mock_pipeline.stream_pipeline.assert_not_called()
+
+
+def test_StreamPipeline_WithScope_PassesScope(mock_strategy_service):
+    # Arrange
+    mock_pipeline = Mock()
+    mock_pipeline.stream_pipeline.return_value = iter([])
+    service = StrategyServiceGRPC(mock_strategy_service, mock_pipeline)
+    request = strategies_pb2.PipelineRequest(
+        strategies=[strategies_pb2.PipelineStep(strategy="is_rsi_oversold", interval="1d")],
+        scope=strategies_pb2.SymbolScope(symbols=["AAPL", "AMD"], glob="A*"),
+    )
+
+    # Act
+    list(service.StreamPipeline(request, Mock()))
+
+    # Assert
+    _, _, scope = mock_pipeline.stream_pipeline.call_args.args
+    assert scope == SymbolScope(symbols=["AAPL", "AMD"], glob="A*")
+
+
+def test_StreamPipeline_UnknownUniverse_AbortsWithNotFound(mock_strategy_service):
+    # Arrange
+    mock_pipeline = Mock()
+    mock_pipeline.stream_pipeline.side_effect = UnknownUniverseError("No saved universe 'nope'")
+    service = StrategyServiceGRPC(mock_strategy_service, mock_pipeline)
+    request = strategies_pb2.PipelineRequest(
+        strategies=[strategies_pb2.PipelineStep(strategy="is_rsi_oversold", interval="1d")],
+        scope=strategies_pb2.SymbolScope(universe="nope"),
+    )
+    mock_context = Mock()
+    mock_context.abort.side_effect = Exception("aborted")
+
+    # Act / Assert
+    with pytest.raises(Exception, match="aborted"):
+        list(service.StreamPipeline(request, mock_context))
+    assert mock_context.abort.call_args.args == (grpc.StatusCode.NOT_FOUND, "No saved universe 'nope'")
@@ -1,8 +1,12 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock
 from strategies.api.rest.routes import create_app
-from strategies.schemas.strategy_schema import StrategyValidationRequest
+from strategies.core.data.symbol_universe import UnknownUniverseError
+from strategies.core.pipeline_jobs import JobQueueFullError
+from strategies.core.standing_pipeline import StandingResult
+from strategies.schemas.strategy_schema import StrategyValidationRequest, SymbolFilter, SymbolScope
 
 
 @pytest.fixture
@@ -206,7 +210,7 @@ def test_get_symbols_for_pattern_and_interval_ValidRequest_ReturnsSymbolsRespons
     assert "symbols" in data
     assert len(data["symbols"]) == 3
     assert f"{len(mock_symbols)} symbols" in data["message"]
-    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period)
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period, None)
 
 
 def test_get_symbols_for_pattern_and_interval_EmptySymbols_ReturnsEmptyList(client, mock_candlestick_patterns_service):
@@ -227,7 +231,7 @@ def test_get_symbols_for_pattern_and_interval_EmptySymbols_ReturnsEmptyList(clie
     data = response.json()
     assert data["symbols"] == []
     assert "Returns 0 symbols" in data["message"]
-    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period)
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period, None)
 
 
 def test_get_symbols_for_pattern_and_interval_ServiceRaisesException_ReturnsInternalServerError(client, mock_candlestick_patterns_service):
@@ -245,7 +249,7 @@ def test_get_symbols_for_pattern_and_interval_ServiceRaisesException_ReturnsInte
 
     # Assert
     assert response.status_code == 500
-    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period)
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(group, subgroup, pattern, interval, period, None)
 
     
 
@@ -328,7 +332,7 @@ def test_run_pipeline_ValidRequest_ReturnsSymbolsResponse(client, mock_strategy_
     assert "symbols" in data
     assert len(data["symbols"]) == 3
     assert f"{len(mock_symbols)} symbols" in data["message"]
-    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body)
+    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body, [], None)
 
 
 def test_run_pipeline_EmptySymbols_ReturnsEmptyList(client, mock_strategy_pipeline):
@@ -351,7 +355,7 @@ def test_run_pipeline_EmptySymbols_ReturnsEmptyList(client, mock_strategy_pipeli
     data = response.json()
     assert data["symbols"] == []
     assert "Returns 0 symbols" in data["message"]
-    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body)
+    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body, [], None)
 
 
 def test_run_pipeline_ServiceRaisesException_ReturnsInternalServerError(client, mock_strategy_pipeline):
@@ -371,4 +375,258 @@ def test_run_pipeline_ServiceRaisesException_ReturnsInternalServerError(client,
 
     # Assert
     assert response.status_code == 500
-    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body)
\ No newline at end of file
+    mock_strategy_pipeline.run_pipeline.assert_called_once_with(expected_request_body, [], None)
+
+def test_run_pipeline_WithFilters_PassesFilters(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.run_pipeline.return_value = ["AAPL"]
+    request_body = {
+        "strategies": [{"strategy": "ABC", "interval": "1h"}],
+        "filters": [{"interval": "1d", "min_bars": 60, "min_avg_volume": 1000}]
+    }
+
+    # Act
+    response = client.post("/pipeline/run", json=request_body)
+
+    # Assert
+    assert response.status_code == 200
+    _, filters, _ = mock_strategy_pipeline.run_pipeline.call_args.args
+    assert filters == [SymbolFilter(interval="1d", min_bars=60, min_avg_volume=1000)]
+
+def test_build_store_ValidRequest_ReturnsStoreResponse(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.build_store.return_value = "Built 1d OHLCV store with 3 symbols"
+
+    # Act
+    response = client.post("/pipeline/store/1d")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["message"] == "Built 1d OHLCV store with 3 symbols"
+    mock_strategy_pipeline.build_store.assert_called_once_with("1d")
+
+
+def test_get_cache_stats_ValidRequest_ReturnsCacheStatsResponse(client, mock_strategy_pipeline):
+    # Arrange
+    stats = {"hits": 5, "misses": 2, "evictions": 1, "appends": 1, "entries": 1, "bytes": 100, "max_bytes": 1000}
+    mock_strategy_pipeline.cache_stats.return_value = stats
+
+    # Act
+    response = client.get("/pipeline/cache")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == stats
+
+
+@pytest.mark.parametrize("query,interval", [("", None), ("?interval=5min", "5min")])
+def test_invalidate_results_ValidRequest_ReturnsDroppedCount(client, mock_strategy_pipeline, query, interval):
+    # Arrange
+    mock_strategy_pipeline.invalidate_results.return_value = 3
+
+    # Act
+    response = client.delete(f"/pipeline/results{query}")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["dropped"] == 3
+    mock_strategy_pipeline.invalidate_results.assert_called_once_with(interval)
+
+
+@pytest.mark.parametrize("delta,symbols", [(False, ["AAPL", "MSFT"]), (True, [])])
+def test_run_standing_pipeline_ValidRequest_ReturnsMatchesAndDelta(client, mock_strategy_pipeline, delta, symbols):
+    # Arrange
+    mock_strategy_pipeline.run_standing.return_value = StandingResult(["AAPL", "MSFT"], ["MSFT"], ["TSLA"], 2)
+    request_body = {"strategies": [{"strategy": "ABC", "interval": "1h"}], "delta": delta}
+
+    # Act
+    response = client.post("/pipeline/standing", json=request_body)
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["symbols"] == symbols
+    assert (data["added"], data["removed"], data["evaluated"]) == (["MSFT"], ["TSLA"], 2)
+    mock_strategy_pipeline.run_standing.assert_called_once_with(
+        [StrategyValidationRequest(strategy="ABC", interval="1h", params={})], [], None)
+
+
+def test_stream_pipeline_ValidRequest_StreamsNdjsonRecords(client, mock_strategy_pipeline):
+    # Arrange
+    records = [
+        {"symbol": "AAPL"},
+        {"symbol": "MSFT"},
+        {"summary": {"message": "Returns 2 symbols", "matches": 2, "elapsed_seconds": 0.1, "cached": False}},
+    ]
+    mock_strategy_pipeline.stream_pipeline.return_value = iter(records)
+    request_body = {"strategies": [{"strategy": "ABC", "interval": "1h"}]}
+
+    # Act
+    response = client.post("/pipeline/stream", json=request_body)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == records
+    mock_strategy_pipeline.stream_pipeline.assert_called_once_with(
+        [StrategyValidationRequest(strategy="ABC", interval="1h", params={})], [], None)
+
+
+def job_status(state="running", **fields):
+    status = {"job_id": "abc", "state": state, "done": 5, "total": 10, "matches": 2,
+              "cached": False, "error": None, "elapsed_seconds": 1.5}
+    status.update(fields)
+    return status
+
+
+def test_submit_pipeline_job_ValidRequest_ReturnsAcceptedJob(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.submit_job.return_value.status.return_value = job_status("queued", done=0, total=0)
+    request_body = {"strategies": [{"strategy": "ABC", "interval": "1h"}]}
+
+    # Act
+    response = client.post("/pipeline/jobs", json=request_body)
+
+    # Assert
+    assert response.status_code == 202
+    assert response.json()["job_id"] == "abc"
+    assert response.json()["state"] == "queued"
+    mock_strategy_pipeline.submit_job.assert_called_once_with(
+        [StrategyValidationRequest(strategy="ABC", interval="1h", params={})], [], None)
+
+
+def test_submit_pipeline_job_QueueFull_ReturnsTooManyRequests(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.submit_job.side_effect = JobQueueFullError("16 pipeline jobs are already queued")
+
+    # Act
+    response = client.post("/pipeline/jobs", json={"strategies": [{"strategy": "ABC", "interval": "1h"}]})
+
+    # Assert
+    assert response.status_code == 429
+
+
+def test_get_pipeline_job_KnownJob_ReturnsProgress(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.job.return_value.status.return_value = job_status()
+
+    # Act
+    response = client.get("/pipeline/jobs/abc")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == job_status()
+    mock_strategy_pipeline.job.assert_called_once_with("abc")
+
+
+@pytest.mark.parametrize("path", ["/pipeline/jobs/nope", "/pipeline/jobs/nope/result"])
+def test_get_pipeline_job_UnknownJob_ReturnsNotFound(client, mock_strategy_pipeline, path):
+    # Arrange
+    mock_strategy_pipeline.job.side_effect = KeyError("nope")
+
+    # Act
+    response = client.get(path)
+
+    # Assert
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("result,status_code", [(["AAPL"], 200), (None, 409)])
+def test_get_pipeline_job_result_DoneOrNot_ReturnsSymbolsOrConflict(client, mock_strategy_pipeline, result, status_code):
+    # Arrange
+    mock_strategy_pipeline.job.return_value.result.return_value = result
+    mock_strategy_pipeline.job.return_value.state = "running"
+
+    # Act
+    response = client.get("/pipeline/jobs/abc/result")
+
+    # Assert
+    assert response.status_code == status_code
+    if result is not None:
+        assert response.json()["symbols"] == result
+
+
+def test_cancel_pipeline_job_KnownJob_ReturnsJobStatus(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.cancel_job.return_value.status.return_value = job_status("cancelled")
+
+    # Act
+    response = client.delete("/pipeline/jobs/abc")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["state"] == "cancelled"
+    mock_strategy_pipeline.cancel_job.assert_called_once_with("abc")
+
+
+def test_run_pipeline_WithScope_PassesScope(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.run_pipeline.return_value = ["AAPL"]
+    request_body = {
+        "strategies": [{"strategy": "ABC", "interval": "1h"}],
+        "scope": {"universe": "watchlist", "glob": "A*"}
+    }
+
+    # Act
+    response = client.post("/pipeline/run", json=request_body)
+
+    # Assert
+    assert response.status_code == 200
+    _, _, scope = mock_strategy_pipeline.run_pipeline.call_args.args
+    assert scope == SymbolScope(universe="watchlist", glob="A*")
+
+
+def test_get_symbols_for_pattern_and_interval_WithScope_PassesScope(client, mock_candlestick_patterns_service):
+    # Arrange
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.return_value = ["AAPL"]
+
+    # Act
+    response = client.get("/candlestick/bullish/all/all/1d/3?symbols=AAPL&symbols=MSFT&glob=A*")
+
+    # Assert
+    assert response.status_code == 200
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.assert_called_once_with(
+        "bullish", "all", "all", "1d", 3, SymbolScope(symbols=["AAPL", "MSFT"], glob="A*"))
+
+
+@pytest.mark.parametrize("method,path", [
+    ("run_pipeline", "/pipeline/run"),
+    ("stream_pipeline", "/pipeline/stream"),
+    ("run_standing", "/pipeline/standing"),
+    ("submit_job", "/pipeline/jobs"),
+])
+def test_pipeline_UnknownUniverse_ReturnsNotFound(client, mock_strategy_pipeline, method, path):
+    # Arrange
+    getattr(mock_strategy_pipeline, method).side_effect = UnknownUniverseError("No saved universe 'nope'")
+    request_body = {"strategies": [{"strategy": "ABC", "interval": "1h"}], "scope": {"universe": "nope"}}
+
+    # Act
+    response = client.post(path, json=request_body)
+
+    # Assert
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No saved universe 'nope'"
+
+
+def test_run_pipeline_UniverseFileMissing_ReturnsUnprocessable(client, mock_strategy_pipeline):
+    # Arrange
+    mock_strategy_pipeline.run_pipeline.side_effect = FileNotFoundError(2, "No such file or directory", "data/watchlist.txt")
+    request_body = {"strategies": [{"strategy": "ABC", "interval": "1h"}], "scope": {"universe": "watchlist"}}
+
+    # Act
+    response = client.post("/pipeline/run", json=request_body)
+
+    # Assert
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Universe file not found: data/watchlist.txt"
+
+
+def test_get_symbols_for_pattern_and_interval_UnknownUniverse_ReturnsNotFound(client, mock_candlestick_patterns_service):
+    # Arrange
+    mock_candlestick_patterns_service.get_symbols_for_pattern_and_interval.side_effect = UnknownUniverseError("No saved universe 'nope'")
+
+    # Act
+    response = client.get("/candlestick/bullish/all/all/1d/3?universe=nope")
+
+    # Assert
+    assert response.status_code == 404
@@ -0,0 +1,230 @@
+import threading
+import time
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from strategies.core.data.bulk_loader import BulkLoader, LoadTiming
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_load_config(mocker):
+    def _mock(loader=None):
+        return mocker.patch(
+            "strategies.core.data.bulk_loader.load_config",
+            return_value={"loader": loader or {}}
+        )
+    return _mock
+
+
+def read_frame(file):
+    return pd.DataFrame({"file": [file]})
+
+
+# ---------------------------------------------------------------------------
+# load()
+# ---------------------------------------------------------------------------
+
+def test_load_SlowFirstFile_YieldsInGivenOrder(mock_load_config):
+    # Arrange
+    mock_load_config()
+
+    def read(file):
+        if file == "a":
+            time.sleep(0.05)
+        return read_frame(file)
+
+    # Act
+    result = [file for file, df in BulkLoader.load(["a", "b", "c"], read=read, workers=3)]
+
+    # Assert
+    assert result == ["a", "b", "c"]
+
+
+def test_load_MaxInFlight_BoundsConcurrentReads(mock_load_config):
+    # Arrange
+    mock_load_config()
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def read(file):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return read_frame(file)
+
+    # Act
+    list(BulkLoader.load([str(i) for i in range(12)], read=read, workers=8, max_in_flight=2))
+
+    # Assert
+    assert active[1] <= 2
+
+
+def test_load_Timings_RecordsEveryFile(mock_load_config):
+    # Arrange
+    mock_load_config()
+    timings = []
+
+    # Act
+    list(BulkLoader.load(["a", "b"], read=read_frame, workers=2, timings=timings))
+
+    # Assert
+    assert [(t.file, t.rows) for t in timings] == [("a", 1), ("b", 1)]
+
+
+def test_load_ReadFails_Raises(mock_load_config):
+    # Arrange
+    mock_load_config()
+
+    def read(file):
+        raise RuntimeError("fail")
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        list(BulkLoader.load(["a"], read=read, workers=1))
+
+
+def test_load_ProcessExecutor_ReadsFiles(mock_load_config, tmp_path):
+    # Arrange
+    mock_load_config({"executor": "process", "workers": 2})
+    files = []
+    for symbol in ["AAPL", "TSLA"]:
+        file_path = tmp_path / f"1d-{symbol}.csv"
+        pd.DataFrame({"Symbol": [symbol]}).to_csv(file_path, index=False)
+        files.append(str(file_path))
+
+    # Act
+    result = {file: df for file, df in BulkLoader.load(files, read=pd.read_csv)}
+
+    # Assert
+    assert [df.iloc[0]["Symbol"] for df in result.values()] == ["AAPL", "TSLA"]
+
+
+# ---------------------------------------------------------------------------
+# settings() / symbol() / summarize()
+# ---------------------------------------------------------------------------
+
+def test_settings_ConfigValues_UsedWhenNotGiven(mock_load_config):
+    # Arrange
+    mock_load_config({"executor": "process", "workers": 3, "max_in_flight": 0})
+
+    # Act / Assert
+    assert BulkLoader.settings() == ("process", 3, 6)
+    assert BulkLoader.settings("thread", 2, 5) == ("thread", 2, 5)
+
+
+def test_settings_UnknownExecutor_RaisesValueError(mock_load_config):
+    # Arrange
+    mock_load_config({"executor": "fiber"})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        BulkLoader.settings()
+
+
+@pytest.mark.parametrize(
+    "file_name,interval,expected",
+    [
+        ("1d-AAPL.csv", "1d", "AAPL"),
+        ("1d-BRK-B.csv", None, "BRK-B"),
+        ("AAPL.csv", "1d", "AAPL"),
+    ]
+)
+def test_symbol_FileName_ReturnsSymbol(file_name, interval, expected):
+    # Act / Assert
+    assert BulkLoader.symbol(file_name, interval) == expected
+
+
+def test_summarize_Timings_ReportsTotalsAndSlowest():
+    # Arrange
+    timings = [LoadTiming("/d/a.csv", 0.1, 10), LoadTiming("/d/b.csv", 0.3, 5),
+               LoadTiming("/d/c.csv", 0.2, 1), LoadTiming("/d/e.csv", 0.05, 1)]
+
+    # Act
+    summary = BulkLoader.summarize(timings, 0.4)
+
+    # Assert
+    assert summary["files"] == 4
+    assert summary["rows"] == 17
+    assert [name for name, _ in summary["slowest"]] == ["b.csv", "c.csv", "a.csv"]
+
+
+def test_load_OnError_SkipsFailedFile(mock_load_config):
+    # Arrange
+    mock_load_config()
+    errors = []
+
+    def read(file):
+        if file == "b":
+            raise RuntimeError("fail")
+        return read_frame(file)
+
+    # Act
+    result = [file for file, df in BulkLoader.load(["a", "b", "c"], read=read, workers=2,
+                                                    on_error=lambda file, e: errors.append(file))]
+
+    # Assert
+    assert result == ["a", "c"]
+    assert errors == ["b"]
+
+
+# ---------------------------------------------------------------------------
+# stream()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_stream_IntervalFolder_YieldsSymbolsInOrder(mock_load_config, tmp_path, prefetch):
+    # Arrange
+    mock_load_config()
+    for symbol in ["TSLA", "AAPL", "MSFT"]:
+        (tmp_path / f"1d-{symbol}.csv").write_text(f"Symbol\n{symbol}\n")
+    (tmp_path / "1h-AAPL.csv").write_text("Symbol\nAAPL\n")
+
+    # Act
+    result = [(symbol, df.iloc[0]["Symbol"]) for symbol, df in BulkLoader.stream(str(tmp_path), "1d", prefetch, read=pd.read_csv)]
+
+    # Assert
+    assert result == [("AAPL", "AAPL"), ("MSFT", "MSFT"), ("TSLA", "TSLA")]
+
+
+
+def test_stream_Symbols_ReadsOnlyTheirFiles(mock_load_config, tmp_path):
+    # Arrange
+    mock_load_config()
+    for symbol in ["TSLA", "AAPL", "MSFT"]:
+        (tmp_path / f"1d-{symbol}.csv").write_text(f"Symbol\n{symbol}\n")
+    read = MagicMock(side_effect=pd.read_csv)
+
+    # Act
+    result = [symbol for symbol, _ in BulkLoader.stream(str(tmp_path), "1d", 0, read=read, symbols=["TSLA", "AAPL", "XYZ"])]
+
+    # Assert
+    assert result == ["AAPL", "TSLA"]
+    assert read.call_count == 2
+
+def test_stream_Prefetch_ReadsAtMostPrefetchAhead(mock_load_config, tmp_path):
+    # Arrange
+    mock_load_config()
+    for i in range(10):
+        (tmp_path / f"1d-S{i}.csv").write_text("x\n1\n")
+    started = []
+
+    def read(file):
+        started.append(file)
+        return read_frame(file)
+
+    frames = BulkLoader.stream(str(tmp_path), "1d", prefetch=2, read=read)
+
+    # Act
+    next(frames)
+    time.sleep(0.05)
+
+    # Assert
+    assert len(started) <= 3
+    frames.close()
@@ -0,0 +1,121 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from strategies.core.data.columnar_cache import ColumnarCache
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_load_config(mocker):
+    return mocker.patch(
+        "strategies.core.data.columnar_cache.load_config",
+        return_value={"cache": {"columnar_sidecar": True}}
+    )
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "1d-AAPL.csv"
+    pd.DataFrame({
+        "Symbol": ["AAPL", "AAPL", None],
+        "Interval": ["1d", "1d", "1d"],
+        "Timestamp": ["2024-01-02 00:00:00", "2024-01-03 00:00:00", "2024-01-04 00:00:00"],
+        "Open": [100.5, 101.5, 102.5],
+        "Volume": [10, 20, 30],
+    }).to_csv(file_path, index=False)
+    return str(file_path)
+
+
+# ---------------------------------------------------------------------------
+# read_csv()
+# ---------------------------------------------------------------------------
+
+def test_read_csv_FirstRead_WritesSidecar(mock_load_config, csv_file):
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    assert os.path.isfile(ColumnarCache.sidecar_path(csv_file))
+    pd.testing.assert_frame_equal(df, pd.read_csv(csv_file))
+
+
+def test_read_csv_SidecarCurrent_SkipsCsvParsing(mocker, mock_load_config, csv_file):
+    # Arrange
+    expected = ColumnarCache.read_csv(csv_file)
+    mock_read_csv = mocker.patch("pandas.read_csv")
+
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    mock_read_csv.assert_not_called()
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["Symbol"].isna().tolist() == [False, False, True]
+
+
+def test_read_csv_CsvChanged_RebuildsSidecar(mock_load_config, csv_file):
+    # Arrange
+    ColumnarCache.read_csv(csv_file)
+    with open(csv_file, "a") as f:
+        f.write("AAPL,1d,2024-01-05 00:00:00,103.5,40\n")
+
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    assert len(df) == 4
+    assert df.iloc[-1]["Volume"] == 40
+
+
+def test_read_csv_Disabled_DoesNotWriteSidecar(mocker, csv_file):
+    # Arrange
+    mocker.patch(
+        "strategies.core.data.columnar_cache.load_config",
+        return_value={"cache": {"columnar_sidecar": False}}
+    )
+
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    assert len(df) == 3
+    assert not os.path.exists(ColumnarCache.sidecar_path(csv_file))
+
+
+def test_read_csv_CorruptSidecar_FallsBackToCsv(mock_load_config, csv_file):
+    # Arrange
+    sidecar = ColumnarCache.sidecar_path(csv_file)
+    os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+    with open(sidecar, "wb") as f:
+        f.write(b"not a zip file")
+
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    assert len(df) == 3
+    with np.load(sidecar) as npz:
+        assert "__meta__" in npz.files
+
+
+def test_read_csv_FileMissing_RaisesFileNotFound(mock_load_config, tmp_path):
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        ColumnarCache.read_csv(str(tmp_path / "missing.csv"))
+
+
+def test_store_UnwritableFolder_LogsWarning(mocker, mock_load_config, csv_file):
+    # Arrange
+    mocker.patch("os.makedirs", side_effect=PermissionError("read-only"))
+    mock_logger = mocker.patch("strategies.core.data.columnar_cache.logger")
+
+    # Act
+    df = ColumnarCache.read_csv(csv_file)
+
+    # Assert
+    assert len(df) == 3
+    mock_logger.warning.assert_called_once()
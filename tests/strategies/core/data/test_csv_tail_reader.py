@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+from strategies.core.data.csv_tail_reader import CsvTailReader
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def create_csv(tmp_path):
+    def _create(closes):
+        file_path = tmp_path / "1d-AAPL.csv"
+        pd.DataFrame({"Symbol": ["AAPL"] * len(closes), "Close": closes}).to_csv(file_path, index=False)
+        return str(file_path)
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# read_last()
+# ---------------------------------------------------------------------------
+
+def test_read_last_FewerRowsThanFile_ReturnsLastRows(create_csv):
+    # Arrange
+    file_path = create_csv([float(i) for i in range(100)])
+
+    # Act
+    df = CsvTailReader.read_last(file_path, 3)
+
+    # Assert
+    assert list(df.columns) == ["Symbol", "Close"]
+    assert df["Close"].tolist() == [97.0, 98.0, 99.0]
+
+
+def test_read_last_MoreRowsThanFile_ReturnsAllRows(create_csv):
+    # Arrange
+    file_path = create_csv([1.0, 2.0])
+
+    # Act
+    df = CsvTailReader.read_last(file_path, 10)
+
+    # Assert
+    assert df["Close"].tolist() == [1.0, 2.0]
+
+
+def test_read_last_RowsSpanSeveralBlocks_ReturnsLastRows(mocker, create_csv):
+    # Arrange
+    file_path = create_csv([float(i) for i in range(50)])
+    mocker.patch.object(CsvTailReader, "BLOCK_SIZE", 16)
+
+    # Act
+    df = CsvTailReader.read_last(file_path, 20)
+
+    # Assert
+    assert df["Close"].tolist() == [float(i) for i in range(30, 50)]
+
+
+def test_read_last_HeaderOnly_ReturnsEmptyFrame(tmp_path):
+    # Arrange
+    file_path = tmp_path / "1d-AAPL.csv"
+    file_path.write_text("Symbol,Close\n")
+
+    # Act
+    df = CsvTailReader.read_last(str(file_path), 5)
+
+    # Assert
+    assert df.empty
+    assert list(df.columns) == ["Symbol", "Close"]
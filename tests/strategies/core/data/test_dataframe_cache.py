@@ -0,0 +1,265 @@
+import pandas as pd
+import pytest
+from strategies.core.data.dataframe_cache import DataFrameCache
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    DataFrameCache.clear()
+    yield
+    DataFrameCache.clear()
+
+
+@pytest.fixture
+def mock_load_config(mocker):
+    def _mock(max_bytes=1024 * 1024):
+        return mocker.patch(
+            "strategies.core.data.dataframe_cache.load_config",
+            return_value={"cache": {"dataframe_cache_bytes": max_bytes}}
+        )
+    return _mock
+
+
+@pytest.fixture
+def create_csv(tmp_path):
+    def _create(interval, symbol, closes):
+        folder = tmp_path / interval
+        folder.mkdir(exist_ok=True)
+        file_path = folder / f"{interval}-{symbol}.csv"
+        pd.DataFrame({"Symbol": [symbol] * len(closes), "Close": closes}).to_csv(file_path, index=False)
+        return str(file_path)
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# read_csv()
+# ---------------------------------------------------------------------------
+
+def test_read_csv_SecondRead_IsHit(mocker, mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    DataFrameCache.read_csv(file_path)
+    mock_read = mocker.patch("strategies.core.data.dataframe_cache.ColumnarCache.read_csv")
+
+    # Act
+    df = DataFrameCache.read_csv(file_path)
+
+    # Assert
+    mock_read.assert_not_called()
+    assert df["Close"].tolist() == [1.0, 2.0]
+    stats = DataFrameCache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_read_csv_FileChanged_ReloadsFrame(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    DataFrameCache.read_csv(file_path)
+    create_csv("1d", "AAPL", [1.0, 2.0, 3.0])
+
+    # Act
+    df = DataFrameCache.read_csv(file_path)
+
+    # Assert
+    assert df["Close"].tolist() == [1.0, 2.0, 3.0]
+    assert DataFrameCache.stats()["misses"] == 2
+    assert DataFrameCache.stats()["entries"] == 1
+
+
+def test_read_csv_CallerAssignsColumn_CachedFrameUnchanged(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    df = DataFrameCache.read_csv(file_path)
+
+    # Act
+    df["Close"] = [9.0, 9.0]
+
+    # Assert
+    assert DataFrameCache.read_csv(file_path)["Close"].tolist() == [1.0, 2.0]
+
+
+def test_read_csv_OverBudget_EvictsLeastRecentlyUsed(mock_load_config, create_csv):
+    # Arrange
+    first = create_csv("1d", "AAPL", [1.0] * 10)
+    mock_load_config()
+    DataFrameCache.read_csv(first)
+    one_frame = DataFrameCache.stats()["bytes"]
+    mock_load_config(max_bytes=one_frame * 2)
+    second = create_csv("1d", "TSLA", [1.0] * 10)
+    third = create_csv("1d", "MSFT", [1.0] * 10)
+    DataFrameCache.read_csv(second)
+    DataFrameCache.read_csv(first)  # AAPL becomes most recently used
+
+    # Act
+    DataFrameCache.read_csv(third)
+
+    # Assert
+    stats = DataFrameCache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+    DataFrameCache.read_csv(first)
+    assert DataFrameCache.stats()["hits"] == 2
+
+
+def test_read_csv_FileMissing_RaisesFileNotFound(mock_load_config, tmp_path):
+    # Arrange
+    mock_load_config()
+
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        DataFrameCache.read_csv(str(tmp_path / "1d" / "1d-MISSING.csv"))
+
+
+def test_read_csv_RowsAppended_ParsesOnlyTail(mocker, mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    DataFrameCache.read_csv(file_path)
+    with open(file_path, "a") as f:
+        f.write("AAPL,3.0\n")
+    mock_read = mocker.patch("strategies.core.data.dataframe_cache.ColumnarCache.read_csv")
+
+    # Act
+    df = DataFrameCache.read_csv(file_path)
+
+    # Assert
+    mock_read.assert_not_called()
+    assert df["Close"].tolist() == [1.0, 2.0, 3.0]
+    assert DataFrameCache.stats()["appends"] == 1
+
+
+def test_appended_RowsAppendedThenRewritten_ReportsOnlyTheAppend(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    previous = DataFrameCache.read_csv(file_path).attrs[DataFrameCache.SOURCE_ATTR]
+    with open(file_path, "a") as f:
+        f.write("AAPL,3.0\n")
+
+    # Act
+    grown = DataFrameCache.read_csv(file_path).attrs[DataFrameCache.SOURCE_ATTR]
+    after_append = DataFrameCache.appended(grown)
+    create_csv("1d", "AAPL", [5.0, 6.0, 7.0, 8.0])
+    rewritten = DataFrameCache.read_csv(file_path).attrs[DataFrameCache.SOURCE_ATTR]
+
+    # Assert
+    assert after_append == (previous, 2, 3)
+    assert DataFrameCache.appended(rewritten) is None
+    assert DataFrameCache.appended(grown) is None
+
+
+def test_read_csv_HalfLineAppendedThenCompleted_NeverServesTruncatedRow(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    DataFrameCache.read_csv(file_path)
+
+    # Act
+    with open(file_path, "a") as f:
+        f.write("AAPL,3.2")
+    during = DataFrameCache.read_csv(file_path)
+    with open(file_path, "a") as f:
+        f.write("5\n")
+    after = DataFrameCache.read_csv(file_path)
+
+    # Assert
+    assert during["Close"].tolist() == [1.0, 2.0]
+    assert after["Close"].tolist() == [1.0, 2.0, 3.25]
+    assert DataFrameCache.stats()["appends"] == 2
+
+
+def test_read_csv_ColdReadEndsWithPartialLine_NotCached(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+    with open(file_path, "a") as f:
+        f.write("AAPL,3.2")
+
+    # Act
+    DataFrameCache.read_csv(file_path)
+    with open(file_path, "a") as f:
+        f.write("5\n")
+    df = DataFrameCache.read_csv(file_path)
+
+    # Assert
+    assert df["Close"].tolist() == [1.0, 2.0, 3.25]
+    assert DataFrameCache.stats()["appends"] == 0
+
+
+# ---------------------------------------------------------------------------
+# key() / invalidate()
+# ---------------------------------------------------------------------------
+
+def test_key_IntervalFile_ReturnsIntervalSymbolVersion():
+    # Act
+    key = DataFrameCache.key("/data/5min/5min-AAPL.csv", (1, 2))
+
+    # Assert
+    assert key == ("5min", "AAPL", (1, 2))
+
+
+def test_invalidate_Interval_DropsOnlyThatInterval(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    DataFrameCache.read_csv(create_csv("1d", "AAPL", [1.0]))
+    DataFrameCache.read_csv(create_csv("1h", "AAPL", [1.0]))
+
+    # Act
+    dropped = DataFrameCache.invalidate("1h")
+
+    # Assert
+    assert dropped == 1
+    assert DataFrameCache.stats()["entries"] == 1
+
+
+
+def test_read_csv_LastRowsCached_SlicesCachedFrame(mocker, mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0, 3.0])
+    DataFrameCache.read_csv(file_path)
+    mock_tail = mocker.patch("strategies.core.data.dataframe_cache.CsvTailReader.read_last")
+
+    # Act
+    df = DataFrameCache.read_csv(file_path, last_rows=2)
+
+    # Assert
+    mock_tail.assert_not_called()
+    assert df["Close"].tolist() == [2.0, 3.0]
+    assert df.index.tolist() == [0, 1]
+
+
+def test_read_csv_LastRowsNotCached_ReadsTailWithoutCaching(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0, 3.0])
+
+    # Act
+    df = DataFrameCache.read_csv(file_path, last_rows=2)
+
+    # Assert
+    assert df["Close"].tolist() == [2.0, 3.0]
+    assert DataFrameCache.stats()["entries"] == 0
+
+
+def test_read_csv_ReturnedFrame_TaggedWithSource(mock_load_config, create_csv):
+    # Arrange
+    mock_load_config()
+    file_path = create_csv("1d", "AAPL", [1.0, 2.0])
+
+    # Act
+    full = DataFrameCache.read_csv(file_path)
+    tail = DataFrameCache.read_csv(file_path, last_rows=1)
+
+    # Assert
+    interval, symbol, version, path = full.attrs[DataFrameCache.SOURCE_ATTR]
+    assert (interval, symbol) == ("1d", "AAPL")
+    assert tail.attrs[DataFrameCache.SOURCE_ATTR] == full.attrs[DataFrameCache.SOURCE_ATTR]
@@ -0,0 +1,130 @@
+import os
+import pandas as pd
+import pytest
+from strategies.core.data.incremental_csv_reader import IncrementalCsvReader
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "5min-AAPL.csv"
+    file_path.write_text(
+        "Symbol,Timestamp,Close\n"
+        "AAPL,2024-01-02 09:15:00,1.5\n"
+        "AAPL,2024-01-02 09:20:00,2.5\n"
+    )
+    return str(file_path)
+
+
+@pytest.fixture
+def parsed(csv_file):
+    """Fully parsed frame of csv_file and its tail state."""
+    df = pd.read_csv(csv_file)
+    stat = os.stat(csv_file)
+    state = IncrementalCsvReader.snapshot(csv_file, df, (stat.st_mtime_ns, stat.st_size))
+    return df, state
+
+
+def append(file_path, text):
+    with open(file_path, "a") as f:
+        f.write(text)
+
+
+# ---------------------------------------------------------------------------
+# snapshot()
+# ---------------------------------------------------------------------------
+
+def test_snapshot_CompleteFile_RecordsOffsetAndRows(csv_file, parsed):
+    # Arrange
+    _, state = parsed
+
+    # Assert
+    assert state.offset == os.path.getsize(csv_file)
+    assert state.rows == 2
+    assert state.header == b"Symbol,Timestamp,Close\n"
+
+
+def test_snapshot_VersionChanged_ReturnsNone(csv_file):
+    # Act
+    state = IncrementalCsvReader.snapshot(csv_file, pd.read_csv(csv_file), (0, 0))
+
+    # Assert
+    assert state is None
+
+
+def test_snapshot_PartialLastLine_ReturnsNone(csv_file):
+    # Arrange
+    append(csv_file, "AAPL,2024-01-02 09:25:00,3")
+    stat = os.stat(csv_file)
+
+    # Act
+    state = IncrementalCsvReader.snapshot(csv_file, pd.read_csv(csv_file), (stat.st_mtime_ns, stat.st_size))
+
+    # Assert
+    assert state is None
+
+
+# ---------------------------------------------------------------------------
+# read_appended()
+# ---------------------------------------------------------------------------
+
+def test_read_appended_NewRows_AppendsOnlyTail(mocker, csv_file, parsed):
+    # Arrange
+    df, state = parsed
+    append(csv_file, "AAPL,2024-01-02 09:25:00,3.5\nAAPL,2024-01-02 09:30:00,4.5\n")
+
+    # Act
+    merged, new_state = IncrementalCsvReader.read_appended(csv_file, df, state)
+
+    # Assert
+    pd.testing.assert_frame_equal(merged, pd.read_csv(csv_file))
+    assert new_state.rows == 4
+    assert new_state.offset == os.path.getsize(csv_file)
+
+
+def test_read_appended_PartialLine_LeftForNextRead(csv_file, parsed):
+    # Arrange
+    df, state = parsed
+    append(csv_file, "AAPL,2024-01-02 09:25:00,3.5\nAAPL,2024-01-02 09:30")
+
+    # Act
+    merged, new_state = IncrementalCsvReader.read_appended(csv_file, df, state)
+    append(csv_file, ":00,4.5\n")
+    merged, new_state = IncrementalCsvReader.read_appended(csv_file, merged, new_state)
+
+    # Assert
+    pd.testing.assert_frame_equal(merged, pd.read_csv(csv_file))
+    assert new_state.rows == 4
+
+
+def test_read_appended_FileShrunk_ReturnsNone(csv_file, parsed):
+    # Arrange
+    df, state = parsed
+    with open(csv_file, "w") as f:
+        f.write("Symbol,Timestamp,Close\n")
+
+    # Act / Assert
+    assert IncrementalCsvReader.read_appended(csv_file, df, state) is None
+
+
+def test_read_appended_HeaderChanged_ReturnsNone(csv_file, parsed):
+    # Arrange
+    df, state = parsed
+    with open(csv_file, "w") as f:
+        f.write("Symbol,Timestamp,Close,Volume\nAAPL,2024-01-02 09:15:00,1.5,1\nAAPL,2024-01-02 09:20:00,2.5,1\nAAPL,x,3,1\n")
+
+    # Act / Assert
+    assert IncrementalCsvReader.read_appended(csv_file, df, state) is None
+
+
+def test_read_appended_LastRowsRewritten_ReturnsNone(csv_file, parsed):
+    # Arrange
+    df, state = parsed
+    with open(csv_file, "w") as f:
+        f.write("Symbol,Timestamp,Close\nAAPL,2024-01-02 09:15:00,1.5\nAAPL,2024-01-02 09:20:00,2.6\nAAPL,2024-01-02 09:25:00,3.5\n")
+
+    # Act / Assert
+    assert IncrementalCsvReader.read_appended(csv_file, df, state) is None
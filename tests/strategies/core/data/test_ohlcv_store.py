@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import pytest
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.ohlcv_store import OhlcvStore
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    return folder
+
+
+@pytest.fixture
+def create_csv(folder):
+    def _create(symbol, closes):
+        n = len(closes)
+        df = pd.DataFrame({
+            "Symbol": [symbol] * n,
+            "Interval": ["1d"] * n,
+            "Timestamp": [f"2024-01-{i + 2:02d} 00:00:00" for i in range(n)],
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [100] * n,
+        })
+        file_path = folder / f"1d-{symbol}.csv"
+        df.to_csv(file_path, index=False)
+        return file_path
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# build() / open()
+# ---------------------------------------------------------------------------
+
+def test_build_MultipleSymbols_IndexesRowRanges(folder, create_csv):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0, 3.0])
+    create_csv("TSLA", [10.0, 20.0])
+    (folder / "foo-IBM.csv").write_text("x\n1")
+
+    # Act
+    store = OhlcvStore.build(str(folder), "1d")
+
+    # Assert
+    assert set(store.symbols()) == {"AAPL", "TSLA"}
+    assert store.index["AAPL"][:2] == [0, 3]
+    assert store.index["TSLA"][:2] == [3, 5]
+    assert store.arrays("TSLA")["Close"].tolist() == [10.0, 20.0]
+
+
+def test_build_OtherTimestampFormat_LeavesSymbolOut(folder, create_csv):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0])
+    file_path = create_csv("TSLA", [10.0, 20.0])
+    df = pd.read_csv(file_path)
+    df["Timestamp"] = ["2024-01-02", "2024-01-03"]
+    df.to_csv(file_path, index=False)
+
+    # Act
+    store = OhlcvStore.build(str(folder), "1d")
+
+    # Assert
+    assert store.symbols() == ["AAPL"]
+    assert not store.is_current("TSLA")
+
+
+def test_frame_LastRows_FormatsOnlyTheirTimestamps(folder, create_csv, mocker):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0, 3.0, 4.0])
+    store = OhlcvStore.build(str(folder), "1d")
+    strftime = mocker.spy(pd.DatetimeIndex, "strftime")
+
+    # Act
+    df = store.frame("AAPL", last_rows=2)
+
+    # Assert
+    assert df["Close"].tolist() == [3.0, 4.0]
+    assert df["Timestamp"].tolist() == ["2024-01-04 00:00:00", "2024-01-05 00:00:00"]
+    assert list(df.index) == [0, 1]
+    assert len(strftime.call_args.args[0]) == 2
+    assert np.shares_memory(df["Close"].to_numpy(), store.columns["Close"])
+
+
+def test_read_csv_StoreCurrentOrStale_TaggedLikeDataFrameCache(folder, create_csv, mocker):
+    # Arrange
+    mocker.patch("strategies.core.data.dataframe_cache.load_config", return_value={"cache": {}})
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    file_path = str(create_csv("AAPL", [1.0, 2.0, 3.0]))
+    OhlcvStore.build(str(folder), "1d")
+    store = OhlcvStore.get(str(folder), "1d")
+
+    # Act
+    current = OhlcvStore.read_csv(file_path, last_rows=2)
+    create_csv("AAPL", [1.0, 2.0, 3.0, 4.0])
+    stale = OhlcvStore.read_csv(file_path, last_rows=2)
+
+    # Assert
+    assert np.shares_memory(current["Close"].to_numpy(), store.columns["Close"])
+    assert current.attrs[DataFrameCache.SOURCE_ATTR][:2] == ("1d", "AAPL")
+    assert stale["Close"].tolist() == [3.0, 4.0]
+    assert stale.attrs[DataFrameCache.SOURCE_ATTR][2] != current.attrs[DataFrameCache.SOURCE_ATTR][2]
+
+
+def test_open_NoStore_ReturnsNone(folder):
+    # Act / Assert
+    assert OhlcvStore.open(str(folder), "1d") is None
+    assert OhlcvStore.get(str(folder), "1d") is None
+
+
+def test_build_Rebuild_ReplacesGenerationAndGetReopens(folder, create_csv):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0])
+    OhlcvStore.build(str(folder), "1d")
+    first = OhlcvStore.get(str(folder), "1d")
+    create_csv("AAPL", [1.0, 2.0, 3.0])
+
+    # Act
+    OhlcvStore.build(str(folder), "1d")
+    second = OhlcvStore.get(str(folder), "1d")
+
+    # Assert
+    assert second.generation != first.generation
+    assert second.arrays("AAPL")["Close"].tolist() == [1.0, 2.0, 3.0]
+    assert len(list((folder / ".cache" / "ohlcv").glob("*/"))) == 1
+
+
+# ---------------------------------------------------------------------------
+# is_current() / frame()
+# ---------------------------------------------------------------------------
+
+def test_is_current_CsvChangedAfterBuild_ReturnsFalse(folder, create_csv):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0])
+    store = OhlcvStore.build(str(folder), "1d")
+
+    # Act
+    create_csv("AAPL", [1.0, 2.0, 3.0, 4.0])
+
+    # Assert
+    assert not store.is_current("AAPL")
+    assert not store.is_current("MISSING")
+
+
+def test_frame_ValidSymbol_IsZeroCopyView(folder, create_csv):
+    # Arrange
+    create_csv("AAPL", [1.0, 2.0, 3.0])
+    store = OhlcvStore.build(str(folder), "1d")
+
+    # Act
+    df = store.frame("AAPL")
+
+    # Assert
+    assert store.is_current("AAPL")
+    assert list(df.columns) == ["Symbol", "Interval", "Timestamp", "Open", "High", "Low", "Close", "Volume"]
+    assert df.iloc[0]["Symbol"] == "AAPL"
+    assert df["Timestamp"].iloc[-1] == "2024-01-04 00:00:00"
+    assert np.shares_memory(df["Close"].to_numpy(), store.columns["Close"])
@@ -0,0 +1,203 @@
+import json
+import os
+import pytest
+from strategies.core.data.symbol_catalog import SymbolCatalog
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_catalogs(mocker):
+    # folders are stat'ed on every lookup unless a test sets a poll interval
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 0}})
+    SymbolCatalog.clear()
+    yield
+    SymbolCatalog.clear()
+
+
+@pytest.fixture
+def create_csv(tmp_path):
+    def _create(symbol, timestamps, interval="1d"):
+        folder = tmp_path / interval
+        folder.mkdir(exist_ok=True)
+        file_path = folder / f"{interval}-{symbol}.csv"
+        lines = ["Symbol,Timestamp,Close"] + [f"{symbol},{ts},1.0" for ts in timestamps]
+        file_path.write_text("\n".join(lines) + "\n")
+        return file_path
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# get() / refresh()
+# ---------------------------------------------------------------------------
+
+def test_get_IntervalFiles_RecordsEntries(tmp_path, create_csv):
+    # Arrange
+    create_csv("TSLA", ["2024-01-02", "2024-01-03", "2024-01-04"])
+    create_csv("AAPL", ["2024-01-02"])
+    create_csv("AAPL", ["2024-01-02"], interval="1h")
+    (tmp_path / "1d" / "notes.csv").write_text("x\n")
+
+    # Act
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+
+    # Assert
+    assert catalog.symbols() == ["AAPL", "TSLA"]
+    entry = catalog.entry("TSLA")
+    assert entry.rows == 3
+    assert (entry.first_timestamp, entry.last_timestamp) == ("2024-01-02", "2024-01-04")
+    assert entry.size == os.path.getsize(entry.path)
+
+
+def test_refresh_FileChanged_RedescribesOnlyThatFile(mocker, tmp_path, create_csv):
+    # Arrange
+    create_csv("AAPL", ["2024-01-02"])
+    create_csv("TSLA", ["2024-01-02"])
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    create_csv("TSLA", ["2023-12-29", "2024-01-03"])
+    spy = mocker.spy(SymbolCatalog, "describe")
+
+    # Act
+    changed = catalog.refresh()
+
+    # Assert
+    assert changed == 1
+    assert spy.call_count == 1
+    assert catalog.entry("TSLA").last_timestamp == "2024-01-03"
+
+
+def test_refresh_RowsAppended_CountsOnlyAppendedBytes(mocker, tmp_path, create_csv):
+    # Arrange
+    file_path = create_csv("TSLA", ["2024-01-02", "2024-01-03"])
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    with open(file_path, "a") as f:
+        f.write("TSLA,2024-01-04,1.0\nTSLA,2024-01-05,1.0\n")
+    describe = mocker.spy(SymbolCatalog, "describe")
+
+    # Act
+    changed = catalog.refresh()
+
+    # Assert
+    entry = catalog.entry("TSLA")
+    assert changed == 1
+    describe.assert_not_called()
+    assert (entry.rows, entry.first_timestamp, entry.last_timestamp) == (4, "2024-01-02", "2024-01-05")
+    assert entry.size == os.path.getsize(file_path)
+
+
+@pytest.mark.parametrize("timestamps", [
+    ["2024-01-02"],                                            # shrunk
+    ["2023-12-29", "2023-12-30", "2024-01-02", "2024-01-03"],  # rewritten with rows in front
+])
+def test_refresh_FileShrunkOrRewritten_DescribesWholeFile(mocker, tmp_path, create_csv, timestamps):
+    # Arrange
+    create_csv("TSLA", ["2024-01-02", "2024-01-03"])
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    create_csv("TSLA", timestamps)
+    describe = mocker.spy(SymbolCatalog, "describe")
+
+    # Act
+    catalog.refresh()
+
+    # Assert
+    describe.assert_called_once()
+    assert catalog.entry("TSLA").rows == len(timestamps)
+
+
+def test_refresh_FileAddedAndRemoved_UpdatesSymbols(tmp_path, create_csv):
+    # Arrange
+    aapl = create_csv("AAPL", ["2024-01-02"])
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    create_csv("MSFT", ["2024-01-02"])
+    os.remove(aapl)
+
+    # Act
+    changed = catalog.refresh()
+
+    # Assert
+    assert changed == 2
+    assert catalog.symbols() == ["MSFT"]
+
+
+def test_fingerprint_FileChanged_Changes(tmp_path, create_csv):
+    # Arrange
+    create_csv("AAPL", ["2024-01-02"])
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    before = catalog.fingerprint()
+
+    # Act
+    unchanged = SymbolCatalog.get(str(tmp_path / "1d"), "1d").fingerprint()
+    create_csv("AAPL", ["2024-01-02", "2024-01-03"])
+    changed = SymbolCatalog.get(str(tmp_path / "1d"), "1d").fingerprint()
+
+    # Assert
+    assert unchanged == before
+    assert changed != before
+
+
+def test_get_WithinRefreshSeconds_ReusesListingUntilForced(mocker, tmp_path, create_csv):
+    # Arrange
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 60}})
+    create_csv("AAPL", ["2024-01-02"])
+    folder = str(tmp_path / "1d")
+    SymbolCatalog.get(folder, "1d")
+    create_csv("MSFT", ["2024-01-02"])
+    spy = mocker.spy(SymbolCatalog, "refresh")
+
+    # Act
+    polled = SymbolCatalog.get(folder, "1d").symbols()
+    forced = SymbolCatalog.get(folder, "1d", refresh=True).symbols()
+
+    # Assert
+    assert polled == ["AAPL"]
+    assert forced == ["AAPL", "MSFT"]
+    assert spy.call_count == 1
+
+
+def test_get_NewProcess_LoadsPersistedCatalog(mocker, tmp_path, create_csv):
+    # Arrange
+    create_csv("AAPL", ["2024-01-02", "2024-01-03"])
+    SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+    SymbolCatalog.clear()
+    spy = mocker.spy(SymbolCatalog, "describe")
+
+    # Act
+    catalog = SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+
+    # Assert
+    spy.assert_not_called()
+    assert catalog.entry("AAPL").rows == 2
+    with open(SymbolCatalog.catalog_path(str(tmp_path / "1d"))) as f:
+        assert json.load(f)["symbols"]["AAPL"]["file"] == "1d-AAPL.csv"
+
+
+def test_get_DirectoryMissing_RaisesFileNotFound(tmp_path):
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        SymbolCatalog.get(str(tmp_path / "1d"), "1d")
+
+
+# ---------------------------------------------------------------------------
+# describe()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "content,rows,first,last",
+    [
+        (b"Timestamp,Close\n", 0, None, None),
+        (b"Timestamp,Close\r\n2024-01-02,1\r\n2024-01-03,2", 2, "2024-01-02", "2024-01-03"),
+        (b"Close\n1\n2\n", 2, None, None),
+    ]
+)
+def test_describe_FileContent_CountsRowsAndTimestamps(tmp_path, content, rows, first, last):
+    # Arrange
+    file_path = tmp_path / "1d-AAPL.csv"
+    file_path.write_bytes(content)
+
+    # Act
+    entry = SymbolCatalog.describe(str(file_path), "AAPL", len(content), 0)
+
+    # Assert
+    assert (entry.rows, entry.first_timestamp, entry.last_timestamp) == (rows, first, last)
@@ -0,0 +1,153 @@
+import pandas as pd
+import pytest
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.data.symbol_stats import SymbolStatsTable
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_tables(mocker):
+    mocker.patch("strategies.core.data.symbol_stats.load_config", return_value={"stats": {"volume_bars": 2}})
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 0}})
+    SymbolCatalog.clear()
+    SymbolStatsTable.clear()
+    yield
+    SymbolCatalog.clear()
+    SymbolStatsTable.clear()
+
+
+@pytest.fixture
+def create_csv(tmp_path):
+    def _create(symbol, closes, volumes=None):
+        folder = tmp_path / "1d"
+        folder.mkdir(exist_ok=True)
+        pd.DataFrame({
+            "Symbol": [symbol] * len(closes),
+            "Timestamp": [f"2024-01-{i + 2:02d} 00:00:00" for i in range(len(closes))],
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": volumes or [100] * len(closes),
+        }).to_csv(folder / f"1d-{symbol}.csv", index=False)
+        return str(folder)
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# get() / refresh()
+# ---------------------------------------------------------------------------
+
+def test_get_Folder_ComputesStats(create_csv):
+    # Arrange
+    folder = create_csv("AAPL", [10.0, 12.0, 11.0], [100, 200, 400])
+
+    # Act
+    stats = SymbolStatsTable.get(folder, "1d").stats("AAPL")
+
+    # Assert
+    assert stats.bars == 3
+    assert stats.last_close == 11.0
+    assert stats.last_timestamp == "2024-01-04 00:00:00"
+    assert stats.avg_volume == 300.0
+    assert (stats.min_price, stats.max_price) == (9.0, 13.0)
+
+
+def test_refresh_OneFileChanged_RecomputesOnlyIt(mocker, create_csv):
+    # Arrange
+    create_csv("AAPL", [10.0])
+    folder = create_csv("TSLA", [10.0])
+    table = SymbolStatsTable.get(folder, "1d")
+    create_csv("TSLA", [10.0, 20.0])
+    spy = mocker.spy(SymbolStatsTable, "compute")
+
+    # Act
+    changed = table.refresh()
+
+    # Assert
+    assert changed == 1
+    assert spy.call_count == 1
+    assert table.stats("TSLA").last_close == 20.0
+
+
+def test_refresh_RowsAppended_ExtendsStatsFromTail(mocker, create_csv):
+    # Arrange
+    folder = create_csv("AAPL", [10.0, 12.0], [100, 200])
+    table = SymbolStatsTable.get(folder, "1d")
+    with open(f"{folder}/1d-AAPL.csv", "a") as f:
+        f.write("AAPL,2024-01-04 00:00:00,31.0,29.0,30.0,600\n")
+    spy = mocker.spy(SymbolStatsTable, "read")
+
+    # Act
+    changed = table.refresh()
+
+    # Assert
+    stats = table.stats("AAPL")
+    assert changed == 1
+    spy.assert_not_called()
+    assert (stats.bars, stats.last_close, stats.last_timestamp) == (3, 30.0, "2024-01-04 00:00:00")
+    assert (stats.min_price, stats.max_price) == (9.0, 31.0)
+    assert stats.avg_volume == 400.0
+
+
+def test_refresh_RowsRewritten_ReadsWholeFile(mocker, create_csv):
+    # Arrange
+    folder = create_csv("AAPL", [10.0, 12.0])
+    table = SymbolStatsTable.get(folder, "1d")
+    create_csv("AAPL", [50.0, 12.0, 14.0])
+    spy = mocker.spy(SymbolStatsTable, "read")
+
+    # Act
+    table.refresh()
+
+    # Assert
+    assert spy.call_count == 1
+    assert (table.stats("AAPL").bars, table.stats("AAPL").max_price) == (3, 51.0)
+
+
+def test_get_Symbols_ComputesOnlyTheirStats(mocker, create_csv):
+    # Arrange
+    create_csv("AAPL", [10.0])
+    create_csv("MSFT", [10.0])
+    folder = create_csv("TSLA", [10.0])
+    spy = mocker.spy(SymbolStatsTable, "compute")
+
+    # Act
+    table = SymbolStatsTable.get(folder, "1d", ["AAPL", "TSLA"])
+
+    # Assert
+    assert spy.call_count == 2
+    assert table.symbols() == ["AAPL", "TSLA"]
+    assert table.stats("MSFT") is None
+
+def test_get_NewProcess_LoadsPersistedStats(mocker, create_csv):
+    # Arrange
+    folder = create_csv("AAPL", [10.0, 12.0])
+    SymbolStatsTable.get(folder, "1d")
+    SymbolCatalog.clear()
+    SymbolStatsTable.clear()
+    spy = mocker.spy(SymbolStatsTable, "compute")
+
+    # Act
+    table = SymbolStatsTable.get(folder, "1d")
+
+    # Assert
+    spy.assert_not_called()
+    assert table.stats("AAPL").bars == 2
+
+
+# ---------------------------------------------------------------------------
+# compute()
+# ---------------------------------------------------------------------------
+
+def test_compute_EmptyOrCloseOnly_HandlesMissingColumns():
+    # Act
+    empty = SymbolStatsTable.compute("A", pd.DataFrame(), (1, 2), 20)
+    close_only = SymbolStatsTable.compute("A", pd.DataFrame({"Close": [3.0, 1.0]}), (1, 2), 20)
+
+    # Assert
+    assert empty.bars == 0 and empty.last_close is None
+    assert (close_only.min_price, close_only.max_price, close_only.avg_volume) == (1.0, 3.0, None)
@@ -0,0 +1,62 @@
+import pytest
+from strategies.core.data.symbol_universe import SymbolUniverse, UnknownUniverseError
+from strategies.schemas.strategy_schema import SymbolScope
+
+AVAILABLE = ["AAPL", "AMD", "AMZN", "MSFT", "NVDA", "TSLA"]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def config(mocker, tmp_path):
+    (tmp_path / "tech.txt").write_text("# semiconductors\nAMD\nNVDA  # gpus\n\nINTC\n")
+    config = {
+        "data": {"directory": str(tmp_path)},
+        "universes": {"watchlist": ["TSLA", "AAPL", "GME"], "tech": "tech.txt"},
+    }
+    mocker.patch("strategies.core.data.symbol_universe.load_config", return_value=config)
+    return config
+
+
+# ---------------------------------------------------------------------------
+# resolve()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("scope", [None, SymbolScope()])
+def test_resolve_Unscoped_ReturnsAllSymbols(scope):
+    # Act / Assert
+    assert SymbolUniverse.resolve(AVAILABLE, scope) == AVAILABLE
+
+
+@pytest.mark.parametrize(
+    "scope,expected",
+    [
+        (SymbolScope(symbols=["NVDA", "AAPL", "XYZ"]), ["AAPL", "NVDA"]),
+        (SymbolScope(universe="watchlist"), ["AAPL", "TSLA"]),
+        (SymbolScope(universe="tech"), ["AMD", "NVDA"]),
+        (SymbolScope(glob="A*"), ["AAPL", "AMD", "AMZN"]),
+        (SymbolScope(universe="watchlist", glob="A*"), ["AAPL"]),
+        (SymbolScope(symbols=["AMD", "MSFT"], universe="tech"), ["AMD"]),
+    ]
+)
+def test_resolve_Scope_ReturnsAvailableSymbolsWithinItInOrder(scope, expected):
+    # Act / Assert
+    assert SymbolUniverse.resolve(AVAILABLE, scope) == expected
+
+
+def test_resolve_UnknownUniverse_RaisesUnknownUniverseError():
+    # Act / Assert
+    with pytest.raises(UnknownUniverseError):
+        SymbolUniverse.resolve(AVAILABLE, SymbolScope(universe="missing"))
+
+
+def test_definition_SameScopeAnyOrder_SameDefinition():
+    # Act
+    first = SymbolUniverse.definition(SymbolScope(symbols=["MSFT", "AAPL"], glob="A*"))
+    second = SymbolUniverse.definition(SymbolScope(glob="A*", symbols=["AAPL", "MSFT"]))
+
+    # Assert
+    assert first == second == {"symbols": ["AAPL", "MSFT"], "glob": "A*"}
+    assert SymbolUniverse.definition(SymbolScope()) is None
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from scipy.signal import argrelextrema
+from strategies.core.strategies.divergence import Divergence
+
+
+def reference_window(prices, oscillator, kind):
+    """The argrelextrema scan of one window the kernel replaces."""
+    pivots = argrelextrema(prices, np.less if kind == "bullish" else np.greater)[0]
+    for i1, i2 in zip(pivots[:-1], pivots[1:]):
+        if kind == "bullish" and prices[i2] < prices[i1] and oscillator[i2] > oscillator[i1]:
+            return True
+        if kind == "bearish" and prices[i2] > prices[i1] and oscillator[i2] < oscillator[i1]:
+            return True
+    return False
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(4)
+    prices = 100 + rng.normal(0, 1, 300).cumsum()
+    oscillator = 50 + rng.normal(0, 10, 300)
+    return prices, oscillator
+
+
+# ---------------------------------------------------------------------------
+# pivots()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("kind,comparator", [("bullish", np.less), ("bearish", np.greater)])
+@pytest.mark.parametrize("order", [1, 2, 5])
+def test_pivots_Series_MatchesArgrelextremaAwayFromEdges(series, kind, comparator, order):
+    # Arrange
+    prices, _ = series
+
+    # Act
+    mask = Divergence.pivots(prices, kind, order)
+
+    # Assert
+    expected = argrelextrema(prices, comparator, order=order)[0]
+    expected = expected[(expected >= order) & (expected < len(prices) - order)]
+    assert np.array_equal(np.flatnonzero(mask), expected)
+
+
+def test_pivots_InvalidKind_RaisesValueError(series):
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Divergence.pivots(series[0], "sideways")
+
+
+# ---------------------------------------------------------------------------
+# events()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("kind", ["bullish", "bearish"])
+@pytest.mark.parametrize("window", [5, 6, 12, 40])
+def test_events_EveryBar_MatchesWindowScan(series, kind, window):
+    # Arrange
+    prices, oscillator = series
+
+    # Act
+    events = Divergence.events(prices, oscillator, kind, order=1, window=window)
+
+    # Assert
+    expected = [reference_window(prices[max(t - window + 1, 0):t + 1], oscillator[max(t - window + 1, 0):t + 1], kind)
+                for t in range(len(prices))]
+    assert events.tolist() == expected
+    assert any(expected)
+
+
+@pytest.mark.parametrize("order", [2, 3])
+def test_events_HigherOrder_OnlyPairsWithFullNeighbourhoods(series, order):
+    # Arrange
+    prices, oscillator = series
+    window = 30
+
+    # Act
+    events = Divergence.events(prices, oscillator, "bullish", order=order, window=window)
+
+    # Assert
+    for t in range(len(prices)):
+        start = max(t - window + 1, 0)
+        pivots = [p for p in np.flatnonzero(Divergence.pivots(prices, "bullish", order)) if start + order <= p <= t - order]
+        expected = any(prices[b] < prices[a] and oscillator[b] > oscillator[a] for a, b in zip(pivots[:-1], pivots[1:]))
+        assert events[t] == expected
+
+
+def test_events_Panel_SameAsEachRow(series):
+    # Arrange
+    rng = np.random.default_rng(8)
+    prices = 100 + rng.normal(0, 1, (6, 120)).cumsum(axis=1)
+    oscillator = 50 + rng.normal(0, 10, (6, 120))
+    prices[2, :50] = np.nan   # a shorter, left-padded history
+
+    # Act
+    events = Divergence.events(prices, oscillator, "bearish", window=10)
+
+    # Assert
+    for row in range(prices.shape[0]):
+        assert np.array_equal(events[row], Divergence.events(prices[row], oscillator[row], "bearish", window=10))
+    assert not events[2, :52].any()
@@ -78,9 +78,8 @@ def test_get_symbols_VariousPatterns_ReturnsExpectedSymbols(
     folder = tmp_path / "1d"
     folder.mkdir(parents=True, exist_ok=True)
     mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
-    mocker.patch("os.listdir", return_value=files)
-    mocker.patch("os.path.isfile", return_value=True)
-    mocker.patch("pandas.read_csv", side_effect=lambda f: dfs[os.path.basename(f)])
+    for file_name in files:
+        dfs[file_name].to_csv(folder / file_name, index=False)
 
     strategy = EngulfingStrategy("1d")
 
@@ -91,11 +90,15 @@ def test_get_symbols_VariousPatterns_ReturnsExpectedSymbols(
     assert sorted(result) == sorted(expected_symbols), f"Failed case: {description}"
 
 
-def test_get_symbols_FileNotCsvOrInvalidName_SkipsFile(mocker):
+def test_get_symbols_FileNotCsvOrInvalidName_SkipsFile(mocker, tmp_path):
     """get_symbols(): Should skip non-matching file names."""
     # Arrange
-    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": "/tmp"}})
-    mocker.patch("os.listdir", return_value=["random.txt", "TSLA.csv", "1h-IBM.csv"])
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    engulfing = "Open,Close\n100,90\n85,105\n"
+    for file_name in ["random.txt", "TSLA.csv", "1h-IBM.csv"]:
+        (folder / file_name).write_text(engulfing)
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
     strategy = EngulfingStrategy("1d")
 
     # Act
@@ -105,12 +108,11 @@ def test_get_symbols_FileNotCsvOrInvalidName_SkipsFile(mocker):
     assert result == []
 
 
-def test_get_symbols_FileDoesNotExist_SkipsFile(mocker):
+def test_get_symbols_FileDoesNotExist_SkipsFile(mocker, tmp_path):
     """get_symbols(): Should skip files that are not actual files."""
     # Arrange
-    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": "/tmp"}})
-    mocker.patch("os.listdir", return_value=["1d-TSLA.csv"])
-    mocker.patch("os.path.isfile", return_value=False)
+    (tmp_path / "1d" / "1d-TSLA.csv").mkdir(parents=True)
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
     strategy = EngulfingStrategy("1d")
 
     # Act
@@ -120,13 +122,13 @@ def test_get_symbols_FileDoesNotExist_SkipsFile(mocker):
     assert result == []
 
 
-def test_get_symbols_ReadCsvRaisesException_LogsWarningAndSkips(mocker):
+def test_get_symbols_ReadCsvRaisesException_LogsWarningAndSkips(mocker, tmp_path):
     """get_symbols(): Should log warning and skip file if read_csv raises exception."""
     # Arrange
+    (tmp_path / "1d").mkdir()
+    (tmp_path / "1d" / "1d-FAIL.csv").write_text("Open,Close\n100,90\n85,105\n")
     mock_logger = mocker.patch("strategies.core.strategies.engulfing.logger")
-    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": "/tmp"}})
-    mocker.patch("os.listdir", return_value=["1d-FAIL.csv"])
-    mocker.patch("os.path.isfile", return_value=True)
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
     mocker.patch("pandas.read_csv", side_effect=Exception("read error"))
     strategy = EngulfingStrategy("1d")
 
@@ -139,11 +141,11 @@ def test_get_symbols_ReadCsvRaisesException_LogsWarningAndSkips(mocker):
     mock_logger.warning.assert_called_with("Skipping 1d-FAIL.csv: read error")
 
 
-def test_get_symbols_NoFilesFound_ReturnsEmptyList(mocker):
+def test_get_symbols_NoFilesFound_ReturnsEmptyList(mocker, tmp_path):
     """get_symbols(): Should return empty list if folder has no files."""
     # Arrange
-    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": "/tmp"}})
-    mocker.patch("os.listdir", return_value=[])
+    (tmp_path / "1d").mkdir()
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
     strategy = EngulfingStrategy("1d")
 
     # Act
@@ -154,18 +156,17 @@ def test_get_symbols_NoFilesFound_ReturnsEmptyList(mocker):
     assert isinstance(result, list)
 
 
-def test_get_symbols_LogsFinalSymbolCount(mocker):
+def test_get_symbols_LogsFinalSymbolCount(mocker, tmp_path):
     """get_symbols(): Should log total number of detected symbols."""
     # Arrange
     mock_logger = mocker.patch("strategies.core.strategies.engulfing.logger")
-    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": "/tmp"}})
-    mocker.patch("os.listdir", return_value=["1d-AAPL.csv"])
-    mocker.patch("os.path.isfile", return_value=True)
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
+    (tmp_path / "1d").mkdir()
     df = pd.DataFrame([
         {"Open": 100, "Close": 90},
         {"Open": 85, "Close": 105},
     ])
-    mocker.patch("pandas.read_csv", return_value=df)
+    df.to_csv(tmp_path / "1d" / "1d-AAPL.csv", index=False)
 
     strategy = EngulfingStrategy("1d")
 
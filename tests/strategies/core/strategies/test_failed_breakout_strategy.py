@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import pandas as pd
 from datetime import datetime, timedelta
@@ -223,3 +224,75 @@ def test__is_failed_bullbo_NoYesterday_ReturnsFalse():
 
     # Assert
     assert result is False
+
+
+# ================================
+# Tests for failed_breakouts
+# ================================
+def reference_failed(breaks, accepts, holds, max_accept_bars):
+    """The bar-by-bar loop the vectorized check replaced."""
+    n = len(breaks)
+    for i in range(n):
+        if breaks[i]:
+            for j in range(i, min(i + max_accept_bars + 1, n)):
+                if accepts[j]:
+                    return all(holds[j + 1:])
+            return False
+    return False
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_failed_breakouts_RandomSessions_MatchesBarByBarLoop(seed):
+    # Arrange
+    rng = np.random.default_rng(seed)
+    session = 12
+    bars = 3 * session
+    closes = 100 + rng.normal(0, 0.4, bars).cumsum()
+    start = datetime(2024, 3, 4, 9, 15)
+    timestamps = [start + timedelta(days=i // session, minutes=5 * (i % session)) for i in range(bars)]
+    df = make_5min_df(start, closes + rng.uniform(0, 0.5, bars), closes - rng.uniform(0, 0.5, bars), closes)
+    df["Timestamp"] = timestamps
+    previous, current = df.iloc[session:2 * session], df.iloc[2 * session:]
+    loy, hoy = previous["Low"].min(), previous["High"].max()
+    expected = (
+        reference_failed(current["Low"].values < loy, current["Close"].values > loy, current["Close"].values >= loy, 3),
+        reference_failed(current["High"].values > hoy, current["Close"].values < hoy, current["Close"].values <= hoy, 3),
+    )
+
+    # Act
+    result = FailedBreakoutStrategy.failed_breakouts(df, 3)
+
+    # Assert
+    assert result == expected
+
+
+def test_failed_breakouts_UnsortedRows_SameAsSorted():
+    # Arrange
+    yesterday = pd.Timestamp("2024-03-04 09:15")
+    today = pd.Timestamp("2024-03-05 09:15")
+    df = pd.concat([
+        make_5min_df(yesterday, [105, 106], [100, 101], [103, 104]),
+        make_5min_df(today, [104, 107, 105], [99, 102, 103], [102, 105, 104]),
+    ], ignore_index=True)
+    shuffled = df.sample(frac=1, random_state=3).reset_index(drop=True)
+
+    # Act
+    result = FailedBreakoutStrategy.failed_breakouts(shuffled)
+
+    # Assert
+    assert result == FailedBreakoutStrategy.failed_breakouts(df) == (True, True)
+
+
+def test_failed_breakouts_StringTimestamps_Parsed():
+    # Arrange
+    df = pd.concat([
+        make_5min_df(datetime(2024, 3, 4, 9, 15), [105], [100], [103]),
+        make_5min_df(datetime(2024, 3, 5, 9, 15), [104, 104], [99, 101], [101, 102]),
+    ], ignore_index=True)
+    df["Timestamp"] = df["Timestamp"].astype(str)
+
+    # Act
+    result = FailedBreakoutStrategy.failed_breakouts(df)
+
+    # Assert
+    assert result == (True, False)
@@ -0,0 +1,131 @@
+import json
+import numpy as np
+import pytest
+import talib
+from strategies.core.strategies.incremental_indicators import (
+    IncrementalBollingerBands,
+    IncrementalEma,
+    IncrementalMacd,
+    IncrementalRsi,
+    run,
+)
+
+TOLERANCE = 1e-8
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(11)
+    return 100 + rng.normal(0, 1, 500).cumsum()
+
+
+def assert_matches(actual, expected):
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual[~np.isnan(expected)], expected[~np.isnan(expected)], rtol=0, atol=TOLERANCE)
+
+
+# ---------------------------------------------------------------------------
+# Parity with talib
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("period", [1, 5, 12, 30])
+def test_IncrementalEma_Series_MatchesTalib(closes, period):
+    # Act
+    result = run(IncrementalEma(period), closes)
+
+    # Assert
+    assert_matches(result, talib.EMA(closes, timeperiod=period))
+
+
+@pytest.mark.parametrize("period", [2, 6, 14, 30])
+def test_IncrementalRsi_Series_MatchesTalib(closes, period):
+    # Act
+    result = run(IncrementalRsi(period), closes)
+
+    # Assert
+    assert_matches(result, talib.RSI(closes, timeperiod=period))
+
+
+def test_IncrementalRsi_FlatSeries_ReturnsZeroLikeTalib():
+    # Arrange
+    closes = np.full(30, 10.0)
+
+    # Act
+    result = run(IncrementalRsi(14), closes)
+
+    # Assert
+    assert_matches(result, talib.RSI(closes, timeperiod=14))
+
+
+@pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (5, 35, 5), (3, 10, 16), (26, 12, 9)])
+def test_IncrementalMacd_Series_MatchesTalib(closes, fast, slow, signal):
+    # Act
+    result = run(IncrementalMacd(fast, slow, signal), closes)
+
+    # Assert
+    expected = talib.MACD(closes, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+    for column in range(3):
+        assert_matches(result[:, column], expected[column])
+
+
+@pytest.mark.parametrize("period,nbdev", [(5, 2.0), (20, 2.0), (12, 1.5)])
+def test_IncrementalBollingerBands_Series_MatchesTalib(closes, period, nbdev):
+    # Act
+    result = run(IncrementalBollingerBands(period, nbdev), closes)
+
+    # Assert
+    expected = talib.BBANDS(closes, timeperiod=period, nbdevup=nbdev, nbdevdn=nbdev, matype=0)
+    for column in range(3):
+        assert_matches(result[:, column], expected[column])
+
+
+def test_IncrementalBollingerBands_LargePrices_StaysAccurate():
+    # Arrange
+    rng = np.random.default_rng(3)
+    closes = 1e6 + rng.normal(0, 0.01, 20000).cumsum()
+
+    # Act
+    result = run(IncrementalBollingerBands(20, 2.0), closes)
+
+    # Assert
+    windows = np.lib.stride_tricks.sliding_window_view(closes, 20)
+    np.testing.assert_allclose(result[19:, 1], windows.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(result[19:, 0] - result[19:, 1], 2.0 * windows.std(axis=1), atol=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# Serialization
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "make,cls",
+    [
+        (lambda: IncrementalEma(10), IncrementalEma),
+        (lambda: IncrementalRsi(14), IncrementalRsi),
+        (lambda: IncrementalMacd(12, 26, 9), IncrementalMacd),
+        (lambda: IncrementalBollingerBands(20, 2.0), IncrementalBollingerBands),
+    ]
+)
+@pytest.mark.parametrize("split", [3, 30, 250])
+def test_to_dict_RestoredMidSeries_ContinuesIdentically(closes, make, cls, split):
+    # Arrange
+    uninterrupted = run(make(), closes)
+    indicator = make()
+    head = run(indicator, closes[:split])
+
+    # Act
+    restored = cls.from_dict(json.loads(json.dumps(indicator.to_dict())))
+    tail = run(restored, closes[split:])
+
+    # Assert
+    np.testing.assert_allclose(np.concatenate([head, tail]), uninterrupted, rtol=0, atol=TOLERANCE)
+
+
+def test_IncrementalEma_InvalidPeriod_RaisesValueError():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        IncrementalEma(0)
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+import pytest
+import talib as ta
+from unittest.mock import MagicMock
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.strategies.incremental_indicators import IncrementalBollingerBands, IncrementalMacd, IncrementalRsi
+from strategies.core.strategies.indicator_cache import IndicatorCache
+from strategies.core.strategies.rsi_strategy import RsiStrategy
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_cache(mocker):
+    mocker.patch("strategies.core.strategies.indicator_cache.load_config",
+                 return_value={"cache": {"indicator_cache_bytes": 1024 * 1024}})
+    IndicatorCache.clear()
+    yield
+    IndicatorCache.clear()
+
+
+def tagged(values, interval="1d", symbol="AAPL", version=(1, 2)):
+    df = pd.DataFrame({"Close": values})
+    return DataFrameCache.tag(df, f"/data/{interval}/{interval}-{symbol}.csv", (interval, symbol, version))
+
+
+# ---------------------------------------------------------------------------
+# get()
+# ---------------------------------------------------------------------------
+
+def test_get_SameSeriesTwice_ComputesOnce():
+    # Arrange
+    compute = MagicMock(return_value=np.arange(3.0))
+
+    # Act
+    first = IndicatorCache.get(tagged([1.0, 2.0, 3.0]), "RSI", (14,), compute)
+    second = IndicatorCache.get(tagged([1.0, 2.0, 3.0]), "RSI", (14,), compute)
+
+    # Assert
+    compute.assert_called_once()
+    assert second is first
+    assert IndicatorCache.stats()["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        lambda: tagged([1.0, 2.0]),                  # fewer bars of the same file
+        lambda: tagged([1.0, 2.0, 3.0], version=(9, 9)),  # new data version
+        lambda: tagged([1.0, 2.0, 3.0], symbol="TSLA"),
+    ]
+)
+def test_get_DifferentSeries_ComputesAgain(other):
+    # Arrange
+    compute = MagicMock(return_value=np.arange(3.0))
+    IndicatorCache.get(tagged([1.0, 2.0, 3.0]), "RSI", (14,), compute)
+
+    # Act
+    IndicatorCache.get(other(), "RSI", (14,), compute)
+
+    # Assert
+    assert compute.call_count == 2
+
+
+def test_get_UntaggedFrame_NeverCached():
+    # Arrange
+    compute = MagicMock(return_value=np.arange(3.0))
+    df = pd.DataFrame({"Close": [1.0, 2.0, 3.0]})
+
+    # Act
+    IndicatorCache.get(df, "RSI", (14,), compute)
+    IndicatorCache.get(df, "RSI", (14,), compute)
+
+    # Assert
+    assert compute.call_count == 2
+    assert IndicatorCache.stats()["entries"] == 0
+
+
+def test_get_OverBudget_EvictsLeastRecentlyUsed(mocker):
+    # Arrange
+    mocker.patch("strategies.core.strategies.indicator_cache.load_config",
+                 return_value={"cache": {"indicator_cache_bytes": 2 * 800}})
+    compute = lambda: np.zeros(100)  # 800 bytes
+
+    # Act
+    for symbol in ["A", "B", "C"]:
+        IndicatorCache.get(tagged([1.0], symbol=symbol), "RSI", (14,), compute)
+
+    # Assert
+    stats = IndicatorCache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_invalidate_Interval_DropsOnlyThatInterval():
+    # Arrange
+    IndicatorCache.get(tagged([1.0], interval="1d"), "RSI", (14,), lambda: np.zeros(1))
+    IndicatorCache.get(tagged([1.0], interval="1h"), "RSI", (14,), lambda: np.zeros(1))
+
+    # Act
+    dropped = IndicatorCache.invalidate("1h")
+
+    # Assert
+    assert dropped == 1
+    assert IndicatorCache.stats()["entries"] == 1
+
+
+def test_rsi_strategy_TwoStepsOnSameSeries_ComputeRsiOnce(mocker):
+    # Arrange
+    mock_rsi = mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=pd.Series([20.0] * 50))
+    df = tagged(np.linspace(100, 110, 50))
+
+    # Act
+    RsiStrategy.is_rsi_oversold(df)
+    RsiStrategy.is_rsi_bullish_divergence(df)
+
+    # Assert
+    mock_rsi.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get() with an incremental state
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def growing_csv(mocker, tmp_path):
+    """A "1d-AAPL.csv" file read through DataFrameCache, and a function appending closes to it."""
+    mocker.patch("strategies.core.data.dataframe_cache.load_config", return_value={"cache": {}})
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    DataFrameCache.clear()
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    file_path = folder / "1d-AAPL.csv"
+    closes = 100 + np.cumsum(np.random.default_rng(7).normal(0, 1, 80))
+    pd.DataFrame({"Close": closes[:60]}).to_csv(file_path, index=False)
+
+    def append(values):
+        with open(file_path, "a") as f:
+            f.writelines(f"{value}\n" for value in values)
+
+    yield str(file_path), closes, append
+    DataFrameCache.clear()
+
+
+@pytest.mark.parametrize("indicator,params,compute,incremental", [
+    ("RSI", (14,), lambda close: ta.RSI(close, timeperiod=14), lambda: IncrementalRsi(14)),
+    ("MACD", (12, 26, 9), lambda close: ta.MACD(close, 12, 26, 9), lambda: IncrementalMacd(12, 26, 9)),
+    ("BBANDS", (20, 2.0), lambda close: ta.BBANDS(close, 20, 2.0, 2.0, 0), lambda: IncrementalBollingerBands(20, 2.0)),
+])
+def test_get_FileOnlyGrew_ExtendsPreviousResultLikeTalib(growing_csv, indicator, params, compute, incremental):
+    # Arrange
+    file_path, closes, append = growing_csv
+    df = DataFrameCache.read_csv(file_path)
+    IndicatorCache.get(df, indicator, params, lambda: compute(df["Close"]), incremental)
+    compute_spy = MagicMock(side_effect=lambda: compute(grown["Close"]))
+
+    # Act
+    append(closes[60:70])
+    grown = DataFrameCache.read_csv(file_path)
+    first = IndicatorCache.get(grown, indicator, params, compute_spy, incremental)
+    append(closes[70:])
+    grown = DataFrameCache.read_csv(file_path)
+    second = IndicatorCache.get(grown, indicator, params, compute_spy, incremental)
+
+    # Assert
+    compute_spy.assert_not_called()
+    assert IndicatorCache.stats()["extensions"] == 2
+    assert len(first[0] if isinstance(first, tuple) else first) == 70
+    expected = compute(pd.Series(closes))
+    for actual, wanted in zip(second if isinstance(second, tuple) else (second,),
+                              expected if isinstance(expected, tuple) else (expected,)):
+        assert isinstance(actual, pd.Series)
+        np.testing.assert_allclose(actual.to_numpy(), wanted.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_get_FileRewritten_ComputesAgain(growing_csv):
+    # Arrange
+    file_path, closes, _ = growing_csv
+    df = DataFrameCache.read_csv(file_path)
+    IndicatorCache.get(df, "RSI", (14,), lambda: ta.RSI(df["Close"], timeperiod=14), lambda: IncrementalRsi(14))
+    pd.DataFrame({"Close": closes[::-1]}).to_csv(file_path, index=False)
+    rewritten = DataFrameCache.read_csv(file_path)
+    compute = MagicMock(return_value=np.zeros(len(rewritten)))
+
+    # Act
+    IndicatorCache.get(rewritten, "RSI", (14,), compute, lambda: IncrementalRsi(14))
+
+    # Assert
+    compute.assert_called_once()
+    assert IndicatorCache.stats()["extensions"] == 0
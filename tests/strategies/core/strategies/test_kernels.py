@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta
+from strategies.core.strategies.divergence import Divergence
+from strategies.core.strategies.engulfing import EngulfingStrategy
+from strategies.core.strategies.failed_breakout_strategy import FailedBreakoutStrategy
+from strategies.core.strategies.kernels import Kernels
+from strategies.core.strategies.panel_strategies import PanelStrategies
+from strategies.core.strategies.rsi_strategy import RsiStrategy
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def numpy_backend(mocker):
+    return mocker.patch("strategies.core.strategies.kernels.load_config", return_value={"kernels": {"backend": "numpy"}})
+
+
+@pytest.fixture
+def loop_backend(mocker):
+    """Run the kernel loops as the compiled backend would, without needing numba."""
+    return mocker.patch.object(Kernels, "compiled", side_effect=lambda name: Kernels.LOOPS[name])
+
+
+def sessions_frame(seed, session=12):
+    rng = np.random.default_rng(seed)
+    bars = 3 * session
+    closes = 100 + rng.normal(0, 0.4, bars).cumsum()
+    start = datetime(2024, 3, 4, 9, 15)
+    return pd.DataFrame({
+        "Timestamp": [start + timedelta(days=i // session, minutes=5 * (i % session)) for i in range(bars)],
+        "Open": closes + rng.normal(0, 0.3, bars),
+        "High": closes + rng.uniform(0, 0.5, bars),
+        "Low": closes - rng.uniform(0, 0.5, bars),
+        "Close": closes,
+    })
+
+
+# ---------------------------------------------------------------------------
+# backend()
+# ---------------------------------------------------------------------------
+
+def test_backend_NumpyConfigured_NoCompiledKernels(numpy_backend):
+    # Act / Assert
+    assert Kernels.backend() == "numpy"
+    assert Kernels.compiled("divergence") is None
+    assert Kernels.warm_up() == "numpy"
+
+
+def test_backend_NumbaMissing_FallsBackToNumpy(mocker):
+    # Arrange
+    mocker.patch("strategies.core.strategies.kernels.load_config", return_value={"kernels": {"backend": "numba"}})
+    mocker.patch("strategies.core.strategies.kernels.njit", None)
+
+    # Act / Assert
+    assert Kernels.backend() == "numpy"
+    assert Kernels.compiled("engulfing") is None
+
+
+def test_backend_UnknownName_RaisesValueError(mocker):
+    # Arrange
+    mocker.patch("strategies.core.strategies.kernels.load_config", return_value={"kernels": {"backend": "gpu"}})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Kernels.backend()
+
+
+# ---------------------------------------------------------------------------
+# Kernel loops match the NumPy kernels and the strategies' results
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("seed", range(15))
+def test_failed_breakout_Loop_MatchesNumpyStrategy(mocker, numpy_backend, seed):
+    # Arrange
+    df = sessions_frame(seed)
+    expected = FailedBreakoutStrategy._failed_breakouts(df, 3)
+    mocker.patch.object(Kernels, "compiled", side_effect=lambda name: Kernels.LOOPS[name])
+
+    # Act
+    result = FailedBreakoutStrategy._failed_breakouts(df, 3)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize("kind", ["bullish", "bearish"])
+@pytest.mark.parametrize("order,window", [(1, 6), (1, 30), (2, 20), (4, 60)])
+def test_divergence_Loop_MatchesNumpyKernel(mocker, numpy_backend, kind, order, window):
+    # Arrange
+    rng = np.random.default_rng(order * window)
+    prices = 100 + rng.normal(0, 1, (8, 200)).cumsum(axis=1)
+    oscillator = 50 + rng.normal(0, 10, (8, 200))
+    prices[3, :80] = np.nan
+    expected = Divergence.events(prices, oscillator, kind, order, window)
+    mocker.patch.object(Kernels, "compiled", side_effect=lambda name: Kernels.LOOPS[name])
+
+    # Act
+    result = Divergence.events(prices, oscillator, kind, order, window)
+
+    # Assert
+    assert result.dtype == bool
+    assert np.array_equal(result, expected)
+    assert expected.any()
+
+
+@pytest.mark.parametrize("method", [RsiStrategy.is_rsi_bullish_divergence, RsiStrategy.is_rsi_bearish_divergence])
+def test_rsi_divergence_Loop_MatchesNumpyStrategy(mocker, numpy_backend, method):
+    # Arrange
+    rng = np.random.default_rng(2)
+    frames = [pd.DataFrame({"Close": 100 + rng.normal(0, 1, 120).cumsum()}) for _ in range(20)]
+    expected = [method(df, duration=30) for df in frames]
+    mocker.patch.object(Kernels, "compiled", side_effect=lambda name: Kernels.LOOPS[name])
+
+    # Act
+    result = [method(df, duration=30) for df in frames]
+
+    # Assert
+    assert result == expected
+    assert any(expected)
+
+
+def test_engulfing_Loop_MatchesNumpyKernel(mocker, numpy_backend):
+    # Arrange
+    rng = np.random.default_rng(6)
+    opens = rng.uniform(9, 11, (10, 300))
+    closes = rng.uniform(9, 11, (10, 300))
+    expected = PanelStrategies.engulfing(opens, closes)
+    mocker.patch.object(Kernels, "compiled", side_effect=lambda name: Kernels.LOOPS[name])
+
+    # Act
+    result = PanelStrategies.engulfing(opens, closes)
+
+    # Assert
+    assert np.array_equal(result, expected)
+    assert expected.any()
+
+
+def test_engulfing_Loop_MatchesEngulfingStrategy(mocker, tmp_path, loop_backend):
+    # Arrange
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    rng = np.random.default_rng(0)
+    expected = []
+    for i in range(30):
+        o = rng.uniform(9, 11, 2)
+        c = rng.uniform(9, 11, 2)
+        pd.DataFrame({"Open": o, "Close": c}).to_csv(folder / f"1d-S{i:02d}.csv", index=False)
+        if ((c[0] < o[0]) and (c[1] > o[1]) and (o[1] < c[0]) and (c[1] > o[0])) or \
+           ((c[0] > o[0]) and (c[1] < o[1]) and (o[1] > c[0]) and (c[1] < o[0])):
+            expected.append(f"S{i:02d}")
+    mocker.patch("strategies.core.strategies.engulfing.load_config", return_value={"data": {"directory": str(tmp_path)}})
+
+    # Act
+    result = EngulfingStrategy("1d").get_symbols()
+
+    # Assert
+    assert result == expected
+    assert expected
+
+
+# ---------------------------------------------------------------------------
+# numba, when installed
+# ---------------------------------------------------------------------------
+
+def test_warm_up_NumbaInstalled_CompiledKernelsMatchLoops(mocker):
+    # Arrange
+    pytest.importorskip("numba")
+    mocker.patch("strategies.core.strategies.kernels.load_config", return_value={"kernels": {"backend": "numba"}})
+    rng = np.random.default_rng(1)
+    prices = 100 + rng.normal(0, 1, (4, 100)).cumsum(axis=1)
+    oscillator = 50 + rng.normal(0, 10, (4, 100))
+
+    # Act
+    backend = Kernels.warm_up()
+    result = Kernels.compiled("divergence")(prices, oscillator, True, 1, 12)
+
+    # Assert
+    assert backend == "numba"
+    assert np.array_equal(result, Kernels.LOOPS["divergence"](prices, oscillator, True, 1, 12))
@@ -0,0 +1,47 @@
+from strategies.core.strategies.lookback import lookback, min_bars, required_bars, required_min_bars
+
+
+@lookback(lambda period, duration, **_: period + duration)
+def bounded(df, period=20, duration=5):
+    return True
+
+
+@lookback(None)
+def full_history(df, period=20):
+    return True
+
+
+def undeclared(df):
+    return True
+
+
+def test_required_bars_DefaultParams_UsesDefaults():
+    # Act / Assert
+    assert required_bars(bounded) == 25
+
+
+def test_required_bars_GivenParams_OverridesDefaults():
+    # Act / Assert
+    assert required_bars(bounded, {"period": 10, "duration": 2}) == 12
+
+
+def test_required_bars_FullHistoryOrUndeclared_ReturnsNone():
+    # Act / Assert
+    assert required_bars(full_history) is None
+    assert required_bars(undeclared) is None
+
+
+def test_required_bars_UnknownParam_ReturnsNone():
+    # Act / Assert
+    assert required_bars(bounded, {"unknown": 1}) is None
+
+
+def test_required_min_bars_Declared_ReturnsBars():
+    # Arrange
+    @min_bars(lambda period, **_: period)
+    def guarded(df, period=20):
+        return True
+
+    # Act / Assert
+    assert required_min_bars(guarded, {"period": 26}) == 26
+    assert required_min_bars(undeclared) == 0
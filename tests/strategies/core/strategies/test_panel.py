@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from strategies.core.strategies.panel import Panel
+
+
+def test_from_frames_DifferentLengths_AlignedOnLastBar():
+    # Arrange
+    frames = {
+        "AAPL": pd.DataFrame({"Close": [1.0, 2.0, 3.0]}),
+        "MSFT": pd.DataFrame({"Close": [9.0]}),
+    }
+
+    # Act
+    panel = Panel.from_frames(frames, ("Close",))
+
+    # Assert
+    assert panel.symbols == ["AAPL", "MSFT"]
+    assert panel.bars == 3
+    np.testing.assert_array_equal(panel["Close"], [[1.0, 2.0, 3.0], [np.nan, np.nan, 9.0]])
+    np.testing.assert_array_equal(panel.starts, [0, 2])
+
+
+def test_from_frames_MissingOrTextColumn_RowIsNan():
+    # Arrange
+    frames = {
+        "AAPL": pd.DataFrame({"Close": [1.0, 2.0]}),
+        "MSFT": pd.DataFrame({"close": [1.0, 2.0]}),
+        "TSLA": pd.DataFrame({"Close": ["a", "b"]}),
+    }
+
+    # Act
+    panel = Panel.from_frames(frames, ("Close",))
+
+    # Assert
+    assert np.isnan(panel["Close"][1:]).all()
+
+
+def test_from_frames_NoFrames_EmptyPanel():
+    # Act
+    panel = Panel.from_frames({})
+
+    # Assert
+    assert len(panel) == 0
+    assert panel.bars == 0
+
+
+def test_select_Mask_KeepsMatchingRows():
+    # Arrange
+    panel = Panel.from_frames({symbol: pd.DataFrame({"Close": [float(i)]}) for i, symbol in enumerate("ABC")}, ("Close",))
+
+    # Act
+    selected = panel.select(np.array([True, False, True]))
+
+    # Assert
+    assert selected.symbols == ["A", "C"]
+    np.testing.assert_array_equal(selected["Close"][:, 0], [0.0, 2.0])
+
+
+def test_last_MoreBarsThanPanel_PadsLeft():
+    # Arrange
+    panel = Panel.from_frames({"AAPL": pd.DataFrame({"Close": [1.0, 2.0]})}, ("Close",))
+
+    # Act
+    last = panel.last("Close", 3)
+
+    # Assert
+    np.testing.assert_array_equal(last, [[np.nan, 1.0, 2.0]])
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+from strategies.core.strategies.bollingerbands_strategy import BollingerBandsStrategy
+from strategies.core.strategies.macd_strategy import MacdStrategy
+from strategies.core.strategies.panel import Panel
+from strategies.core.strategies.panel_strategies import PanelStrategies
+from strategies.core.strategies.pivotpoints_strategy import PivotPointsStrategy
+from strategies.core.strategies.rsi_strategy import RsiStrategy
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def frames():
+    rng = np.random.default_rng(5)
+    frames = {}
+    for i, bars in enumerate([1, 2, 8, 13, 27, 40, 60, 90, 150, 150, 200, 240] * 4):
+        close = 50 + rng.normal(0, 1, bars).cumsum()
+        frames[f"S{i:02d}"] = pd.DataFrame({
+            "Open": close + rng.normal(0, 0.5, bars),
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+        })
+    return frames
+
+
+def per_symbol(func, frames, **params):
+    return np.array([bool(func(df, **params)) for df in frames.values()])
+
+
+# ---------------------------------------------------------------------------
+# Indicators
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("period", [2, 14, 30])
+def test_rsi_EachRow_MatchesTalib(frames, period):
+    # Act
+    rsi = PanelStrategies.rsi(Panel.from_frames(frames), period)
+
+    # Assert
+    for row, df in enumerate(frames.values()):
+        expected = talib.RSI(df["Close"].to_numpy(), timeperiod=period) if len(df) > 1 else np.full(len(df), np.nan)
+        np.testing.assert_allclose(rsi[row, rsi.shape[1] - len(df):], expected, rtol=0, atol=1e-9)
+        assert np.isnan(rsi[row, :rsi.shape[1] - len(df)]).all()
+
+
+@pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (3, 10, 5), (26, 12, 9)])
+def test_macd_EachRow_MatchesTalib(frames, fast, slow, signal):
+    # Act
+    outputs = PanelStrategies.macd(Panel.from_frames(frames), fast, slow, signal)
+
+    # Assert
+    for row, df in enumerate(frames.values()):
+        expected = talib.MACD(df["Close"].to_numpy(), fastperiod=fast, slowperiod=slow, signalperiod=signal)
+        for actual, wanted in zip(outputs, expected):
+            np.testing.assert_allclose(actual[row, actual.shape[1] - len(df):], wanted, rtol=0, atol=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Checks match the per-symbol strategies
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "scalar,vectorized,params",
+    [
+        (BollingerBandsStrategy.is_near_lower_bb, PanelStrategies.is_near_lower_bb, {}),
+        (BollingerBandsStrategy.is_near_lower_bb, PanelStrategies.is_near_lower_bb, {"period": 20, "duration": 5, "tolerance": 0.02}),
+        (BollingerBandsStrategy.is_near_upper_bb, PanelStrategies.is_near_upper_bb, {}),
+        (BollingerBandsStrategy.is_near_upper_bb, PanelStrategies.is_near_upper_bb, {"period": 5, "nbdev": 1.0, "duration": 30}),
+        (RsiStrategy.is_rsi_overbought, PanelStrategies.is_rsi_overbought, {}),
+        (RsiStrategy.is_rsi_overbought, PanelStrategies.is_rsi_overbought, {"period": 6, "overbought": 75, "duration": 3}),
+        (RsiStrategy.is_rsi_oversold, PanelStrategies.is_rsi_oversold, {}),
+        (RsiStrategy.is_rsi_oversold, PanelStrategies.is_rsi_oversold, {"period": 6, "oversold": 25, "duration": 40}),
+        (RsiStrategy.is_rsi_bullish_divergence, PanelStrategies.is_rsi_bullish_divergence, {"duration": 30}),
+        (RsiStrategy.is_rsi_bearish_divergence, PanelStrategies.is_rsi_bearish_divergence, {"period": 6, "duration": 20}),
+        (RsiStrategy.is_rsi_bearish_divergence, PanelStrategies.is_rsi_bearish_divergence, {"duration": 40, "order": 2}),
+        (MacdStrategy.is_bullish_macd_crossover, PanelStrategies.is_bullish_macd_crossover, {}),
+        (MacdStrategy.is_bullish_macd_crossover, PanelStrategies.is_bullish_macd_crossover, {"fast": 3, "slow": 10, "signal": 4, "duration": 2}),
+        (MacdStrategy.is_bearish_macd_crossover, PanelStrategies.is_bearish_macd_crossover, {}),
+        (MacdStrategy.is_bearish_macd_crossover, PanelStrategies.is_bearish_macd_crossover, {"duration": 60}),
+    ]
+)
+def test_check_RandomFrames_MatchesPerSymbolStrategy(frames, scalar, vectorized, params):
+    # Arrange
+    expected = per_symbol(scalar, frames, **params)
+
+    # Act
+    result = vectorized(Panel.from_frames(frames), **params)
+
+    # Assert
+    assert result.dtype == bool
+    assert np.array_equal(result, expected)
+    assert 0 < expected.sum() < len(expected)
+
+
+def test_is_engulfing_LastTwoBars_BullishAndBearishFound():
+    # Arrange
+    frames = {
+        "BULL": pd.DataFrame({"Open": [10.0, 8.0], "Close": [9.0, 11.0]}),
+        "BEAR": pd.DataFrame({"Open": [9.0, 11.0], "Close": [10.0, 8.0]}),
+        "NONE": pd.DataFrame({"Open": [10.0, 10.0], "Close": [11.0, 12.0]}),
+        "SHORT": pd.DataFrame({"Open": [8.0], "Close": [11.0]}),
+    }
+
+    # Act
+    result = PanelStrategies.is_engulfing(Panel.from_frames(frames))
+
+    # Assert
+    assert result.tolist() == [True, True, False, False]
+
+
+@pytest.mark.parametrize("levels,tolerance,method", [
+    (None, 0.01, "classic"), (["PP"], 0.01, "classic"), (["R1", "S1", "XX"], 0.05, "classic"),
+    (None, 0.01, "fibonacci"), (["R2", "S3"], 0.03, "camarilla"),
+])
+def test_is_last_close_near_pivotpoints_RandomFrames_MatchesPerSymbolStrategy(mocker, tmp_path, frames, levels, tolerance, method):
+    # Arrange
+    rng = np.random.default_rng(9)
+    (tmp_path / "1d").mkdir()
+    for i, (symbol, df) in enumerate(frames.items()):
+        if i % 7 == 0:
+            continue   # no daily file
+        close = df["Close"].iloc[-1] * rng.uniform(0.97, 1.03, 3)
+        pd.DataFrame({"High": close * 1.02, "Low": close * 0.98, "Close": close}).to_csv(tmp_path / "1d" / f"1d-{symbol}.csv", index=False)
+    mocker.patch("strategies.core.strategies.pivotpoints_strategy.load_config", return_value={"data": {"directory": str(tmp_path)}})
+    tagged = {symbol: df.assign(Symbol=symbol) for symbol, df in frames.items()}
+    expected = per_symbol(PivotPointsStrategy.is_last_close_near_pivotpoints, tagged, levels=levels, tolerance=tolerance, method=method)
+
+    # Act
+    result = PanelStrategies.is_last_close_near_pivotpoints(Panel.from_frames(frames), levels, tolerance, method)
+
+    # Assert
+    assert np.array_equal(result, expected)
+    assert 0 < expected.sum() < len(expected)
@@ -0,0 +1,197 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.strategies.pattern_index import PatternIndex
+from strategies.core.strategies.pattern_matrix import PatternMatrix
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_caches(mocker):
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 0}})
+    for cache in (DataFrameCache, PatternMatrix, SymbolCatalog, PatternIndex):
+        cache.clear()
+    yield
+    for cache in (DataFrameCache, PatternMatrix, SymbolCatalog, PatternIndex):
+        cache.clear()
+
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    return folder
+
+
+def write_csv(folder, symbol, bars):
+    df = pd.DataFrame({
+        "Open": np.arange(bars, dtype=float),
+        "High": np.arange(bars, dtype=float) + 1,
+        "Low": np.arange(bars, dtype=float) - 1,
+        "Close": np.arange(bars, dtype=float),
+    })
+    df.to_csv(folder / f"1d-{symbol}.csv", index=False)
+
+
+def hits_compute(hits):
+    """compute(df, pattern) putting hits[pattern] = {bars before the last: value} on the full frame."""
+    def compute(df, ptrn):
+        values = np.zeros(len(df))
+        for offset, value in hits.get(ptrn.upper(), {}).items():
+            values[len(df) - 1 - offset] = value
+        return values
+    return MagicMock(side_effect=compute)
+
+
+# ---------------------------------------------------------------------------
+# symbols()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "group,period,expected",
+    [
+        ("bullish", 1, ["AAPL"]),
+        ("bullish", 5, ["AAPL", "MSFT"]),
+        ("bearish", 3, ["TSLA"]),
+        ("all", 3, ["AAPL", "TSLA"]),
+    ]
+)
+def test_symbols_RecentHits_FilteredByGroupAndPeriod(folder, group, period, expected):
+    # Arrange
+    hits = {10: {0: 100}, 11: {4: 100}, 12: {2: -100}}   # by bar count: AAPL, MSFT, TSLA
+    for symbol, bars in (("AAPL", 10), ("MSFT", 11), ("TSLA", 12)):
+        write_csv(folder, symbol, bars)
+    compute = MagicMock(side_effect=lambda df, ptrn: hits_compute({ptrn.upper(): hits[len(df)]})(df, ptrn))
+    index = PatternIndex.get(str(folder), "1d")
+
+    # Act
+    result = index.symbols(["cdlengulfing"], group, period, compute)
+
+    # Assert
+    assert result == expected
+
+
+def test_symbols_SeveralPatternsMatch_ReturnsSymbolOnce(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 10)
+    compute = hits_compute({"CDLENGULFING": {0: 100}, "CDLHAMMER": {1: 100}})
+    index = PatternIndex.get(str(folder), "1d")
+
+    # Act
+    result = index.symbols(["cdlengulfing", "cdlhammer"], "bullish", 3, compute)
+
+    # Assert
+    assert result == ["AAPL"]
+
+
+def test_symbols_FewerBarsThanPeriod_Excluded(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 2)
+    index = PatternIndex.get(str(folder), "1d")
+
+    # Act
+    result = index.symbols(["cdlengulfing"], "bullish", 3, hits_compute({"CDLENGULFING": {0: 100}}))
+
+    # Assert
+    assert result == []
+
+
+def test_symbols_PeriodBeyondRecentBars_RaisesValueError(folder):
+    # Arrange
+    index = PatternIndex.get(str(folder), "1d")
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        index.symbols(["cdlengulfing"], "bullish", index.recent_bars + 1)
+
+
+def test_symbols_MissingColumns_Excluded(folder):
+    # Arrange
+    pd.DataFrame({"Close": [1.0, 2.0]}).to_csv(folder / "1d-AAPL.csv", index=False)
+    compute = hits_compute({"CDLENGULFING": {0: 100}})
+    index = PatternIndex.get(str(folder), "1d")
+
+    # Act
+    result = index.symbols(["cdlengulfing"], "all", 1, compute)
+
+    # Assert
+    assert result == []
+    compute.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# refresh()
+# ---------------------------------------------------------------------------
+
+def test_refresh_UnchangedFiles_NothingReread(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 10)
+    write_csv(folder, "MSFT", 10)
+    index = PatternIndex.get(str(folder), "1d")
+    compute = hits_compute({})
+    index.refresh(["CDLENGULFING"], compute)
+
+    # Act
+    changed = index.refresh(["CDLENGULFING"], compute)
+
+    # Assert
+    assert changed == 0
+    assert compute.call_count == 2
+
+
+def test_refresh_ChangedFile_OnlyThatSymbolReread(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 10)
+    write_csv(folder, "MSFT", 10)
+    index = PatternIndex.get(str(folder), "1d")
+    index.refresh(["CDLENGULFING"], hits_compute({}))
+    write_csv(folder, "MSFT", 12)
+    compute = hits_compute({"CDLENGULFING": {0: -100}})
+
+    # Act
+    changed = index.refresh(["CDLENGULFING"], compute)
+
+    # Assert
+    assert changed == 1
+    assert compute.call_count == 1
+    assert index.postings["CDLENGULFING"]["MSFT"].hits == [(0, -1)]
+    assert index.postings["CDLENGULFING"]["MSFT"].rows == 12
+
+
+def test_refresh_RemovedFile_SymbolDropped(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 10)
+    write_csv(folder, "MSFT", 10)
+    index = PatternIndex.get(str(folder), "1d")
+    index.refresh(["CDLENGULFING"], hits_compute({}))
+    os.remove(folder / "1d-MSFT.csv")
+
+    # Act
+    index.refresh(["CDLENGULFING"], hits_compute({}))
+
+    # Assert
+    assert set(index.postings["CDLENGULFING"]) == {"AAPL"}
+
+
+def test_get_PersistedIndex_ReusedByNextProcess(folder):
+    # Arrange
+    write_csv(folder, "AAPL", 10)
+    PatternIndex.get(str(folder), "1d").refresh(["CDLENGULFING"], hits_compute({"CDLENGULFING": {3: 100}}))
+    PatternIndex.clear()
+    compute = hits_compute({})
+
+    # Act
+    index = PatternIndex.get(str(folder), "1d")
+    changed = index.refresh(["CDLENGULFING"], compute)
+
+    # Assert
+    assert changed == 0
+    compute.assert_not_called()
+    assert index.postings["CDLENGULFING"]["AAPL"].hits == [(3, 1)]
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+from unittest.mock import MagicMock
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.strategies.pattern_matrix import PatternMatrix
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    DataFrameCache.clear()
+    PatternMatrix.clear()
+    yield
+    DataFrameCache.clear()
+    PatternMatrix.clear()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    rng = np.random.default_rng(7)
+    close = 100 + rng.normal(0, 1, 200).cumsum()
+    df = pd.DataFrame({
+        "Open": close + rng.normal(0, 0.5, 200),
+        "High": close + 2,
+        "Low": close - 2,
+        "Close": close,
+    })
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    file_path = folder / "1d-AAPL.csv"
+    df.to_csv(file_path, index=False)
+    return str(file_path)
+
+
+def counting_compute():
+    return MagicMock(side_effect=lambda df, ptrn: getattr(talib, ptrn.upper())(df["Open"], df["High"], df["Low"], df["Close"]))
+
+
+# ---------------------------------------------------------------------------
+# signals()
+# ---------------------------------------------------------------------------
+
+def test_signals_TaggedFrame_MatchesTalibSign(csv_file):
+    # Arrange
+    df = DataFrameCache.read_csv(csv_file)
+
+    # Act
+    signals = PatternMatrix.signals(df, ["cdlengulfing", "cdldoji"])
+
+    # Assert
+    for ptrn in ["cdlengulfing", "cdldoji"]:
+        expected = np.sign(getattr(talib, ptrn.upper())(df["Open"], df["High"], df["Low"], df["Close"]))
+        assert signals[ptrn].dtype == np.int8
+        assert np.array_equal(signals[ptrn], expected)
+
+
+def test_signals_SecondRequest_ReadsMatrix(csv_file):
+    # Arrange
+    compute = counting_compute()
+    PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"], compute)
+
+    # Act
+    PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing", "cdldoji"], compute)
+
+    # Assert
+    assert [call.args[1] for call in compute.call_args_list] == ["cdlengulfing", "cdldoji"]
+
+
+def test_signals_TailFrame_AlignedWithLastBars(csv_file):
+    # Arrange
+    full = PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"])["cdlengulfing"]
+
+    # Act
+    tail = PatternMatrix.signals(DataFrameCache.read_csv(csv_file, last_rows=30), ["cdlengulfing"])["cdlengulfing"]
+
+    # Assert
+    assert len(tail) == 30
+    assert np.array_equal(tail, full[-30:])
+
+
+def test_signals_NewProcess_LoadsPersistedMatrix(csv_file):
+    # Arrange
+    PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"])
+    PatternMatrix.clear()
+    compute = counting_compute()
+
+    # Act
+    PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"], compute)
+
+    # Assert
+    compute.assert_not_called()
+
+
+def test_signals_FileChanged_Recomputes(csv_file):
+    # Arrange
+    PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"])
+    df = pd.read_csv(csv_file)
+    df.iloc[:150].to_csv(csv_file, index=False)
+    compute = counting_compute()
+
+    # Act
+    signals = PatternMatrix.signals(DataFrameCache.read_csv(csv_file), ["cdlengulfing"], compute)
+
+    # Assert
+    compute.assert_called_once()
+    assert len(signals["cdlengulfing"]) == 150
+
+
+def test_signals_UntaggedFrameOrUnknownPattern_ComputedDirectly():
+    # Arrange
+    df = pd.DataFrame({"Open": [1.0, 2.0], "High": [2.0, 3.0], "Low": [0.0, 1.0], "Close": [1.5, 2.5]})
+    compute = MagicMock(return_value=np.array([0, -200]))
+
+    # Act
+    signals = PatternMatrix.signals(df, ["cdlengulfing", "NOTAPATTERN"], compute)
+
+    # Assert
+    assert compute.call_count == 2
+    assert signals["NOTAPATTERN"].tolist() == [0, -1]
@@ -213,3 +213,29 @@ def test_is_last_close_near_pivotpoints_ToleranceBoundary_ReturnsTrue(mocker, sa
 
     # Assert
     assert result is True
+
+@pytest.mark.parametrize("method", ["fibonacci", "camarilla"])
+def test_pivot_points_OtherMethod_ComputedFromPreviousDay(mock_config, method):
+    # Arrange
+    pd.DataFrame({"High": [10, 20], "Low": [5, 12], "Close": [7, 15]}).to_csv(mock_config / "1d" / "1d-AAPL.csv", index=False)
+
+    # Act
+    pivots = PivotPointsStrategy._pivot_points("AAPL", method)
+
+    # Assert
+    pp = (10 + 5 + 7) / 3
+    assert pivots["PP"] == pp
+    if method == "fibonacci":
+        assert pivots["R1"] == pytest.approx(pp + 0.382 * 5)
+    else:
+        assert pivots["S3"] == pytest.approx(7 - 5 * 1.1 / 4)
+
+def test_is_last_close_near_pivotpoints_SingleDailyRow_ReturnsFalse(mock_config, sample_df):
+    # Arrange
+    pd.DataFrame({"High": [110], "Low": [100], "Close": [104]}).to_csv(mock_config / "1d" / "1d-AAPL.csv", index=False)
+
+    # Act
+    result = PivotPointsStrategy.is_last_close_near_pivotpoints(sample_df)
+
+    # Assert
+    assert result is False
@@ -0,0 +1,142 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from strategies.core.data.dataframe_cache import DataFrameCache
+from strategies.core.strategies.pivot_table import PivotTable
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "1d"
+    folder.mkdir()
+    return folder
+
+
+def write_daily(folder, symbol, days, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, days).cumsum()
+    df = pd.DataFrame({
+        "Timestamp": pd.date_range("2024-01-01", periods=days, freq="D").strftime("%Y-%m-%d"),
+        "High": close + rng.uniform(0, 2, days),
+        "Low": close - rng.uniform(0, 2, days),
+        "Close": close,
+    })
+    df.to_csv(folder / f"1d-{symbol}.csv", index=False)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# compute()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "method,expected",
+    [
+        ("classic", [22 / 3, 2 * 22 / 3 - 5, 2 * 22 / 3 - 10, 22 / 3 + 5, 22 / 3 - 5, 10 + 2 * (22 / 3 - 5), 5 - 2 * (10 - 22 / 3)]),
+        ("fibonacci", [22 / 3, 22 / 3 + 1.91, 22 / 3 - 1.91, 22 / 3 + 3.09, 22 / 3 - 3.09, 22 / 3 + 5, 22 / 3 - 5]),
+        ("camarilla", [22 / 3, 7 + 5.5 / 12, 7 - 5.5 / 12, 7 + 5.5 / 6, 7 - 5.5 / 6, 7 + 5.5 / 4, 7 - 5.5 / 4]),
+    ]
+)
+def test_compute_KnownDay_ReturnsLevelsInOrder(method, expected):
+    # Act
+    levels = PivotTable.compute([10], [5], [7], method)
+
+    # Assert
+    assert levels.shape == (1, len(PivotTable.LEVELS))
+    np.testing.assert_allclose(levels[0], expected, rtol=1e-12)
+
+
+def test_compute_UnknownMethod_RaisesValueError():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        PivotTable.compute([10], [5], [7], "woodie")
+
+
+# ---------------------------------------------------------------------------
+# latest() / levels() / history()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("method", PivotTable.METHODS)
+def test_history_EveryDay_LevelsOfPreviousDay(folder, method):
+    # Arrange
+    df = write_daily(folder, "AAPL", 30)
+
+    # Act
+    history = PivotTable(str(folder)).history("AAPL", method)
+
+    # Assert
+    assert history["Timestamp"].tolist() == df["Timestamp"].tolist()
+    assert history.iloc[0][list(PivotTable.LEVELS)].isna().all()
+    expected = PivotTable.compute(df["High"], df["Low"], df["Close"], method)[:-1]
+    np.testing.assert_allclose(history[list(PivotTable.LEVELS)].to_numpy()[1:], expected, rtol=1e-12)
+
+
+def test_latest_FileMissingOrSingleDay_ReturnsNone(folder):
+    # Arrange
+    write_daily(folder, "NEW", 1)
+    table = PivotTable(str(folder))
+
+    # Act / Assert
+    assert table.latest("MISSING") is None
+    assert table.latest("NEW") is None
+
+
+def test_latest_DailyFileChanges_LevelsRebuilt(folder):
+    # Arrange
+    table = PivotTable(str(folder))
+    write_daily(folder, "AAPL", 5)
+    before = table.latest("AAPL")
+
+    # Act
+    df = write_daily(folder, "AAPL", 6, seed=1)
+    os.utime(folder / "1d-AAPL.csv", ns=(1, 1))
+    after = table.latest("AAPL")
+
+    # Assert
+    prev_day = df.iloc[-2]
+    assert after != before
+    assert after["PP"] == pytest.approx((prev_day["High"] + prev_day["Low"] + prev_day["Close"]) / 3)
+
+
+def test_latest_NewProcess_LevelsLoadedFromDisk(mocker, folder):
+    # Arrange
+    write_daily(folder, "AAPL", 10)
+    expected = PivotTable(str(folder)).latest("AAPL", "camarilla")
+    read_csv = mocker.patch.object(DataFrameCache, "read_csv")
+
+    # Act
+    result = PivotTable(str(folder)).latest("AAPL", "camarilla")
+
+    # Assert
+    assert result == expected
+    read_csv.assert_not_called()
+    assert os.path.exists(PivotTable.store_path(str(folder / "1d-AAPL.csv")))
+
+
+def test_levels_SeveralSymbols_NaNForSymbolsWithoutPivots(folder):
+    # Arrange
+    write_daily(folder, "AAPL", 10)
+    write_daily(folder, "MSFT", 10, seed=2)
+    pd.DataFrame({"High": [1, 2], "Low": [0, 1]}).to_csv(folder / "1d-BAD.csv", index=False)
+    table = PivotTable(str(folder))
+
+    # Act
+    levels = table.levels(["AAPL", "MISSING", "BAD", "MSFT"], "fibonacci")
+
+    # Assert
+    assert list(levels) == list(PivotTable.LEVELS)
+    for row, symbol in [(0, "AAPL"), (3, "MSFT")]:
+        latest = table.latest(symbol, "fibonacci")
+        assert [levels[lvl][row] for lvl in PivotTable.LEVELS] == [latest[lvl] for lvl in PivotTable.LEVELS]
+    assert np.isnan(levels["PP"][[1, 2]]).all()
+
+
+def test_get_SameFolder_ReturnsSharedTable(folder):
+    # Act / Assert
+    assert PivotTable.get(str(folder)) is PivotTable.get(str(folder) + os.sep)
+    PivotTable.clear()
@@ -98,7 +98,6 @@ def test_is_rsi_bullish_divergence_NoPivotLows_ReturnsFalse(mocker, df_base):
     # Arrange
     rsi_values = pd.Series(np.linspace(40, 60, len(df_base)))
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema", return_value=(np.array([]),))
 
     # Act
     result = RsiStrategy.is_rsi_bullish_divergence(df_base)
@@ -106,14 +105,14 @@ def test_is_rsi_bullish_divergence_NoPivotLows_ReturnsFalse(mocker, df_base):
     # Assert
     assert result is False
 
-def test_is_rsi_bullish_divergence_OnePivotLow_ReturnsFalse(mocker, df_base):
+def test_is_rsi_bullish_divergence_OnePivotLow_ReturnsFalse(mocker):
     # Arrange
-    rsi_values = pd.Series(np.linspace(40, 60, len(df_base)))
+    df = pd.DataFrame({"Close": np.r_[np.linspace(110, 100, 25), np.linspace(101, 110, 25)]})  # pivot low at 24
+    rsi_values = pd.Series(np.linspace(40, 60, len(df)))
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema", return_value=(np.array([5]),))
 
     # Act
-    result = RsiStrategy.is_rsi_bullish_divergence(df_base)
+    result = RsiStrategy.is_rsi_bullish_divergence(df, duration=len(df))
 
     # Assert
     assert result is False
@@ -126,9 +125,6 @@ def test_is_rsi_bullish_divergence_ValidDivergence_ReturnsTrue(mocker):
     rsi_values = pd.Series(np.array([40, 30, 35, 35, 38, 40]))  # RSI low1=30, low2=35 (higher)
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
 
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema",
-                 return_value=(np.array([1, 3]),))  # pivot lows
-
     # Act
     result = RsiStrategy.is_rsi_bullish_divergence(df, period=6, duration=6)
 
@@ -144,9 +140,6 @@ def test_is_rsi_bullish_divergence_NoDivergence_ReturnsFalse(mocker):
     rsi_values = np.array([40, 30, 35, 20, 25, 30])
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
 
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema",
-                 return_value=(np.array([1, 3]),))
-
     # Act
     result = RsiStrategy.is_rsi_bullish_divergence(df, duration=6)
 
@@ -167,7 +160,6 @@ def test_is_rsi_bearish_divergence_NoPivotHighs_ReturnsFalse(mocker, df_base):
     # Arrange
     rsi_values = pd.Series(np.linspace(50, 60, len(df_base)))
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema", return_value=(np.array([]),))
 
     # Act
     result = RsiStrategy.is_rsi_bearish_divergence(df_base)
@@ -175,14 +167,14 @@ def test_is_rsi_bearish_divergence_NoPivotHighs_ReturnsFalse(mocker, df_base):
     # Assert
     assert result is False
 
-def test_is_rsi_bearish_divergence_OnePivotHigh_ReturnsFalse(mocker, df_base):
+def test_is_rsi_bearish_divergence_OnePivotHigh_ReturnsFalse(mocker):
     # Arrange
-    rsi_values = pd.Series(np.linspace(50, 60, len(df_base)))
+    df = pd.DataFrame({"Close": np.r_[np.linspace(100, 110, 25), np.linspace(109, 100, 25)]})  # pivot high at 24
+    rsi_values = pd.Series(np.linspace(50, 60, len(df)))
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema", return_value=(np.array([5]),))
 
     # Act
-    result = RsiStrategy.is_rsi_bearish_divergence(df_base)
+    result = RsiStrategy.is_rsi_bearish_divergence(df, duration=len(df))
 
     # Assert
     assert result is False
@@ -195,9 +187,6 @@ def test_is_rsi_bearish_divergence_ValidDivergence_ReturnsTrue(mocker):
     rsi_values = pd.Series(np.array([60, 70, 65, 65, 62, 60]))  # RSI high1=70, high2=65 (lower)
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
 
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema",
-                 return_value=(np.array([1, 3]),))  # pivot highs
-
     # Act
     result = RsiStrategy.is_rsi_bearish_divergence(df, period=6, duration=6)
 
@@ -213,9 +202,6 @@ def test_is_rsi_bearish_divergence_NoDivergence_ReturnsFalse(mocker):
     rsi_values = np.array([60, 70, 65, 75, 74, 72])
     mocker.patch("strategies.core.strategies.rsi_strategy.ta.RSI", return_value=rsi_values)
 
-    mocker.patch("strategies.core.strategies.rsi_strategy.argrelextrema",
-                 return_value=(np.array([1, 3]),))
-
     # Act
     result = RsiStrategy.is_rsi_bearish_divergence(df, duration=6)
 
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from strategies.core.candlestick_patterns_service import CandlestickPatternsService
 from strategies.constants.candlestick_patterns import reverse_lookup
+from strategies.schemas.strategy_schema import SymbolScope
 
 
 # ---------------------------------------------------------------------
@@ -211,6 +212,50 @@ def test_get_symbols_for_pattern_and_interval_MultipleFiles_CorrectSymbolExtract
     # Assert
     assert set(result) == {"BTC", "ADA"}
 
+def test_get_symbols_for_pattern_and_interval_SeveralPatternsMatch_ReturnsSymbolOnce(
+    service, mocker, mock_config, mock_patterns
+):
+    # Arrange
+    interval = "1h"
+    folder = mock_config / interval
+    folder.mkdir()
+    pd.DataFrame({"Open": [1, 2], "High": [2, 3], "Low": [1, 2], "Close": [2, 3]}).to_csv(
+        folder / f"{interval}-BTC.csv", index=False)
+    mock_patterns.return_value = ["cdlengulfing", "cdlhammer"]
+    talib_mock = mocker.patch("strategies.core.candlestick_patterns_service.talib")
+    talib_mock.CDLENGULFING = MagicMock(return_value=np.array([0, 100]))
+    talib_mock.CDLHAMMER = MagicMock(return_value=np.array([0, 100]))
+
+    # Act
+    result = service.get_symbols_for_pattern_and_interval("bullish", "all", "all", interval, 1)
+
+    # Assert
+    assert result == ["BTC"]
+
+
+def test_get_symbols_for_pattern_and_interval_PeriodBeyondIndex_ScansFolder(
+    service, mocker, mock_config, mock_patterns
+):
+    # Arrange
+    interval = "1h"
+    folder = mock_config / interval
+    folder.mkdir()
+    bars = 60
+    pd.DataFrame({"Open": range(bars), "High": range(bars), "Low": range(bars), "Close": range(bars)}).to_csv(
+        folder / f"{interval}-BTC.csv", index=False)
+    mock_patterns.return_value = ["cdlengulfing", "cdlhammer"]
+    values = np.zeros(bars)
+    values[0] = 100
+    talib_mock = mocker.patch("strategies.core.candlestick_patterns_service.talib")
+    talib_mock.CDLENGULFING = MagicMock(return_value=values)
+    talib_mock.CDLHAMMER = MagicMock(return_value=values)
+
+    # Act
+    result = service.get_symbols_for_pattern_and_interval("bullish", "all", "all", interval, bars)
+
+    # Assert
+    assert result == ["BTC"]
+
 def test_get_candlestick_patterns_for_symbol_interval_period_NoPatterns_KeyError(service, mock_patterns):
     # Arrange
     mock_patterns.return_value = []
@@ -399,3 +444,28 @@ def test_get_candlestick_patterns_for_symbol_interval_period_MultiplePatterns_Mu
     assert len(result) == 2
     assert result == sorted(result)
     mock_logger.info.assert_called()
+
+
+@pytest.mark.parametrize("period", [1, 60])
+def test_get_symbols_for_pattern_and_interval_Scope_ReadsOnlySymbolsWithinIt(
+    service, mocker, mock_config, mock_patterns, period
+):
+    # Arrange
+    interval = "1h"
+    folder = mock_config / interval
+    folder.mkdir()
+    bars = 60
+    for symbol in ["ADA", "BTC", "ETH"]:
+        pd.DataFrame({"Open": range(bars), "High": range(bars), "Low": range(bars), "Close": range(bars)}).to_csv(
+            folder / f"{interval}-{symbol}.csv", index=False)
+    mock_patterns.return_value = ["cdlengulfing"]
+    talib_mock = mocker.patch("strategies.core.candlestick_patterns_service.talib")
+    talib_mock.CDLENGULFING = MagicMock(return_value=np.full(bars, 100))
+    scope = SymbolScope(symbols=["BTC", "ETH", "XRP"], glob="B*")
+
+    # Act
+    result = service.get_symbols_for_pattern_and_interval("bullish", "all", "all", interval, period, scope)
+
+    # Assert
+    assert result == ["BTC"]
+    assert talib_mock.CDLENGULFING.call_count == 1
@@ -118,7 +118,7 @@ def test_write_downsampling_ValidInput_WritesFilesSuccessfully(
     service = DownsamplingService()
 
     mock_read_all = mocker.patch(
-        "strategies.core.downsampling_service.FileService.read_all_csv",
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
         return_value=[sample_df]
     )
 
@@ -148,7 +148,7 @@ def test_write_downsampling_MultipleFiles_WritesEach(mocker, mock_load_config, m
     service = DownsamplingService()
 
     mock_read_all = mocker.patch(
-        "strategies.core.downsampling_service.FileService.read_all_csv",
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
         return_value=[sample_df, sample_df, sample_df]  # 3 dfs
     )
 
@@ -168,12 +168,30 @@ def test_write_downsampling_MultipleFiles_WritesEach(mocker, mock_load_config, m
     assert mock_downsample.call_count == 3
 
 
+def test_write_downsampling_AnyFileName_NamesOutputBySymbolColumn(mocker, mock_load_config, mock_logger, sample_df):
+    # Arrange
+    service = DownsamplingService()
+    mock_iter = mocker.patch(
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
+        return_value=[sample_df.assign(Symbol="MSFT")]  # e.g. read from "msft_export.csv"
+    )
+    mocker.patch.object(DownsamplingService, "downsample", side_effect=lambda df, interval: df)
+    mock_write = mocker.patch("strategies.core.downsampling_service.FileService.write")
+
+    # Act
+    service.write_downsampling("1m", "1h")
+
+    # Assert
+    mock_iter.assert_called_once_with("1m")
+    assert mock_write.call_args.args[2] == "1h-MSFT.csv"
+
+
 def test_write_downsampling_ReadFails_RaisesAndLogs(mocker, mock_load_config, mock_logger):
     # Arrange
     service = DownsamplingService()
 
     mocker.patch(
-        "strategies.core.downsampling_service.FileService.read_all_csv",
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
         side_effect=RuntimeError("read fail")
     )
 
@@ -189,7 +207,7 @@ def test_write_downsampling_DownsampleFails_RaisesAndLogs(mocker, mock_load_conf
     service = DownsamplingService()
 
     mocker.patch(
-        "strategies.core.downsampling_service.FileService.read_all_csv",
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
         return_value=[sample_df]
     )
 
@@ -211,7 +229,7 @@ def test_write_downsampling_WriteFails_RaisesAndLogs(mocker, mock_load_config, m
     service = DownsamplingService()
 
     mocker.patch(
-        "strategies.core.downsampling_service.FileService.read_all_csv",
+        "strategies.core.downsampling_service.FileService.iter_all_csv",
         return_value=[sample_df]
     )
 
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import pytest
 from strategies.core.file_service import FileService
@@ -138,12 +139,13 @@ def test_read_all_csv_ValidDirectory_ReadsAllFiles(mocker, mock_load_config, tmp
 
     mocker.patch("os.listdir", return_value=["a.csv", "b.csv"])
     mock_logger = mocker.patch("strategies.core.file_service.logger")
+    frames = {
+        os.path.join("1m", "a.csv"): pd.DataFrame({"x": [1], "y": [2]}),
+        os.path.join("1m", "b.csv"): pd.DataFrame({"x": [3], "y": [4]}),
+    }
     mock_read = mocker.patch(
         "strategies.core.file_service.FileService.read",
-        side_effect=[
-            pd.DataFrame({"x": [1], "y": [2]}),
-            pd.DataFrame({"x": [3], "y": [4]})
-        ]
+        side_effect=lambda filename: frames[filename]
     )
 
     # Act
@@ -187,6 +189,92 @@ def test_read_all_csv_ReadFailsOnOneCsv_ReraisesException(mocker, mock_load_conf
     mock_logger.exception.assert_called_once()
 
 
+def test_read_all_csv_by_symbol_IntervalFiles_ReturnsFramesBySymbol(mocker, mock_load_config, tmp_path):
+    # Arrange
+    folder = tmp_path / "1m"
+    folder.mkdir()
+    for symbol, close in [("TSLA", 2), ("AAPL", 1), ("MSFT", 3)]:
+        pd.DataFrame({"Symbol": [symbol], "Close": [close]}).to_csv(folder / f"1m-{symbol}.csv", index=False)
+    mocker.patch("strategies.core.data.dataframe_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    mock_logger = mocker.patch("strategies.core.data.bulk_loader.logger")
+
+    # Act
+    dfs = FileService.read_all_csv_by_symbol("1m", workers=2, max_in_flight=2)
+
+    # Assert
+    assert list(dfs) == ["AAPL", "MSFT", "TSLA"]
+    assert [df.iloc[0]["Close"] for df in dfs.values()] == [1, 3, 2]
+    mock_logger.info.assert_called_once()
+
+
+def test_read_all_csv_by_symbol_TwoFilesSameSymbol_RaisesValueError(mocker, mock_load_config, tmp_path):
+    # Arrange
+    folder = tmp_path / "1m"
+    folder.mkdir()
+    pd.DataFrame({"Close": [1]}).to_csv(folder / "1m-AAPL.csv", index=False)
+    pd.DataFrame({"Close": [2]}).to_csv(folder / "AAPL.csv", index=False)
+    mocker.patch("strategies.core.data.dataframe_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="symbol 'AAPL'"):
+        FileService.read_all_csv_by_symbol("1m", workers=1)
+    assert len(FileService.read_all_csv("1m")) == 2
+
+
+# ---------------------------------------------------------------------------
+# iter_csv()
+# ---------------------------------------------------------------------------
+
+def test_iter_csv_IntervalFiles_YieldsSymbolsInOrder(mocker, mock_load_config, tmp_path):
+    # Arrange
+    folder = tmp_path / "1m"
+    folder.mkdir()
+    for symbol, close in [("TSLA", 2), ("AAPL", 1)]:
+        pd.DataFrame({"Symbol": [symbol], "Close": [close]}).to_csv(folder / f"1m-{symbol}.csv", index=False)
+    (folder / "notes.csv").write_text("x\n1\n")
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+
+    # Act
+    result = [(symbol, df.iloc[0]["Close"]) for symbol, df in FileService.iter_csv("1m", prefetch=1)]
+
+    # Assert
+    assert result == [("AAPL", 1), ("TSLA", 2)]
+
+
+def test_iter_csv_DirectoryMissing_RaisesFileNotFound(mock_load_config):
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        next(FileService.iter_csv("not_exist"))
+
+
+# ---------------------------------------------------------------------------
+# iter_all_csv()
+# ---------------------------------------------------------------------------
+
+def test_iter_all_csv_AnyCsvFile_YieldsEveryFileInNameOrder(mocker, mock_load_config, tmp_path):
+    # Arrange
+    folder = tmp_path / "1m"
+    folder.mkdir()
+    for name, close in [("1m-TSLA.csv", 2), ("1m-AAPL.csv", 1), ("MSFT.csv", 3)]:
+        pd.DataFrame({"Symbol": [name], "Close": [close]}).to_csv(folder / name, index=False)
+    (folder / "notes.txt").write_text("x\n1\n")
+    mocker.patch("strategies.core.data.columnar_cache.load_config", return_value={"cache": {"columnar_sidecar": False}})
+
+    # Act
+    result = [df.iloc[0]["Close"] for df in FileService.iter_all_csv("1m", prefetch=1)]
+
+    # Assert
+    assert result == [1, 2, 3]
+
+
+def test_iter_all_csv_DirectoryMissing_RaisesFileNotFound(mock_load_config):
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        next(FileService.iter_all_csv("not_exist"))
+
+
 # ---------------------------------------------------------------------------
 # __get_directory()
 # ---------------------------------------------------------------------------
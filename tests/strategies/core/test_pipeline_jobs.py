@@ -0,0 +1,125 @@
+import threading
+import pytest
+from strategies.core.pipeline_jobs import JobQueueFullError, PipelineJob, PipelineJobs
+
+@pytest.fixture(autouse=True)
+def config(mocker):
+    config = {"jobs": {"workers": 1, "max_queued": 2, "keep_finished": 2}}
+    mocker.patch("strategies.core.pipeline_jobs.load_config", return_value=config)
+    PipelineJobs.clear()
+    yield config
+    PipelineJobs.clear()
+
+
+def blocking_run(release, started=None):
+    """A run that waits on release, scanning 10 symbols and matching the even ones."""
+    def _run(job):
+        job.total = 10
+        if started is not None:
+            started.set()
+        release.wait(5)
+        for i in range(10):
+            job.advance(1)
+            if i % 2 == 0:
+                job.add_match(f"S{i}")
+        return job.matches
+    return _run
+
+
+def test_submit_RunFinishes_DoneWithResultAndProgress():
+    # Arrange
+    release = threading.Event()
+    release.set()
+
+    # Act
+    job = PipelineJobs.submit(blocking_run(release))
+    job.future.result(5)
+
+    # Assert
+    status = job.status()
+    assert status["state"] == PipelineJob.DONE
+    assert (status["done"], status["total"], status["matches"]) == (10, 10, 5)
+    assert job.result() == ["S0", "S2", "S4", "S6", "S8"]
+
+
+def test_submit_RunRaises_FailedWithError():
+    # Arrange
+    def failing(job):
+        raise ValueError("bad step")
+
+    # Act
+    job = PipelineJobs.submit(failing)
+    job.future.result(5)
+
+    # Assert
+    assert job.state == PipelineJob.FAILED
+    assert job.error == "bad step"
+    assert job.result() is None
+
+
+def test_submit_QueueFull_RaisesJobQueueFullError():
+    # Arrange
+    release, started = threading.Event(), threading.Event()
+    PipelineJobs.submit(blocking_run(release, started))
+    started.wait(5)
+    queued = [PipelineJobs.submit(blocking_run(release)) for _ in range(2)]
+
+    # Act / Assert
+    with pytest.raises(JobQueueFullError):
+        PipelineJobs.submit(blocking_run(release))
+    assert PipelineJobs.stats()["queued"] == 2
+    release.set()
+    for job in queued:
+        job.future.result(5)
+
+
+def test_cancel_RunningJob_StopsAtNextSymbol():
+    # Arrange
+    release, started = threading.Event(), threading.Event()
+    job = PipelineJobs.submit(blocking_run(release, started))
+    started.wait(5)
+
+    # Act
+    PipelineJobs.cancel(job.id)
+    release.set()
+    job.future.result(5)
+
+    # Assert
+    assert job.state == PipelineJob.CANCELLED
+    assert job.done == 0
+    assert job.result() is None
+
+
+def test_cancel_QueuedJob_NeverStarts():
+    # Arrange
+    release, started = threading.Event(), threading.Event()
+    running = PipelineJobs.submit(blocking_run(release, started))
+    started.wait(5)
+    queued = PipelineJobs.submit(blocking_run(release))
+
+    # Act
+    PipelineJobs.cancel(queued.id)
+    release.set()
+    running.future.result(5)
+
+    # Assert
+    assert queued.state == PipelineJob.CANCELLED
+    assert queued.started_at is None
+
+
+def test_get_PastKeepFinished_OldestFinishedJobsPruned():
+    # Arrange
+    release = threading.Event()
+    release.set()
+    jobs = []
+    for _ in range(3):
+        jobs.append(PipelineJobs.submit(blocking_run(release)))
+        jobs[-1].future.result(5)
+
+    # Act
+    PipelineJobs.submit(blocking_run(release)).future.result(5)
+
+    # Assert
+    with pytest.raises(KeyError):
+        PipelineJobs.get(jobs[0].id)
+    assert PipelineJobs.get(jobs[2].id) is jobs[2]
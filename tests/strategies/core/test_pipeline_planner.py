@@ -0,0 +1,111 @@
+import pytest
+from strategies.core.pipeline_planner import PipelinePlanner
+
+class DummyItem:
+    def __init__(self, strategy, interval, params=None):
+        self.strategy = strategy
+        self.interval = interval
+        self.params = params
+
+@pytest.fixture(autouse=True)
+def planner(mocker):
+    mocker.patch("strategies.core.pipeline_planner.load_config", return_value={"pipeline": {"planner": True}})
+    PipelinePlanner.clear()
+    yield PipelinePlanner
+    PipelinePlanner.clear()
+
+
+def test_plan_NoStatistics_KeepsRequestOrder():
+    # Arrange
+    items = [DummyItem("a", "5min"), DummyItem("b", "1d"), DummyItem("c", "1h")]
+
+    # Act
+    plan = PipelinePlanner.plan(items)
+
+    # Assert
+    assert [step.item for step in plan] == items
+    assert all(step.cost is None and step.pass_rate is None for step in plan)
+
+
+def test_plan_CheapSelectiveStep_RunsFirst():
+    # Arrange
+    slow = DummyItem("is_failed_bo", "5min")
+    cheap = DummyItem("is_rsi_oversold", "1d", {"duration": 3})
+    PipelinePlanner.record(slow, 100, 50, 1.0)
+    PipelinePlanner.record(cheap, 100, 5, 0.01)
+
+    # Act
+    plan = PipelinePlanner.plan([slow, cheap])
+
+    # Assert
+    assert [step.item for step in plan] == [cheap, slow]
+    assert plan[0].cost == pytest.approx(0.0001)
+    assert plan[0].pass_rate == pytest.approx(0.05)
+
+
+def test_plan_StepsAlwaysPassing_RunLast():
+    # Arrange
+    always = DummyItem("a", "1d")
+    new = DummyItem("b", "1d")
+    PipelinePlanner.record(always, 10, 10, 0.0)
+
+    # Act
+    plan = PipelinePlanner.plan([always, new])
+
+    # Assert
+    assert [step.item for step in plan] == [new, always]
+
+
+def test_plan_SameStrategyOtherParams_EstimatedSeparately():
+    # Arrange
+    loose = DummyItem("is_rsi_oversold", "1d", {"oversold": 50})
+    strict = DummyItem("is_rsi_oversold", "1d", {"oversold": 10})
+    PipelinePlanner.record(loose, 100, 90, 0.1)
+    PipelinePlanner.record(strict, 100, 2, 0.1)
+
+    # Act
+    plan = PipelinePlanner.plan([loose, strict])
+
+    # Assert
+    assert [step.item for step in plan] == [strict, loose]
+
+
+def test_plan_Disabled_KeepsRequestOrderWithEstimates(mocker):
+    # Arrange
+    mocker.patch("strategies.core.pipeline_planner.load_config", return_value={"pipeline": {"planner": False}})
+    slow, cheap = DummyItem("a", "5min"), DummyItem("b", "1d")
+    PipelinePlanner.record(slow, 10, 9, 1.0)
+    PipelinePlanner.record(cheap, 10, 1, 0.01)
+
+    # Act
+    plan = PipelinePlanner.plan([slow, cheap])
+
+    # Assert
+    assert [step.item for step in plan] == [slow, cheap]
+    assert plan[0].pass_rate == pytest.approx(0.9)
+
+
+def test_record_PastMaxSamples_OlderRunsHalved():
+    # Arrange
+    item = DummyItem("a", "1d")
+    PipelinePlanner.record(item, PipelinePlanner.MAX_SAMPLES, PipelinePlanner.MAX_SAMPLES, 10.0)
+
+    # Act
+    PipelinePlanner.record(item, 2, 0, 0.0)
+
+    # Assert
+    stats = PipelinePlanner.stats()[PipelinePlanner.key(item)]
+    assert stats["evaluated"] == (PipelinePlanner.MAX_SAMPLES + 2) / 2
+    assert stats["passed"] == PipelinePlanner.MAX_SAMPLES / 2
+
+
+def test_describe_Plan_ListsStepsWithEstimates():
+    # Arrange
+    known, new = DummyItem("is_rsi_oversold", "1d"), DummyItem("is_failed_bo", "5min")
+    PipelinePlanner.record(known, 20, 1, 0.004)
+
+    # Act
+    text = PipelinePlanner.describe(PipelinePlanner.plan([known, new]))
+
+    # Assert
+    assert text == "1d is_rsi_oversold (0.20 ms, 5% pass) -> 5min is_failed_bo (new)"
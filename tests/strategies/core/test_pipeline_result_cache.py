@@ -0,0 +1,101 @@
+import pytest
+from strategies.core.pipeline_result_cache import PipelineResultCache
+
+class DummyItem:
+    def __init__(self, strategy, interval, params=None):
+        self.strategy = strategy
+        self.interval = interval
+        self.params = params
+
+class DummyFilter:
+    def __init__(self, interval, **conditions):
+        self.interval = interval
+        self.__dict__.update(conditions)
+
+@pytest.fixture(autouse=True)
+def config(mocker):
+    config = {"result_cache": {"ttl_seconds": 60, "max_entries": 2, "verify_versions": True}}
+    mocker.patch("strategies.core.pipeline_result_cache.load_config", return_value=config)
+    PipelineResultCache.clear()
+    yield config
+    PipelineResultCache.clear()
+
+
+def test_fingerprint_ReorderedStepsAndParams_SameKey():
+    # Arrange
+    first = [DummyItem("a", "1d", {"x": 1, "y": 2}), DummyItem("b", "1h")]
+    second = [DummyItem("b", "1h", {}), DummyItem("a", "1d", {"y": 2, "x": 1})]
+
+    # Act / Assert
+    assert PipelineResultCache.fingerprint(first) == PipelineResultCache.fingerprint(second)
+    assert PipelineResultCache.fingerprint(first) != PipelineResultCache.fingerprint([DummyItem("a", "1d", {"x": 2, "y": 2})])
+    assert PipelineResultCache.fingerprint(first) != PipelineResultCache.fingerprint(first, [DummyFilter("1d", min_bars=60)])
+
+
+def test_fingerprint_OtherDirectory_OtherKey():
+    # Arrange
+    steps = [DummyItem("a", "1d")]
+
+    # Act / Assert
+    assert PipelineResultCache.fingerprint(steps, directory="/data/a") == PipelineResultCache.fingerprint(steps, directory="/data/a")
+    assert PipelineResultCache.fingerprint(steps, directory="/data/a") != PipelineResultCache.fingerprint(steps, directory="/data/b")
+
+
+def test_get_VersionsChanged_Misses():
+    # Arrange
+    PipelineResultCache.put("k", ["AAPL"], {"1d"}, (("1d", "v1"),))
+
+    # Act / Assert
+    assert PipelineResultCache.get("k", (("1d", "v1"),)) == ["AAPL"]
+    assert PipelineResultCache.get("k", (("1d", "v2"),)) is None
+    assert PipelineResultCache.stats()["hits"] == 1
+    assert PipelineResultCache.stats()["misses"] == 1
+
+
+def test_get_VerifyVersionsOff_IgnoresVersions(config):
+    # Arrange
+    config["result_cache"]["verify_versions"] = False
+    PipelineResultCache.put("k", ["AAPL"], {"1d"})
+
+    # Act / Assert
+    assert PipelineResultCache.get("k", (("1d", "v2"),)) == ["AAPL"]
+
+
+def test_get_Expired_Misses(mocker):
+    # Arrange
+    clock = mocker.patch("strategies.core.pipeline_result_cache.time.monotonic", return_value=100.0)
+    PipelineResultCache.put("k", ["AAPL"], {"1d"})
+
+    # Act
+    clock.return_value = 161.0
+    result = PipelineResultCache.get("k")
+
+    # Assert
+    assert result is None
+    assert PipelineResultCache.stats()["entries"] == 0
+
+
+def test_put_MaxEntries_EvictsLeastRecentlyUsed():
+    # Arrange
+    PipelineResultCache.put("a", ["A"], {"1d"})
+    PipelineResultCache.put("b", ["B"], {"1d"})
+    PipelineResultCache.get("a")
+
+    # Act
+    PipelineResultCache.put("c", ["C"], {"1d"})
+
+    # Assert
+    assert PipelineResultCache.get("b") is None
+    assert PipelineResultCache.get("a") == ["A"]
+    assert PipelineResultCache.stats()["evictions"] == 1
+
+
+def test_invalidate_NoInterval_DropsAll():
+    # Arrange
+    PipelineResultCache.put("a", ["A"], {"1d", "5min"})
+    PipelineResultCache.put("b", ["B"], {"1d"})
+
+    # Act / Assert
+    assert PipelineResultCache.invalidate("5min") == 1
+    assert PipelineResultCache.invalidate() == 1
+    assert PipelineResultCache.stats()["entries"] == 0
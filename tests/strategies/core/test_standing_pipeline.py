@@ -0,0 +1,53 @@
+import pytest
+from strategies.core.standing_pipeline import StandingPipelines, StandingState
+
+@pytest.fixture(autouse=True)
+def clear_standing(mocker):
+    mocker.patch("strategies.core.standing_pipeline.load_config", return_value={"standing": {"max_pipelines": 2}})
+    StandingPipelines.clear()
+    yield
+    StandingPipelines.clear()
+
+
+def test_changed_NewAndModifiedSymbols_ReturnedInOrder():
+    # Arrange
+    state = StandingState()
+    state.update({"AAPL": ((1, 10),), "MSFT": ((1, 10),)}, ["AAPL", "MSFT"], {"AAPL"})
+
+    # Act
+    changed = state.changed({"AAPL": ((1, 10),), "MSFT": ((2, 12),), "TSLA": ((1, 10),)})
+
+    # Assert
+    assert changed == ["MSFT", "TSLA"]
+
+
+def test_update_ResultFlips_ReportsAddedAndRemoved():
+    # Arrange
+    state = StandingState()
+    versions = {"AAPL": ((1, 10),), "MSFT": ((1, 10),), "TSLA": (None,)}
+    state.update(versions, list(versions), {"AAPL", "TSLA"})
+
+    # Act
+    versions = {"AAPL": ((2, 10),), "MSFT": ((2, 10),)}
+    result = state.update(versions, ["AAPL", "MSFT"], {"MSFT"})
+
+    # Assert
+    assert result.symbols == ["MSFT"]
+    assert result.added == ["MSFT"]
+    assert result.removed == ["AAPL", "TSLA"]
+    assert result.evaluated == 2
+    assert set(state.versions) == {"AAPL", "MSFT"}
+
+
+def test_get_MaxPipelines_DropsLeastRecentlyRun():
+    # Arrange
+    first = StandingPipelines.get("a")
+    StandingPipelines.get("b")
+    StandingPipelines.get("a")
+
+    # Act
+    StandingPipelines.get("c")
+
+    # Assert
+    assert StandingPipelines.count() == 2
+    assert StandingPipelines.get("a") is first
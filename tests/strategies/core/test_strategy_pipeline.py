@@ -1,7 +1,39 @@
+import os
+import threading
+import numpy as np
 import pandas as pd
 import pytest
 from unittest.mock import MagicMock
+from strategies.core.data.symbol_catalog import SymbolCatalog
+from strategies.core.data.symbol_stats import SymbolStatsTable
+from strategies.core.data.symbol_universe import UnknownUniverseError
+from strategies.core.pipeline_jobs import PipelineJob, PipelineJobs
+from strategies.core.pipeline_planner import PipelinePlanner
+from strategies.core.pipeline_result_cache import PipelineResultCache
+from strategies.core.standing_pipeline import StandingPipelines
 from strategies.core.strategy_pipeline import StrategyPipeline
+from strategies.schemas.strategy_schema import SymbolScope
+
+@pytest.fixture(autouse=True)
+def clear_planner(mocker):
+    # tests change files between runs: stat the folders on every lookup
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 0}})
+    PipelinePlanner.clear()
+    yield
+    PipelinePlanner.clear()
+    StandingPipelines.clear()
+    StrategyPipeline.shutdown_pool()
+
+
+@pytest.fixture(autouse=True)
+def result_cache(mocker):
+    """Results are not cached unless a test sets result_cache itself."""
+    config = {"result_cache": {"ttl_seconds": 0}}
+    mocker.patch("strategies.core.pipeline_result_cache.load_config", return_value=config)
+    PipelineResultCache.clear()
+    yield config
+    PipelineResultCache.clear()
+
 
 @pytest.fixture
 def mock_config(mocker, tmp_path):
@@ -30,6 +62,11 @@ class DummyItem:
         self.interval = interval
         self.params = params
 
+class DummyFilter:
+    def __init__(self, interval, **conditions):
+        self.interval = interval
+        self.__dict__.update(conditions)
+
 def test___init___ValidDirectory_FindsSymbols(mock_config, create_csv):
     # Arrange
     create_csv("1d", "AAPL")
@@ -213,3 +250,657 @@ def test_run_pipeline_MultipleSymbols_OnlyPassingOnesIncluded(create_csv, mocker
 
     # Assert
     assert result == ["AAPL"]
+
+
+def test_load_data_StoreCurrent_ReturnsStoreFrame(create_csv, mock_config):
+    # Arrange
+    df = pd.DataFrame({
+        "Symbol": ["AAPL", "AAPL"],
+        "Interval": ["1h", "1h"],
+        "Timestamp": ["2024-01-02 09:15:00", "2024-01-02 10:15:00"],
+        "Open": [1, 2], "High": [2, 3], "Low": [0, 1], "Close": [1.5, 2.5], "Volume": [10, 20],
+    })
+    create_csv("1d", "AAPL")
+    create_csv("1h", "AAPL", df)
+    pipeline = StrategyPipeline()
+    pipeline.build_store("1h")
+
+    # Act
+    result = pipeline.load_data("AAPL", "1h")
+
+    # Assert
+    assert result["Close"].tolist() == [1.5, 2.5]
+    assert result["Timestamp"].tolist() == ["2024-01-02 09:15:00", "2024-01-02 10:15:00"]
+
+
+def test_load_data_StoreCurrentOrStale_SameFrameAsCsv(create_csv, mock_config):
+    # Arrange
+    df = pd.DataFrame({
+        "Symbol": ["AAPL", "AAPL"], "Interval": ["1h", "1h"],
+        "Timestamp": ["2024-01-02 09:15:00", "2024-01-02 10:15:00"],
+        "Open": [1.0, 2.0], "High": [2.0, 3.0], "Low": [0.0, 1.0], "Close": [1.5, 2.5], "Volume": [10.0, 20.0],
+    })
+    create_csv("1d", "AAPL")
+    file_path = create_csv("1h", "AAPL", df)
+    pipeline = StrategyPipeline()
+    pipeline.build_store("1h")
+
+    # Act
+    current = pipeline.load_data("AAPL", "1h")
+    os.utime(file_path, ns=(os.stat(file_path).st_atime_ns, os.stat(file_path).st_mtime_ns + 1_000_000_000))
+    stale = pipeline.load_data("AAPL", "1h")
+
+    # Assert
+    pd.testing.assert_frame_equal(current, df)
+    pd.testing.assert_frame_equal(stale, df)
+
+
+def test_load_data_StoreStale_FallsBackToCsv(create_csv, mock_config):
+    # Arrange
+    df = pd.DataFrame({
+        "Symbol": ["AAPL"], "Interval": ["1h"], "Timestamp": ["2024-01-02 09:15:00"],
+        "Open": [1], "High": [2], "Low": [0], "Close": [1.5], "Volume": [10],
+    })
+    create_csv("1d", "AAPL")
+    create_csv("1h", "AAPL", df)
+    pipeline = StrategyPipeline()
+    pipeline.build_store("1h")
+    create_csv("1h", "AAPL", pd.concat([df, df.assign(Close=9.5)]))
+
+    # Act
+    result = pipeline.load_data("AAPL", "1h")
+
+    # Assert
+    assert result["Close"].tolist() == [1.5, 9.5]
+
+
+def test_build_store_DirectoryMissing_RaisesFileNotFound(create_csv):
+    # Arrange
+    create_csv("1d", "AAPL")
+    pipeline = StrategyPipeline()
+
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        pipeline.build_store("1h")
+
+
+def test_lookbacks_StepsDeclareBars_ReturnsLargestPerInterval(mocker):
+    # Arrange
+    def short(df, period=2):
+        return True
+    short.lookback = lambda period: period
+
+    def full_history(df):
+        return True
+    full_history.lookback = None
+
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"short": short, "full": full_history})
+    items = [
+        DummyItem("short", "1h", {"period": 5}),
+        DummyItem("short", "1h"),
+        DummyItem("short", "1d", {"period": 3}),
+        DummyItem("full", "1d"),
+        DummyItem("unknown", "5m"),
+    ]
+
+    # Act
+    result = StrategyPipeline.lookbacks(items)
+
+    # Assert
+    assert result == {"1h": 5, "1d": None, "5m": None}
+
+
+def test_run_pipeline_StepDeclaresLookback_LoadsOnlyTail(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL", pd.DataFrame({"close": list(range(10))}))
+    pipeline = StrategyPipeline()
+    seen = []
+
+    def last_bars(df, count=3):
+        seen.append(df["close"].tolist())
+        return True
+    last_bars.lookback = lambda count: count
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"tail": last_bars})
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("tail", "1d", {"count": 4})])
+
+    # Assert
+    assert result == ["AAPL"]
+    assert seen == [[6, 7, 8, 9]]
+
+
+def test_symbols_FileAddedAfterInit_Included(create_csv):
+    # Arrange
+    create_csv("1d", "AAPL")
+    pipeline = StrategyPipeline()
+
+    # Act
+    create_csv("1d", "TSLA")
+
+    # Assert
+    assert pipeline.symbols == ["AAPL", "TSLA"]
+
+
+def test_run_pipeline_HistoryTooShort_SkipsWithoutLoading(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL", pd.DataFrame({"Close": [1.0] * 30}))
+    create_csv("1d", "TSLA", pd.DataFrame({"Close": [1.0] * 5}))
+    pipeline = StrategyPipeline()
+
+    def needs_history(df, slow=26):
+        return True
+    needs_history.min_bars = lambda slow: slow
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"slow": needs_history})
+    load_spy = mocker.spy(pipeline, "load_data")
+    stats_spy = mocker.spy(SymbolStatsTable, "get")
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("slow", "1d")])
+
+    # Assert
+    assert result == ["AAPL"]
+    assert [call.args[0] for call in load_spy.call_args_list] == ["AAPL"]
+    stats_spy.assert_not_called()
+
+
+def test_run_pipeline_Filters_SkipFailingSymbols(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL", pd.DataFrame({"Close": [100.0, 101.0], "Volume": [5000, 7000]}))
+    create_csv("1d", "PENNY", pd.DataFrame({"Close": [0.5, 0.4], "Volume": [10, 20]}))
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    filters = [DummyFilter("1d", min_avg_volume=1000), DummyFilter("1d", min_last_close=1.0)]
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1d")], filters)
+
+    # Assert
+    assert result == ["AAPL"]
+
+
+@pytest.mark.parametrize("strategy,params", [
+    ("is_rsi_oversold", {"period": 5, "oversold": 30, "duration": 3}),
+    ("is_near_lower_bb", {"period": 10, "duration": 3, "tolerance": 0.005}),
+    ("is_bullish_macd_crossover", {"fast": 3, "slow": 10, "signal": 4, "duration": 4}),
+])
+def test_run_pipeline_PanelKernel_SameSymbolsAsPerSymbolLoop(mock_config, create_csv, mocker, strategy, params):
+    # Arrange
+    rng = np.random.default_rng(1)
+    for i in range(12):
+        close = 50 + rng.normal(0, 1, 80).cumsum()
+        create_csv("1d", f"S{i:02d}", pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close}))
+    pipeline = StrategyPipeline()
+    items = [DummyItem(strategy, "1d", params)]
+    per_symbol = mocker.spy(pipeline, "load_data")
+
+    # Act
+    vectorized = pipeline.run_pipeline(items)
+    mocker.patch("strategies.core.strategy_pipeline.load_config",
+                 return_value={"data": {"directory": str(mock_config)}, "pipeline": {"panel": False}})
+    looped = pipeline.run_pipeline(items)
+
+    # Assert
+    assert vectorized == looped
+    assert 0 < len(looped) < 12
+    assert per_symbol.call_count == 24
+
+
+def test_run_pipeline_PanelKernelFails_FallsBackToPerSymbolLoop(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL", pd.DataFrame({"Close": [1.0] * 30}))
+    pipeline = StrategyPipeline()
+    scalar = MagicMock(return_value=True)
+    kernel = MagicMock(side_effect=ValueError("bad params"))
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": scalar})
+    mocker.patch.dict(StrategyPipeline.PANEL_MAP, {scalar: kernel})
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Assert
+    assert result == ["AAPL"]
+    kernel.assert_called_once()
+    scalar.assert_called_once()
+
+
+def test_run_pipeline_PlannerLearnsSelectiveStep_RunsItFirstWithSameSymbols(create_csv, mocker):
+    # Arrange
+    for i in range(10):
+        create_csv("1d", f"S{i}")
+        create_csv("1h", f"S{i}")
+    pipeline = StrategyPipeline()
+    broad = MagicMock(return_value=True)
+    selective = MagicMock(side_effect=lambda df: df.attrs.get("symbol") == "S3")
+
+    def load_data(symbol, interval, last_rows=None):
+        df = pd.DataFrame({"close": [1]})
+        df.attrs["symbol"] = symbol
+        return df
+    mocker.patch.object(pipeline, "load_data", side_effect=load_data)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"broad": broad, "selective": selective})
+    items = [DummyItem("broad", "1h"), DummyItem("selective", "1d")]
+    first = pipeline.run_pipeline(items)
+    broad.reset_mock()
+
+    # Act
+    second = pipeline.run_pipeline(items)
+
+    # Assert
+    assert first == second == ["S3"]
+    assert [step.item for step in PipelinePlanner.plan(items)] == [items[1], items[0]]
+    assert broad.call_count == 1
+
+
+def fails_on_s3(df):
+    if df["Close"].iloc[-1] == 3.0:
+        raise ValueError("bad bar")
+    return True
+
+
+def crash_worker(symbols, steps, lookbacks):
+    os._exit(1)
+
+
+@pytest.fixture
+def process_config(mocker, mock_config):
+    config = {"data": {"directory": str(mock_config)}, "pipeline": {"panel": False, "executor": "process", "workers": 2}}
+    mocker.patch("strategies.core.strategy_pipeline.load_config", return_value=config)
+    return config
+
+
+def test_run_pipeline_ProcessPool_SameSymbolsInSameOrder(mock_config, create_csv, mocker):
+    # Arrange
+    rng = np.random.default_rng(3)
+    for i in range(17):
+        close = 50 + rng.normal(0, 1, 60).cumsum()
+        create_csv("1d", f"S{i:02d}", pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close}))
+    pipeline = StrategyPipeline()
+    items = [DummyItem("is_rsi_oversold", "1d", {"period": 5, "oversold": 35, "duration": 5})]
+    mocker.patch("strategies.core.strategy_pipeline.load_config",
+                 return_value={"data": {"directory": str(mock_config)}, "pipeline": {"panel": False}})
+    serial = pipeline.run_pipeline(items)
+    mocker.patch("strategies.core.strategy_pipeline.load_config",
+                 return_value={"data": {"directory": str(mock_config)}, "pipeline": {"panel": False, "executor": "process", "workers": 2}})
+
+    # Act
+    parallel = pipeline.run_pipeline(items)
+
+    # Assert
+    assert parallel == serial
+    assert 0 < len(serial) < 17
+    assert StrategyPipeline._pool is not None
+    assert PipelinePlanner.stats()[PipelinePlanner.key(items[0])]["evaluated"] == 34
+
+
+def test_run_pipeline_ProcessPoolStepRaises_OnlyThatSymbolSkipped(process_config, create_csv, mocker):
+    # Arrange
+    for i in range(6):
+        create_csv("1d", f"S{i}", pd.DataFrame({"Close": [1.0, float(i)]}))
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": fails_on_s3})
+    pipeline = StrategyPipeline()
+    warning = mocker.patch("strategies.core.strategy_pipeline.logger.warning")
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Assert
+    assert result == ["S0", "S1", "S2", "S4", "S5"]
+    warning.assert_called_once_with("Skipping S3: bad bar")
+
+
+def test_run_pipeline_PoolWorkerDies_ChunkEvaluatedInProcess(process_config, create_csv, mocker):
+    # Arrange
+    for i in range(4):
+        create_csv("1d", f"S{i}", pd.DataFrame({"Close": [1.0, float(i)]}))
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": fails_on_s3})
+    mocker.patch("strategies.core.strategy_pipeline._evaluate_chunk", crash_worker)
+    pipeline = StrategyPipeline()
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Assert
+    assert result == ["S0", "S1", "S2"]
+    assert StrategyPipeline._pool is None
+
+
+def test_warm_up_pool_Serial_StartsNoWorkers(create_csv):
+    # Arrange
+    create_csv("1d", "AAPL")
+    pipeline = StrategyPipeline()
+
+    # Act
+    workers = pipeline.warm_up_pool()
+
+    # Assert
+    assert workers == 0
+    assert StrategyPipeline._pool is None
+
+
+def test_parallel_settings_UnknownExecutor_RaisesValueError(mocker):
+    # Arrange
+    mocker.patch("strategies.core.strategy_pipeline.load_config", return_value={"pipeline": {"executor": "gpu"}})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        StrategyPipeline.parallel_settings()
+
+
+def test_run_pipeline_SameRequestSameData_ReturnsCachedResult(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1d", "TSLA")
+    create_csv("1h", "AAPL")
+    create_csv("1h", "TSLA")
+    pipeline = StrategyPipeline()
+    mock_f = MagicMock(return_value=True)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": mock_f, "s2": mock_f})
+    pipeline.run_pipeline([DummyItem("s1", "1h", {"a": 1, "b": 2}), DummyItem("s2", "1d")])
+    mock_f.reset_mock()
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s2", "1d"), DummyItem("s1", "1h", {"b": 2, "a": 1})])
+
+    # Assert
+    assert result == ["AAPL", "TSLA"]
+    mock_f.assert_not_called()
+    assert PipelineResultCache.stats()["hits"] == 1
+
+
+
+def test_run_pipeline_CacheHitWithinCatalogPoll_DoesNotRescanFolders(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1h", "AAPL")
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    pipeline.run_pipeline([DummyItem("s1", "1h")])
+    mocker.patch("strategies.core.data.symbol_catalog.load_config", return_value={"catalog": {"refresh_seconds": 60}})
+    refresh = mocker.spy(SymbolCatalog, "refresh")
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1h")])
+
+    # Assert
+    assert result == ["AAPL"]
+    assert PipelineResultCache.stats()["hits"] == 1
+    refresh.assert_not_called()
+
+def test_run_pipeline_FileOfUsedIntervalChanged_Reevaluates(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1h", "AAPL")
+    pipeline = StrategyPipeline()
+    mock_f = MagicMock(return_value=True)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": mock_f})
+    pipeline.run_pipeline([DummyItem("s1", "1h")])
+
+    # Act
+    create_csv("1h", "AAPL", pd.DataFrame({"close": [1, 2, 3, 4]}))
+    result = pipeline.run_pipeline([DummyItem("s1", "1h")])
+
+    # Assert
+    assert result == ["AAPL"]
+    assert mock_f.call_count == 2
+
+
+def test_invalidate_results_Interval_DropsOnlyResultsReadingIt(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1h", "AAPL")
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    pipeline.run_pipeline([DummyItem("s1", "1h")])
+    pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Act
+    dropped = pipeline.invalidate_results("1h")
+
+    # Assert
+    assert dropped == 1
+    assert PipelineResultCache.stats()["entries"] == 1
+
+
+
+def test_stream_pipeline_Matches_YieldsSymbolsThenSummary(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL")
+    create_csv("1d", "TSLA")
+    create_csv("1d", "MSFT")
+    pipeline = StrategyPipeline()
+    mock_f = MagicMock(side_effect=[True, False, True])
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": mock_f})
+
+    # Act
+    records = list(pipeline.stream_pipeline([DummyItem("s1", "1d")]))
+
+    # Assert
+    assert records[:-1] == [{"symbol": "AAPL"}, {"symbol": "TSLA"}]
+    summary = records[-1]["summary"]
+    assert (summary["matches"], summary["cached"]) == (2, False)
+    assert summary["elapsed_seconds"] >= 0
+
+
+def test_stream_pipeline_SecondRun_ServedFromResultCache(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1d", "TSLA")
+    pipeline = StrategyPipeline()
+    mock_f = MagicMock(return_value=True)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": mock_f})
+    expected = pipeline.run_pipeline([DummyItem("s1", "1d")])
+    mock_f.reset_mock()
+
+    # Act
+    records = list(pipeline.stream_pipeline([DummyItem("s1", "1d")]))
+
+    # Assert
+    assert [record["symbol"] for record in records[:-1]] == expected
+    assert records[-1]["summary"]["cached"] is True
+    mock_f.assert_not_called()
+
+
+
+@pytest.fixture
+def jobs(mocker):
+    mocker.patch("strategies.core.pipeline_jobs.load_config", return_value={"jobs": {"workers": 1}})
+    PipelineJobs.clear()
+    yield PipelineJobs
+    PipelineJobs.clear()
+
+
+def test_submit_job_Finishes_ReportsProgressAndSameSymbolsAsRunPipeline(create_csv, mocker, jobs):
+    # Arrange
+    for symbol in ["AAPL", "MSFT", "TSLA"]:
+        create_csv("1d", symbol)
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(side_effect=[True, False, True] * 2)})
+    expected = pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Act
+    job = pipeline.submit_job([DummyItem("s1", "1d")])
+    job.future.result(5)
+
+    # Assert
+    status = pipeline.job(job.id).status()
+    assert status["state"] == PipelineJob.DONE
+    assert (status["done"], status["total"], status["matches"]) == (3, 3, 2)
+    assert job.result() == expected
+
+
+def test_submit_job_CancelledMidScan_StopsBeforeRemainingSymbols(create_csv, mocker, jobs):
+    # Arrange
+    for symbol in ["AAPL", "MSFT", "TSLA"]:
+        create_csv("1d", symbol)
+    pipeline = StrategyPipeline()
+    submitted = threading.Event()
+    holder = {}
+
+    def cancel_on_first_symbol(df):
+        submitted.wait(5)
+        pipeline.cancel_job(holder["job"].id)
+        return True
+
+    step = MagicMock(side_effect=cancel_on_first_symbol)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": step})
+
+    # Act
+    holder["job"] = job = pipeline.submit_job([DummyItem("s1", "1d")])
+    submitted.set()
+    job.future.result(5)
+
+    # Assert
+    assert job.state == PipelineJob.CANCELLED
+    assert step.call_count == 1
+    assert job.result() is None
+
+
+
+def test_run_pipeline_Scope_LoadsOnlySymbolsWithinIt(create_csv, mocker):
+    # Arrange
+    for symbol in ["AAPL", "AMD", "MSFT", "TSLA"]:
+        create_csv("1d", symbol)
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    load_data = mocker.spy(pipeline, "load_data")
+
+    # Act
+    result = pipeline.run_pipeline([DummyItem("s1", "1d")], scope=SymbolScope(symbols=["TSLA", "AMD", "AAPL"], glob="A*"))
+
+    # Assert
+    assert result == ["AAPL", "AMD"]
+    assert sorted(call.args[0] for call in load_data.call_args_list) == ["AAPL", "AMD"]
+
+
+def test_stream_pipeline_UnknownUniverse_RaisesBeforeFirstRecord(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL")
+    pipeline = StrategyPipeline()
+    mocker.patch("strategies.core.data.symbol_universe.load_config", return_value={"universes": {}})
+
+    # Act / Assert
+    with pytest.raises(UnknownUniverseError):
+        pipeline.stream_pipeline([DummyItem("s1", "1d")], scope=SymbolScope(universe="missing"))
+
+
+def test_run_pipeline_ScopedAndUnscoped_CachedSeparately(create_csv, mocker, result_cache):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60}
+    create_csv("1d", "AAPL")
+    create_csv("1d", "TSLA")
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    scoped = pipeline.run_pipeline([DummyItem("s1", "1d")], scope=SymbolScope(symbols=["TSLA"]))
+
+    # Act
+    unscoped = pipeline.run_pipeline([DummyItem("s1", "1d")])
+
+    # Assert
+    assert (scoped, unscoped) == (["TSLA"], ["AAPL", "TSLA"])
+    assert PipelineResultCache.stats()["entries"] == 2
+
+
+def test_run_pipeline_OtherDataDirectory_NotServedFromCache(create_csv, mocker, result_cache, tmp_path):
+    # Arrange
+    result_cache["result_cache"] = {"ttl_seconds": 60, "verify_versions": False}
+    create_csv("1d", "AAPL")
+    other = tmp_path / "other"
+    (other / "1d").mkdir(parents=True)
+    pd.DataFrame({"close": [1, 2, 3]}).to_csv(other / "1d" / "1d-TSLA.csv", index=False)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    first = StrategyPipeline().run_pipeline([DummyItem("s1", "1d")])
+
+    # Act
+    second = StrategyPipeline(directory=str(other)).run_pipeline([DummyItem("s1", "1d")])
+
+    # Assert
+    assert (first, second) == (["AAPL"], ["TSLA"])
+    assert PipelineResultCache.stats()["entries"] == 2
+
+
+def test_run_standing_SymbolLeavesScope_ReportedRemoved(create_csv, mocker):
+    # Arrange
+    create_csv("1d", "AAPL")
+    create_csv("1d", "TSLA")
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": MagicMock(return_value=True)})
+    pipeline.run_standing([DummyItem("s1", "1d")], scope=SymbolScope(glob="*A*"))
+
+    # Act
+    create_csv("1d", "AMZN")
+    result = pipeline.run_standing([DummyItem("s1", "1d")], scope=SymbolScope(glob="*A*"))
+
+    # Assert
+    assert result.symbols == ["AAPL", "AMZN", "TSLA"]
+    assert (result.added, result.evaluated) == (["AMZN"], 1)
+
+
+def last_close_above_two(df):
+    return df["Close"].iloc[-1] > 2
+
+
+def test_run_standing_FirstRun_EvaluatesAllAndAddsMatches(create_csv, mocker):
+    # Arrange
+    for symbol, close in [("AAPL", 3.0), ("MSFT", 1.0), ("TSLA", 5.0)]:
+        create_csv("1d", symbol, pd.DataFrame({"Close": [1.0, close]}))
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": last_close_above_two})
+
+    # Act
+    result = pipeline.run_standing([DummyItem("s1", "1d")])
+
+    # Assert
+    assert result.symbols == ["AAPL", "TSLA"]
+    assert result.added == ["AAPL", "TSLA"]
+    assert result.removed == []
+    assert result.evaluated == 3
+
+
+def test_run_standing_OneFileChanged_ReevaluatesOnlyItAndReturnsDelta(create_csv, mocker):
+    # Arrange
+    for symbol, close in [("AAPL", 3.0), ("MSFT", 1.0), ("TSLA", 5.0)]:
+        create_csv("1d", symbol, pd.DataFrame({"Close": [1.0, close]}))
+        create_csv("1h", symbol, pd.DataFrame({"Close": [1.0, close]}))
+    pipeline = StrategyPipeline()
+    spy = MagicMock(side_effect=last_close_above_two)
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": spy})
+    items = [DummyItem("s1", "1h")]
+    pipeline.run_standing(items)
+    spy.reset_mock()
+
+    # Act
+    create_csv("1h", "AAPL", pd.DataFrame({"Close": [1.0, 3.0, 0.5]}))
+    create_csv("1h", "MSFT", pd.DataFrame({"Close": [1.0, 1.0, 4.0]}))
+    changed = pipeline.run_standing(items)
+    unchanged = pipeline.run_standing(items)
+
+    # Assert
+    assert changed.symbols == ["MSFT", "TSLA"]
+    assert (changed.added, changed.removed, changed.evaluated) == (["MSFT"], ["AAPL"], 2)
+    assert spy.call_count == 2
+    assert unchanged.symbols == ["MSFT", "TSLA"]
+    assert (unchanged.added, unchanged.removed, unchanged.evaluated) == ([], [], 0)
+
+
+def test_run_standing_SymbolFileRemoved_DroppedFromMatches(create_csv, mocker):
+    # Arrange
+    aapl = create_csv("1d", "AAPL", pd.DataFrame({"Close": [1.0, 3.0]}))
+    create_csv("1d", "TSLA", pd.DataFrame({"Close": [1.0, 5.0]}))
+    pipeline = StrategyPipeline()
+    mocker.patch.dict(StrategyPipeline.STRATEGY_MAP, {"s1": last_close_above_two})
+    pipeline.run_standing([DummyItem("s1", "1d")])
+
+    # Act
+    os.remove(aapl)
+    result = pipeline.run_standing([DummyItem("s1", "1d")])
+
+    # Assert
+    assert result.symbols == ["TSLA"]
+    assert result.removed == ["AAPL"]
+    assert result.evaluated == 0